@@ -0,0 +1,279 @@
+"""
+Benchmarks the playback control plane offline, with the fakes of benchmarks/fakes.py
+standing in for Discord, FFmpeg and yt-dlp (see install()). It measures:
+  - /play time-to-first-audio (command start to the first frame read by the voice client),
+  - the track-switch gap (end of a track to the next play(), after_playing + play_audio),
+    with a prefetched stream URL and with a stream URL refresh through the extractor,
+  - create_controller_embed render time vs queue size,
+  - /shuffle, /skip N and /remove (open + apply) cost vs queue size,
+  - save_all_states / load_states_on_startup time vs guild count,
+  - event-loop lag and voice frame lateness while N guilds play at once.
+
+The real command coroutines run unmodified; only I/O is faked. Needs discord.py and the
+other requirements installed, but no token and no network. Prints a JSON report on stdout,
+so runs on two commits can be diffed.
+
+    python benchmarks/bench_control_plane.py [--latency SECONDS] [--quick]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fakes import OFFLINE_ENV, FakeInteraction, FakePCMSource, install  # noqa: E402
+
+os.environ.update(OFFLINE_ENV)
+
+import playify  # noqa: E402
+
+
+def summarize(samples: list) -> dict:
+    """Count, mean and percentiles of samples given in seconds, reported in milliseconds."""
+    if not samples:
+        return {"count": 0}
+    ordered = sorted(samples)
+
+    def percentile(fraction: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] * 1000, 3)
+
+    return {
+        "count": len(ordered),
+        "mean_ms": round(statistics.mean(ordered) * 1000, 3),
+        "p50_ms": percentile(0.5),
+        "p95_ms": percentile(0.95),
+        "p99_ms": percentile(0.99),
+        "max_ms": round(ordered[-1] * 1000, 3),
+    }
+
+
+def make_tracks(extractor, count: int, prefix: str = "track", prefetched: bool = True) -> list:
+    """Queue items as /play creates them, with their duration known (no hydration needed)."""
+    tracks = []
+    for index in range(count):
+        info = extractor.track_info(f"{prefix}-{index}")
+        item = {"url": info["webpage_url"], "title": info["title"], "webpage_url": info["webpage_url"], "thumbnail": info["thumbnail"], "duration": info["duration"]}
+        if prefetched:
+            item.update(stream_url=info["url"], stream_url_fetched_at=time.time())
+        tracks.append(item)
+    return tracks
+
+
+async def connect_guild(fake_discord, tracks: list = ()):
+    """A guild whose player is connected (not playing) with `tracks` queued, as after a /play."""
+    guild = fake_discord.create_guild()
+    state = playify.get_guild_state(guild.id)
+    state.controller_channel_id = guild.text_channel.id
+    player = state.music_player
+    player.voice_client = await guild.voice_channel.connect()
+    player.text_channel = guild.text_channel
+    for track in tracks:
+        player.queue.put_nowait(track)
+    return guild, player
+
+
+async def start_dummy_track(guild):
+    """Starts an endless track outside play_audio, so commands see a playing voice client."""
+    await playify.ffmpeg_supervisor.acquire(guild.id)
+    source = FakePCMSource("dummy", guild_id=guild.id)
+    source.remaining = float("inf")
+    guild.voice_client.play(source)
+
+
+async def wait_until(predicate, timeout: float) -> bool:
+    deadline = time.perf_counter() + timeout
+    while not predicate():
+        if time.perf_counter() > deadline:
+            return False
+        await asyncio.sleep(0.005)
+    return True
+
+
+async def reset(fake_discord):
+    """Disconnects every fake guild and forgets all bot state between scenarios."""
+    for guild in list(fake_discord.guilds.values()):
+        if guild.voice_client:
+            await guild.voice_client.disconnect()
+    fake_discord.guilds.clear()
+    playify.guild_states.clear()
+    await asyncio.sleep(0.05)
+
+
+async def bench_time_to_first_audio(fake_discord, runs: int) -> dict:
+    command, first_audio = [], []
+    for index in range(runs):
+        guild = fake_discord.create_guild()
+        started = time.perf_counter()
+        await playify.play.callback(FakeInteraction(guild), f"benchmark song {index}")
+        command.append(time.perf_counter() - started)
+        if guild.voice_client:
+            first_frame_at = await guild.voice_client.wait_for_first_frame()
+            if first_frame_at:
+                first_audio.append(first_frame_at - started)
+    await reset(fake_discord)
+    return {"command": summarize(command), "first_audio": summarize(first_audio)}
+
+
+async def bench_track_switch_gap(fake_discord, extractor, tracks: int, prefetched: bool) -> dict:
+    frames = FakePCMSource.frames
+    FakePCMSource.frames = 5  # 100ms tracks
+    try:
+        guild, player = await connect_guild(fake_discord, make_tracks(extractor, tracks, prefix=f"switch-{prefetched}", prefetched=prefetched))
+        await playify.play_audio(guild.id)
+        vc = guild.voice_client
+        await wait_until(lambda: len(vc.switch_gaps) >= tracks - 1, timeout=30 + tracks * (1 + extractor.latency))
+        gaps = list(vc.switch_gaps)
+    finally:
+        FakePCMSource.frames = frames
+    await reset(fake_discord)
+    return summarize(gaps)
+
+
+async def bench_controller_render(fake_discord, extractor, sizes: list, iterations: int) -> dict:
+    results = {}
+    for size in sizes:
+        guild, player = await connect_guild(fake_discord, make_tracks(extractor, size))
+        player.current_info = make_tracks(extractor, 1, prefix="current")[0]
+        samples = []
+        for _ in range(iterations):
+            started = time.perf_counter()
+            await playify.create_controller_embed(playify.bot, guild.id)
+            samples.append(time.perf_counter() - started)
+        results[str(size)] = summarize(samples)
+        await reset(fake_discord)
+    return results
+
+
+async def bench_queue_commands(fake_discord, extractor, sizes: list, iterations: int) -> dict:
+    results = {}
+    for size in sizes:
+        tracks = make_tracks(extractor, size)
+        guild, player = await connect_guild(fake_discord)
+        player.current_info = make_tracks(extractor, 1, prefix="current")[0]
+        samples = {"shuffle": [], "skip_n": [], "remove_open": [], "remove_apply": []}
+
+        def refill():
+            player.queue = asyncio.Queue()
+            for track in tracks:
+                player.queue.put_nowait(dict(track))
+
+        for _ in range(iterations):
+            refill()
+            started = time.perf_counter()
+            await playify.shuffle.callback(FakeInteraction(guild))
+            samples["shuffle"].append(time.perf_counter() - started)
+
+            refill()
+            await start_dummy_track(guild)
+            started = time.perf_counter()
+            await playify.skip.callback(FakeInteraction(guild), number=max(1, size // 2))
+            samples["skip_n"].append(time.perf_counter() - started)
+            player.manual_stop = False
+
+            refill()
+            started = time.perf_counter()
+            await playify.remove.callback(FakeInteraction(guild))
+            samples["remove_open"].append(time.perf_counter() - started)
+
+            view = guild.text_channel.messages[guild.text_channel.last_message_id].view
+            select = next(item for item in view.children if isinstance(item, playify.RemoveSelect))
+            select._values = [option.value for option in select.options]
+            started = time.perf_counter()
+            await select.callback(FakeInteraction(guild, message=view.message))
+            samples["remove_apply"].append(time.perf_counter() - started)
+            view.stop()
+
+        results[str(size)] = {name: summarize(values) for name, values in samples.items()}
+        await reset(fake_discord)
+    return results
+
+
+async def bench_persistence(fake_discord, extractor, guild_counts: list, queue_size: int) -> dict:
+    results = {}
+    tracks = make_tracks(extractor, queue_size, prefetched=False)
+    for count in guild_counts:
+        for _ in range(count):
+            guild, player = await connect_guild(fake_discord, tracks)
+            player.current_info = dict(tracks[0])
+            player.history = [dict(track) for track in tracks[:20]]
+
+        started = time.perf_counter()
+        await playify.save_all_states()
+        save_time = time.perf_counter() - started
+
+        # Keep the fake guilds (load looks them up) but start from an empty bot state.
+        for guild in fake_discord.guilds.values():
+            await guild.voice_client.disconnect()
+        playify.guild_states.clear()
+
+        started = time.perf_counter()
+        await playify.load_states_on_startup()
+        load_time = time.perf_counter() - started
+
+        results[str(count)] = {"save_ms": round(save_time * 1000, 3), "load_ms": round(load_time * 1000, 3), "restored_guilds": len(playify.guild_states)}
+        await reset(fake_discord)
+    return results
+
+
+async def measure_loop_lag(duration: float, interval: float = 0.01) -> list:
+    """How late the loop wakes up a task sleeping `interval` seconds, sampled for `duration`."""
+    samples = []
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        samples.append(max(0.0, time.perf_counter() - started - interval))
+    return samples
+
+
+async def bench_loop_lag(fake_discord, extractor, guild_counts: list, duration: float) -> dict:
+    results = {}
+    for count in guild_counts:
+        guilds = []
+        for index in range(count):
+            guild, player = await connect_guild(fake_discord, make_tracks(extractor, 3, prefix=f"lag-{count}-{index}"))
+            guilds.append(guild)
+            playify.bot.loop.create_task(playify.play_audio(guild.id))
+        await wait_until(lambda: all(guild.voice_client.first_frame_at for guild in guilds), timeout=30)
+
+        lag = await measure_loop_lag(duration)
+        lateness = [value for guild in guilds for value in guild.voice_client.frame_lateness]
+        results[str(count)] = {"loop_lag": summarize(lag), "frame_lateness": summarize(lateness)}
+        await reset(fake_discord)
+    return results
+
+
+async def main(latency: float, quick: bool) -> dict:
+    logging.disable(logging.INFO)
+    fake_discord, extractor = install(playify, latency=latency, track_seconds=600)
+
+    queue_sizes = [10, 100, 1000] if quick else [10, 100, 1000, 10000]
+    iterations = 3 if quick else 10
+    report = {
+        "extractor_latency_s": latency,
+        "time_to_first_audio": await bench_time_to_first_audio(fake_discord, runs=5 if quick else 20),
+        "track_switch_gap": {
+            "prefetched": await bench_track_switch_gap(fake_discord, extractor, tracks=10 if quick else 30, prefetched=True),
+            "refresh": await bench_track_switch_gap(fake_discord, extractor, tracks=10 if quick else 30, prefetched=False),
+        },
+        "controller_render": await bench_controller_render(fake_discord, extractor, queue_sizes, iterations),
+        "queue_commands": await bench_queue_commands(fake_discord, extractor, queue_sizes, iterations),
+        "persistence": await bench_persistence(fake_discord, extractor, [10, 100] if quick else [10, 100, 1000], queue_size=50),
+        "loop_lag": await bench_loop_lag(fake_discord, extractor, [1, 10] if quick else [1, 10, 50], duration=2 if quick else 5),
+        "extractor_calls": extractor.calls,
+    }
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Offline benchmarks of the playback control plane.")
+    parser.add_argument("--latency", type=float, default=0.05, help="Simulated extraction latency in seconds (default: 0.05)")
+    parser.add_argument("--quick", action="store_true", help="Fewer sizes and iterations")
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(main(args.latency, args.quick)), indent=2))
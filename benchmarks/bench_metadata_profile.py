@@ -0,0 +1,86 @@
+"""
+Compares the cost of display hydration against a playback extraction.
+
+For every URL it times:
+  - a full playback extraction (ydl_worker + PLAYBACK_YDL_OPTS), what fetch_meta used to do,
+  - a metadata-profile extraction (ydl_batch_worker with the metadata profile),
+  - an oEmbed lookup, when the platform offers one,
+and finally one batched metadata call for all URLs together.
+
+Requires network access. Prints a JSON report on stdout.
+
+    python benchmarks/bench_metadata_profile.py [url ...]
+"""
+
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import playify  # noqa: E402
+
+DEFAULT_URLS = [
+    "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+    "https://www.youtube.com/watch?v=kJQP7kiw5Fk",
+    "https://youtu.be/9bZkp7q19f0",
+    "https://soundcloud.com/forss/flickermood",
+]
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def summarize(samples: list) -> dict:
+    if not samples:
+        return {"count": 0}
+    return {
+        "count": len(samples),
+        "mean_s": round(statistics.mean(samples), 4),
+        "median_s": round(statistics.median(samples), 4),
+        "max_s": round(max(samples), 4),
+    }
+
+
+def main(urls: list) -> dict:
+    playback, metadata, oembed = [], [], []
+
+    for url in urls:
+        elapsed, result = timed(playify.ydl_worker, dict(playify.PLAYBACK_YDL_OPTS), url)
+        if result.get("status") == "success":
+            playback.append(elapsed)
+
+        elapsed, results = timed(playify.ydl_batch_worker, "metadata", [url])
+        if results[0].get("status") == "success":
+            metadata.append(elapsed)
+
+        if playify.get_oembed_endpoint(url):
+            elapsed, meta = timed(playify.fetch_oembed_meta, url)
+            if meta:
+                oembed.append(elapsed)
+
+    batch_elapsed, batch_results = timed(playify.ydl_batch_worker, "metadata", urls)
+
+    report = {
+        "urls": len(urls),
+        "playback_profile": summarize(playback),
+        "metadata_profile": summarize(metadata),
+        "oembed": summarize(oembed),
+        "metadata_batch": {
+            "total_s": round(batch_elapsed, 4),
+            "per_url_s": round(batch_elapsed / len(urls), 4),
+            "succeeded": sum(1 for r in batch_results if r.get("status") == "success"),
+        },
+    }
+    if playback and metadata:
+        report["metadata_vs_playback_ratio"] = round(statistics.mean(metadata) / statistics.mean(playback), 3)
+    return report
+
+
+if __name__ == "__main__":
+    print(json.dumps(main(sys.argv[1:] or DEFAULT_URLS), indent=2))
@@ -0,0 +1,115 @@
+"""
+Compares URL classification costs.
+
+Times, over a realistic corpus of /play queries and queue URLs (YouTube variants, SoundCloud,
+Bandcamp, Twitch, Spotify, Deezer, direct files and plain searches):
+  - the previous approach: per-call re.compile of the /play and /playnext patterns, plus
+    urlparse/parse_qs for the video id,
+  - url_classifier.classify on a cold cache (every URL parsed once),
+  - url_classifier.classify on a warm cache (what repeated queue/autoplay lookups pay).
+
+No network needed. Prints a JSON report on stdout.
+
+    python benchmarks/bench_url_classifier.py [rounds]
+"""
+
+import json
+import os
+import random
+import re
+import sys
+import time
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import url_classifier  # noqa: E402
+
+CORPUS_TEMPLATES = [
+    "https://www.youtube.com/watch?v={yt}",
+    "https://youtu.be/{yt}",
+    "https://www.youtube.com/watch?v={yt}&list=RD{yt}&index=3",
+    "https://music.youtube.com/watch?v={yt}&feature=share",
+    "https://m.youtube.com/watch?v={yt}",
+    "https://www.youtube.com/shorts/{yt}",
+    "https://www.youtube.com/playlist?list=PL{n}",
+    "https://soundcloud.com/artist-{n}/track-{n}",
+    "https://soundcloud.com/artist-{n}/sets/playlist-{n}",
+    "https://artist{n}.bandcamp.com/track/song-{n}",
+    "https://www.twitch.tv/channel{n}",
+    "https://open.spotify.com/track/{sp}",
+    "https://open.spotify.com/intl-fr/playlist/{sp}",
+    "https://www.deezer.com/fr/track/{n}",
+    "https://link.deezer.com/s/{sp}",
+    "https://cdn.example.com/audio/{n}.mp3?token=abc",
+    "never gonna give you up {n}",
+    "daft punk around the world",
+]
+
+
+def random_youtube_id() -> str:
+    alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_-"
+    return "".join(random.choice(alphabet) for _ in range(11))
+
+
+def build_corpus(size: int) -> list:
+    corpus = []
+    for index in range(size):
+        template = random.choice(CORPUS_TEMPLATES)
+        corpus.append(template.format(yt=random_youtube_id(), n=index, sp=f"{index:022d}"))
+    return corpus
+
+
+def legacy_classify(url: str):
+    """What /play, /playnext and get_video_id did before url_classifier."""
+    spotify_regex = re.compile(r"^(https?://)?(open\.spotify\.com)/.+$")
+    deezer_regex = re.compile(r"^(https?://)?((www\.)?deezer\.com/(?:[a-z]{2}/)?(track|playlist|album|artist)/.+|(link\.deezer\.com)/s/.+)$")
+    direct_platform_regex = re.compile(r"^(https?://)?((www|m)\.)?(youtube\.com|youtu\.be|music\.youtube\.com|soundcloud\.com|twitch\.tv)|([^\.]+)\.bandcamp\.com/.+$")
+    direct_link_regex = re.compile(r"^(https?://).+\.(mp3|wav|ogg|m4a|mp4|webm|flac)(\?.+)?$", re.IGNORECASE)
+    is_conversion = bool(spotify_regex.match(url) or deezer_regex.match(url))
+    is_direct = bool(direct_platform_regex.match(url) or direct_link_regex.match(url))
+    parsed = urlparse(url)
+    video_id = None
+    if parsed.hostname in ("youtube.com", "www.youtube.com", "youtu.be"):
+        if parsed.hostname == "youtu.be":
+            video_id = parsed.path[1:]
+        elif parsed.path == "/watch":
+            video_id = parse_qs(parsed.query).get("v", [None])[0]
+    return is_conversion, is_direct, video_id
+
+
+def calls_per_second(function, corpus: list, rounds: int) -> int:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for url in corpus:
+            function(url)
+    return round(rounds * len(corpus) / (time.perf_counter() - start))
+
+
+def main(rounds: int) -> dict:
+    random.seed(0)
+    corpus = build_corpus(2000)
+
+    url_classifier.classify.cache_clear()
+    cold = calls_per_second(url_classifier.classify, corpus, 1)
+
+    return {
+        "corpus_size": len(corpus),
+        "rounds": rounds,
+        "legacy_calls_per_second": calls_per_second(legacy_classify, corpus, rounds),
+        "classify_cold_calls_per_second": cold,
+        "classify_warm_calls_per_second": calls_per_second(url_classifier.classify, corpus, rounds),
+        "platforms": {platform or "search": count for platform, count in _platform_counts(corpus).items()},
+    }
+
+
+def _platform_counts(corpus: list) -> dict:
+    counts = {}
+    for url in corpus:
+        platform = url_classifier.classify(url).platform
+        counts[platform] = counts.get(platform, 0) + 1
+    return counts
+
+
+if __name__ == "__main__":
+    print(json.dumps(main(int(sys.argv[1]) if len(sys.argv) > 1 else 20), indent=2))
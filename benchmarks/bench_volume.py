@@ -0,0 +1,95 @@
+"""
+Compares the per-frame cost of volume scaling.
+
+Times, on a single thread (i.e. one core), how many 20ms PCM frames per second go through:
+  - discord.PCMVolumeTransformer (audioop.mul), what every guild used before,
+  - VolumeSource at unity gain (pass-through),
+  - VolumeSource at a constant gain,
+  - VolumeSource while the gain changes on every frame (ramped).
+
+Before timing, check_volume_source() compares VolumeSource's output at a constant gain
+and across a ramp with a plain per-sample reference, and aborts on any mismatch.
+
+No network needed. Prints a JSON report on stdout.
+
+    python benchmarks/bench_volume.py [frames]
+"""
+
+import json
+import os
+import random
+import struct
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import discord  # noqa: E402
+
+import playify  # noqa: E402
+
+FRAME_SIZE = 3840  # 20ms of 48kHz 16-bit stereo
+
+
+class StaticPCMSource(discord.AudioSource):
+    """Returns the same random PCM frame forever."""
+
+    def __init__(self):
+        self.frame = bytes(random.getrandbits(8) for _ in range(FRAME_SIZE))
+
+    def is_opus(self) -> bool:
+        return False
+
+    def read(self) -> bytes:
+        return self.frame
+
+
+def check_volume_source():
+    """Fails loudly if VolumeSource's scaled frames differ from a per-sample reference."""
+    original = StaticPCMSource()
+    count = FRAME_SIZE // 2
+    samples = struct.unpack(f"<{count}h", original.frame)
+
+    def expected(gains) -> bytes:
+        return struct.pack(f"<{count}h", *(int(max(-32768, min(32767, sample * gain))) for sample, gain in zip(samples, gains)))
+
+    source = playify.VolumeSource(original, volume=1.0)
+    assert source.read() == original.frame, "unity gain must pass frames through"
+    source.volume = 0.8
+    # First frame after a change: ramps 1.0 -> 0.8 across the frame (same gain for both channels).
+    ramp = [1.0 + (0.8 - 1.0) * (index // 2) / (count // 2 - 1) for index in range(count)]
+    for actual, wanted in zip(struct.unpack(f"<{count}h", source.read()), struct.unpack(f"<{count}h", expected(ramp))):
+        assert abs(actual - wanted) <= 1, "ramped frame differs from the reference"
+    for actual, wanted in zip(struct.unpack(f"<{count}h", source.read()), struct.unpack(f"<{count}h", expected([0.8] * count))):
+        assert abs(actual - wanted) <= 1, "constant-gain frame differs from the reference"
+    source.volume = 2.0
+    source.read()
+    assert len(source.read()) == FRAME_SIZE, "clipped frame has the wrong size"
+
+
+def frames_per_second(source, frames: int, change_volume: bool = False) -> float:
+    start = time.perf_counter()
+    for index in range(frames):
+        if change_volume:
+            source.volume = 0.5 if index % 2 else 0.8
+        source.read()
+    return round(frames / (time.perf_counter() - start))
+
+
+def main(frames: int) -> dict:
+    check_volume_source()
+    report = {
+        "frames": frames,
+        "numpy": playify.np is not None,
+        "pcm_volume_transformer": frames_per_second(discord.PCMVolumeTransformer(StaticPCMSource(), volume=0.5), frames),
+        "volume_source_unity": frames_per_second(playify.VolumeSource(StaticPCMSource(), volume=1.0), frames),
+        "volume_source_constant": frames_per_second(playify.VolumeSource(StaticPCMSource(), volume=0.5), frames),
+        "volume_source_ramped": frames_per_second(playify.VolumeSource(StaticPCMSource(), volume=0.5), frames, change_volume=True),
+    }
+    # One playing guild consumes 50 frames per second.
+    report["guilds_per_core"] = {key: value // 50 for key, value in report.items() if key.startswith(("pcm_", "volume_"))}
+    return report
+
+
+if __name__ == "__main__":
+    print(json.dumps(main(int(sys.argv[1]) if len(sys.argv) > 1 else 50000), indent=2))
@@ -0,0 +1,489 @@
+"""
+Offline stand-ins for Discord, FFmpeg and yt-dlp, shared by the control-plane benchmarks.
+
+install(playify, ...) patches the imported bot module so that the real command coroutines,
+play_audio, the controller and state persistence run without a gateway, a voice server,
+FFmpeg or the network:
+  - FakeVoiceClient plays sources on its own thread, like discord.py's AudioPlayer
+    (one 20ms frame per tick), and records frame timings and track-switch gaps,
+  - FakePCMSource replaces the FFmpeg source with a fixed number of silent PCM frames,
+  - FakeExtractor answers ydl_worker/extract_item with canned info dicts after a configurable
+    latency, optionally pointing at real audio files (see load_test.py),
+  - FakeGuild/FakeInteraction provide just enough of the discord.py objects the commands touch.
+
+Set OFFLINE_ENV in os.environ before importing playify: it keeps the audio cache, loudness
+analysis (both spawn FFmpeg) and the shared SQLite cache out of the measurements.
+"""
+
+import asyncio
+import base64
+import hashlib
+import itertools
+import os
+import re
+import tempfile
+import threading
+import time
+from types import SimpleNamespace
+
+import discord
+
+FRAME_SIZE = 3840  # 20ms of 48kHz 16-bit stereo
+FRAME_DURATION = 0.02
+SILENT_FRAME = bytes(FRAME_SIZE)
+
+OFFLINE_ENV = {"AUDIO_CACHE_ENABLED": "false", "LOUDNESS_NORMALIZATION": "false", "STATE_BACKEND": "memory"}
+
+_ids = itertools.count(10**17)
+_SEARCH_RE = re.compile(r"^(?:yt|sc)search(\d*):(.*)$", re.DOTALL)
+
+
+def next_id() -> int:
+    return next(_ids)
+
+
+def not_found() -> discord.NotFound:
+    return discord.NotFound(SimpleNamespace(status=404, reason="Not Found"), "Unknown Message")
+
+
+# --- Messages & channels ---
+
+
+class FakeMessage:
+    def __init__(self, channel, content=None, embed=None, view=None):
+        self.id = next_id()
+        self.channel = channel
+        self.content = content
+        self.embed = embed
+        self.view = view
+        self.edits = 0
+        self.deleted = False
+
+    @property
+    def embeds(self) -> list:
+        return [self.embed] if self.embed else []
+
+    async def edit(self, **kwargs):
+        if self.deleted:
+            raise not_found()
+        self.edits += 1
+        self.channel.edits += 1
+        for field in ("content", "embed", "view"):
+            if field in kwargs:
+                setattr(self, field, kwargs[field])
+        return self
+
+    async def delete(self, **kwargs):
+        self.deleted = True
+        self.channel.messages.pop(self.id, None)
+
+
+class FakeTextChannel:
+    def __init__(self, guild, name: str = "music"):
+        self.id = next_id()
+        self.guild = guild
+        self.name = name
+        self.mention = f"<#{self.id}>"
+        self.messages = {}
+        self.last_message_id = None
+        self.sent = 0
+        self.edits = 0
+
+    async def send(self, content=None, *, embed=None, view=None, **kwargs) -> FakeMessage:
+        message = FakeMessage(self, content, embed, view)
+        self.messages[message.id] = message
+        self.last_message_id = message.id
+        self.sent += 1
+        return message
+
+    async def fetch_message(self, message_id: int) -> FakeMessage:
+        if message_id not in self.messages:
+            raise not_found()
+        return self.messages[message_id]
+
+
+class FakeVoiceChannel:
+    def __init__(self, guild, name: str = "Voice", realtime: bool = True):
+        self.id = next_id()
+        self.guild = guild
+        self.name = name
+        self.realtime = realtime
+        self.members = []
+        self.last_message = None
+
+    async def connect(self, **kwargs) -> "FakeVoiceClient":
+        voice_client = FakeVoiceClient(self, realtime=self.realtime)
+        self.guild.voice_client = voice_client
+        self.guild.me.voice = SimpleNamespace(channel=self, suppress=False)
+        self.members.append(self.guild.me)
+        return voice_client
+
+
+class FakeMember:
+    def __init__(self, guild, name: str, bot: bool = False):
+        self.id = next_id()
+        self.guild = guild
+        self.name = self.display_name = name
+        self.mention = f"<@{self.id}>"
+        self.bot = bot
+        self.voice = None
+        self.display_avatar = SimpleNamespace(url="https://cdn.invalid/avatar.png")
+
+
+class FakeGuild:
+    """A guild with one text channel, one voice channel and one listener already in it."""
+
+    def __init__(self, guild_id: int | None = None, realtime: bool = True):
+        self.id = guild_id or next_id()
+        self.name = f"Guild {self.id}"
+        self.shard_id = 0
+        self.voice_client = None
+        self.me = FakeMember(self, "Playify", bot=True)
+        self.text_channel = FakeTextChannel(self)
+        self.voice_channel = FakeVoiceChannel(self, realtime=realtime)
+        self.listener = FakeMember(self, "Listener")
+        self.listener.voice = SimpleNamespace(channel=self.voice_channel, suppress=False)
+        self.voice_channel.members.append(self.listener)
+        self.members = [self.me, self.listener]
+        self.member_count = len(self.members)
+
+    def get_member(self, member_id: int):
+        return next((member for member in self.members if member.id == member_id), None)
+
+    def get_channel(self, channel_id: int):
+        return {self.text_channel.id: self.text_channel, self.voice_channel.id: self.voice_channel}.get(channel_id)
+
+
+# --- Interactions ---
+
+
+class FakeResponse:
+    def __init__(self, interaction):
+        self.interaction = interaction
+        self.done = False
+
+    def is_done(self) -> bool:
+        return self.done
+
+    async def defer(self, **kwargs):
+        self.done = True
+
+    async def send_message(self, content=None, *, embed=None, view=None, **kwargs):
+        self.done = True
+        self.interaction.original = await self.interaction.channel.send(content, embed=embed, view=view)
+
+    async def edit_message(self, **kwargs):
+        self.done = True
+        if self.interaction.message:
+            await self.interaction.message.edit(**kwargs)
+
+
+class FakeFollowup:
+    def __init__(self, interaction):
+        self.interaction = interaction
+
+    async def send(self, content=None, *, embed=None, view=None, **kwargs) -> FakeMessage:
+        return await self.interaction.channel.send(content, embed=embed, view=view)
+
+
+class FakeInteraction:
+    """A slash command or component interaction sent by the guild's listener."""
+
+    def __init__(self, guild: FakeGuild, message: FakeMessage | None = None):
+        self.id = next_id()
+        self.guild = guild
+        self.guild_id = guild.id
+        self.channel = guild.text_channel
+        self.channel_id = guild.text_channel.id
+        self.user = guild.listener
+        self.message = message
+        self.response = FakeResponse(self)
+        self.followup = FakeFollowup(self)
+        self.original = None
+
+    async def original_response(self) -> FakeMessage:
+        if self.original is None:
+            # A deferred response is the "thinking..." message
+            self.original = await self.channel.send()
+        return self.original
+
+    async def edit_original_response(self, **kwargs) -> FakeMessage:
+        message = await self.original_response()
+        return await message.edit(**kwargs)
+
+    async def delete_original_response(self):
+        message = await self.original_response()
+        await message.delete()
+
+
+# --- Voice ---
+
+
+class FakeVoiceClient:
+    """
+    Plays a source on a thread the way discord.py's AudioPlayer does: reads one frame per
+    20ms tick (or as fast as possible when realtime is False), cleans the source up and calls
+    `after` on the bot's loop at the end of the stream or on stop().
+    Records the lateness of every frame (send jitter), the time of the first frame of each
+    track and the gap between the end of a track and the start of the next one.
+    """
+
+    def __init__(self, channel: FakeVoiceChannel, realtime: bool = True):
+        self.channel = channel
+        self.guild = channel.guild
+        self.loop = asyncio.get_running_loop()
+        self.realtime = realtime
+        self.source = None
+        self.connected = True
+        self.paused = False
+        self.player = None
+        self.stop_event = None
+        self.ended_at = None
+        self.first_frame_at = None
+        self.play_started_at = None
+        self.frames_sent = 0
+        self.frame_lateness = []
+        self.switch_gaps = []
+
+    def is_connected(self) -> bool:
+        return self.connected
+
+    def is_playing(self) -> bool:
+        return self.stop_event is not None and not self.stop_event.is_set() and not self.paused
+
+    def is_paused(self) -> bool:
+        return self.stop_event is not None and not self.stop_event.is_set() and self.paused
+
+    def play(self, source, *, after=None, **kwargs):
+        if not self.connected:
+            raise discord.ClientException("Not connected to voice.")
+        if self.is_playing():
+            raise discord.ClientException("Already playing audio.")
+        now = time.perf_counter()
+        if self.ended_at is not None:
+            self.switch_gaps.append(now - self.ended_at)
+            self.ended_at = None
+        self.source = source
+        self.paused = False
+        self.play_started_at = now
+        self.first_frame_at = None
+        self.stop_event = threading.Event()
+        self.player = threading.Thread(target=self.run, args=(source, after, self.stop_event), name=f"fake-voice-{self.guild.id}", daemon=True)
+        self.player.start()
+
+    def run(self, source, after, stop_event: threading.Event):
+        error = None
+        next_frame_at = time.perf_counter()
+        try:
+            while not stop_event.is_set():
+                if self.paused:
+                    time.sleep(FRAME_DURATION)
+                    next_frame_at = time.perf_counter()
+                    continue
+                frame = source.read()
+                if not frame:
+                    # Like discord.py, the player counts as stopped before `after` runs
+                    self.stop()
+                    break
+                now = time.perf_counter()
+                if self.first_frame_at is None:
+                    self.first_frame_at = now
+                else:
+                    self.frame_lateness.append(max(0.0, now - next_frame_at))
+                self.frames_sent += 1
+                if self.realtime:
+                    next_frame_at += FRAME_DURATION
+                    delay = next_frame_at - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+                    else:
+                        next_frame_at = time.perf_counter()
+        except Exception as e:
+            error = e
+        finally:
+            source.cleanup()
+            if after:
+                self.loop.call_soon_threadsafe(after, error)
+
+    def stop(self):
+        if self.stop_event is not None and not self.stop_event.is_set():
+            self.ended_at = time.perf_counter()
+            self.stop_event.set()
+
+    def pause(self):
+        self.paused = True
+
+    def resume(self):
+        self.paused = False
+
+    async def move_to(self, channel, **kwargs):
+        self.channel = channel
+
+    async def disconnect(self, *, force: bool = False):
+        self.stop()
+        self.connected = False
+        self.guild.voice_client = None
+        self.guild.me.voice = None
+        if self.guild.me in self.channel.members:
+            self.channel.members.remove(self.guild.me)
+
+    async def wait_for_first_frame(self, timeout: float = 10.0) -> float | None:
+        """Waits for the first frame of the current track; returns its perf_counter() time."""
+        deadline = time.perf_counter() + timeout
+        while self.first_frame_at is None and time.perf_counter() < deadline:
+            await asyncio.sleep(0.001)
+        return self.first_frame_at
+
+
+class FakePCMSource(discord.AudioSource):
+    """Stands in for SupervisedFFmpegPCMAudio: `frames` frames of silence, then end of stream."""
+
+    frames = 250
+    supervisor = None
+
+    def __init__(self, source, *, guild_id: int, kind: str = "playback", **kwargs):
+        self.source = source
+        self.guild_id = guild_id
+        self.kind = kind
+        self.remaining = self.frames
+        self._process = None
+        self.released = False
+
+    def is_opus(self) -> bool:
+        return False
+
+    def read(self) -> bytes:
+        if self.remaining <= 0:
+            return b""
+        self.remaining -= 1
+        return SILENT_FRAME
+
+    def cleanup(self):
+        # The real source frees its supervisor slot when its process is unregistered.
+        if not self.released:
+            self.released = True
+            FakePCMSource.supervisor.release_slot()
+
+
+# --- Extraction ---
+
+
+class FakeExtractor:
+    """Answers extraction requests with canned, deterministic info dicts after `latency` seconds."""
+
+    def __init__(self, latency: float = 0.0, duration: int = 180, playlist_size: int = 50, stream_urls: list | None = None):
+        self.latency = latency
+        self.duration = duration
+        self.playlist_size = playlist_size
+        self.stream_urls = stream_urls
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def video_id(text: str) -> str:
+        return base64.urlsafe_b64encode(hashlib.md5(text.encode()).digest()).decode()[:11]
+
+    def track_info(self, text: str) -> dict:
+        video_id = self.video_id(text)
+        # With stream_urls (e.g. files on a local HTTP server), each track streams one of them.
+        stream_url = self.stream_urls[int(hashlib.md5(text.encode()).hexdigest(), 16) % len(self.stream_urls)] if self.stream_urls else f"https://cdn.invalid/{video_id}.webm"
+        return {
+            "id": video_id,
+            "title": f"Track {video_id}",
+            "uploader": "Fake Artist",
+            "webpage_url": f"https://www.youtube.com/watch?v={video_id}",
+            "url": stream_url,
+            "thumbnail": f"https://cdn.invalid/{video_id}.jpg",
+            "duration": self.duration,
+            "is_live": False,
+            "formats": [{"format_id": "251", "url": stream_url}],
+        }
+
+    def extract(self, query: str) -> dict:
+        with self.lock:
+            self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        search = _SEARCH_RE.match(query)
+        if search:
+            count = int(search.group(1) or 1)
+            return {"entries": [self.track_info(f"{search.group(2)}#{index}") for index in range(count)]}
+        if "list=" in query or "/playlist" in query or "/sets/" in query:
+            entries = [self.track_info(f"{query}#{index}") for index in range(self.playlist_size)]
+            return {"title": "Fake playlist", "entries": [{"url": entry["webpage_url"], "title": entry["title"]} for entry in entries]}
+        return self.track_info(query)
+
+    def ydl_worker(self, ydl_opts, query, cookies_file=None):
+        return {"status": "success", "data": self.extract(query)}
+
+    def extract_item(self, profile: str, url: str, cookies_file: str | None = None) -> dict:
+        info = self.extract(url)
+        if profile == "metadata":
+            info = {key: info.get(key) for key in ("title", "webpage_url", "thumbnail", "duration", "uploader")}
+        return {"status": "success", "data": info}
+
+
+# --- Installation ---
+
+
+class FakeDiscord:
+    """Registry of the fake guilds, answering the bot's get_guild/get_channel lookups."""
+
+    def __init__(self, realtime: bool = True):
+        self.realtime = realtime
+        self.guilds = {}
+
+    def create_guild(self, guild_id: int | None = None) -> FakeGuild:
+        guild = FakeGuild(guild_id, realtime=self.realtime)
+        self.guilds[guild.id] = guild
+        return guild
+
+    def get_guild(self, guild_id: int):
+        return self.guilds.get(guild_id)
+
+    def get_channel(self, channel_id: int):
+        for guild in self.guilds.values():
+            channel = guild.get_channel(channel_id)
+            if channel:
+                return channel
+        return None
+
+
+def install(
+    playify,
+    *,
+    latency: float = 0.0,
+    track_seconds: float = 5.0,
+    realtime: bool = True,
+    stream_urls: list | None = None,
+    fake_ffmpeg: bool = True,
+    db_path: str | None = None,
+) -> tuple[FakeDiscord, FakeExtractor]:
+    """
+    Patches the playify module for offline runs. Must be called from the running loop.
+    Extraction runs on threads instead of the process pool, streamed batches included.
+    With fake_ffmpeg=False the real supervised FFmpeg sources decode `stream_urls`.
+    """
+    fake_discord = FakeDiscord(realtime=realtime)
+    extractor = FakeExtractor(latency=latency, duration=int(track_seconds), stream_urls=stream_urls)
+
+    bot = playify.bot
+    bot.loop = asyncio.get_running_loop()
+    bot.get_guild = fake_discord.get_guild
+    bot.get_channel = fake_discord.get_channel
+    type(bot).latency = property(lambda self: 0.05)
+
+    playify.process_pool = playify.ThreadPoolExecutor(max_workers=8, thread_name_prefix="fake-pool")
+    playify.worker_results_queue = playify.extraction_results
+    playify.lower_worker_priority = lambda: None
+    playify.ydl_worker = extractor.ydl_worker
+    playify.extract_item = extractor.extract_item
+
+    FakePCMSource.frames = max(1, int(track_seconds / FRAME_DURATION))
+    FakePCMSource.supervisor = playify.ffmpeg_supervisor
+    if fake_ffmpeg:
+        playify.SupervisedFFmpegPCMAudio = FakePCMSource
+
+    playify.STATE_DB_PATH = db_path or os.path.join(tempfile.mkdtemp(prefix="playify-bench-"), "state.db")
+    playify.init_db()
+    return fake_discord, extractor
@@ -0,0 +1,222 @@
+"""
+Load test: how many concurrently playing guilds one PlayifyBot process sustains.
+
+Ramps through guild counts. At each step, N synthetic guilds (see fakes.py) /play tracks
+that are served by a local HTTP server standing in for the CDN and decoded by real,
+supervised FFmpeg processes, while a scripted listener in every guild keeps using /play,
+/skip, /volume and the controller buttons. Over a steady-state window it reports:
+  - voice frame lateness, i.e. send jitter (a frame later than 20ms is an audible stutter),
+  - event-loop lag percentiles,
+  - FFmpeg process counts, CPU and RSS,
+  - the bot process' RSS and CPU, in total and per guild,
+  - the latency of every scripted action.
+
+Needs ffmpeg on PATH and the project's requirements; no token and no network. Without
+--audio-dir, a few test tones are generated once in a temporary directory.
+Prints a JSON report on stdout.
+
+    python benchmarks/load_test.py [--guilds 10,25,50,100] [--duration 30] [--audio-dir DIR]
+"""
+
+import argparse
+import asyncio
+import functools
+import json
+import logging
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import psutil
+
+# Imported first: it puts the repository on sys.path and sets the offline environment for playify.
+from bench_control_plane import measure_loop_lag, reset, summarize, wait_until  # noqa: E402
+from fakes import FRAME_DURATION, FakeInteraction, install  # noqa: E402
+
+import playify  # noqa: E402
+
+AUDIO_EXTENSIONS = (".m4a", ".mp3", ".ogg", ".opus", ".wav", ".webm", ".flac")
+TONE_FREQUENCIES = (220, 330, 440, 550)
+TONE_SECONDS = 600
+INITIAL_TRACKS = 4  # /play calls per guild before the measurement starts
+MIN_QUEUE = 2  # Below this, the scripted listener queues another track
+
+# Scripted listener actions and their relative weights
+ACTIONS = {"play": 2, "skip": 1, "volume": 2, "button_volume": 2, "button_pause": 1, "button_skip": 1}
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+def generate_tones(directory: str) -> list:
+    """Writes a few AAC test tones (faststart, so they stream over HTTP like CDN files)."""
+    paths = []
+    for frequency in TONE_FREQUENCIES:
+        path = os.path.join(directory, f"tone_{frequency}.m4a")
+        if not os.path.exists(path):
+            subprocess.run(
+                ["ffmpeg", "-v", "error", "-y", "-f", "lavfi", "-i", f"sine=frequency={frequency}:duration={TONE_SECONDS}", "-ac", "2", "-ar", "48000", "-c:a", "aac", "-b:a", "128k", "-movflags", "+faststart", path],
+                check=True,
+            )
+        paths.append(path)
+    return paths
+
+
+def start_cdn(directory: str) -> tuple[ThreadingHTTPServer, str]:
+    """Serves `directory` on a random local port from a daemon thread."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), functools.partial(QuietHandler, directory=directory))
+    threading.Thread(target=server.serve_forever, name="fake-cdn", daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+async def press_button(guild, custom_id: str):
+    """Presses a button of a freshly built controller view, as a listener clicking it would."""
+    view = playify.MusicControllerView(playify.bot, guild.id)
+    button = next(item for item in view.children if getattr(item, "custom_id", None) == custom_id)
+    await button.callback(FakeInteraction(guild))
+    view.stop()
+
+
+async def run_action(guild, action: str, query_counter):
+    player = playify.get_player(guild.id)
+    if action == "play" or player.queue.qsize() < MIN_QUEUE:
+        await playify.play.callback(FakeInteraction(guild), f"load test {guild.id} {next(query_counter)}")
+    elif action == "skip":
+        await playify.skip.callback(FakeInteraction(guild), number=None)
+    elif action == "volume":
+        await playify.volume.callback(FakeInteraction(guild), level=random.randint(20, 150))
+    elif action == "button_volume":
+        await press_button(guild, random.choice(("controller_vol_up", "controller_vol_down")))
+    elif action == "button_pause":
+        # Pause, then resume right away: the listener only hears a short gap
+        await press_button(guild, "controller_pause")
+        await press_button(guild, "controller_pause")
+    elif action == "button_skip":
+        await press_button(guild, "controller_skip")
+
+
+async def listener_script(guild, interval: float, action_times: dict, errors: list):
+    """Keeps issuing weighted random actions every ~interval seconds until cancelled."""
+    counter = iter(range(INITIAL_TRACKS, 10**9))
+    names, weights = list(ACTIONS), list(ACTIONS.values())
+    while True:
+        await asyncio.sleep(random.uniform(0.5, 1.5) * interval)
+        action = random.choices(names, weights)[0]
+        started = time.perf_counter()
+        try:
+            await run_action(guild, action, counter)
+            action_times.setdefault(action, []).append(time.perf_counter() - started)
+        except Exception as e:
+            errors.append(f"{action}: {e}")
+
+
+async def run_step(fake_discord, guild_count: int, duration: float, interval: float) -> dict:
+    guilds = [fake_discord.create_guild() for _ in range(guild_count)]
+
+    async def start_guild(guild):
+        for index in range(INITIAL_TRACKS):
+            await playify.play.callback(FakeInteraction(guild), f"load test {guild.id} {index}")
+
+    await asyncio.gather(*(start_guild(guild) for guild in guilds))
+    started_all = await wait_until(lambda: all(guild.voice_client and guild.voice_client.first_frame_at for guild in guilds), timeout=60)
+
+    # Steady state from here: earlier frames and spawns belong to the ramp-up.
+    for guild in guilds:
+        if guild.voice_client:
+            guild.voice_client.frame_lateness.clear()
+    process = psutil.Process()
+    cpu_before = process.cpu_times()
+    ffmpeg_before = playify.ffmpeg_supervisor.metrics()
+    window_started = time.perf_counter()
+
+    action_times, errors = {}, []
+    scripts = [asyncio.create_task(listener_script(guild, interval, action_times, errors)) for guild in guilds]
+    lag = await measure_loop_lag(duration)
+    for script in scripts:
+        script.cancel()
+    await asyncio.gather(*scripts, return_exceptions=True)
+
+    elapsed = time.perf_counter() - window_started
+    cpu_after = process.cpu_times()
+    ffmpeg_after = playify.ffmpeg_supervisor.metrics()
+    rss = process.memory_info().rss
+    bot_cpu = (cpu_after.user + cpu_after.system - cpu_before.user - cpu_before.system) / elapsed
+    ffmpeg_cpu = (ffmpeg_after["cpu_seconds_total"] - ffmpeg_before["cpu_seconds_total"]) / elapsed
+
+    lateness = [value for guild in guilds if guild.voice_client for value in guild.voice_client.frame_lateness]
+    late_frames = sum(1 for value in lateness if value > FRAME_DURATION)
+    result = {
+        "all_guilds_started": started_all,
+        "playing_guilds": sum(1 for guild in guilds if guild.voice_client and guild.voice_client.is_playing()),
+        "frame_lateness": summarize(lateness),
+        "late_frames_pct": round(100 * late_frames / len(lateness), 3) if lateness else None,
+        "loop_lag": summarize(lag),
+        "ffmpeg": {
+            "active": ffmpeg_after["active"],
+            "waiting": ffmpeg_after["waiting"],
+            "spawned_in_window": ffmpeg_after["spawned_total"] - ffmpeg_before["spawned_total"],
+            "cpu_cores": round(ffmpeg_cpu, 3),
+            "rss_mb": round(ffmpeg_after["rss_bytes"] / 1024**2, 1),
+        },
+        "bot_process": {"cpu_cores": round(bot_cpu, 3), "rss_mb": round(rss / 1024**2, 1), "threads": process.num_threads()},
+        "per_guild": {
+            "bot_cpu_pct": round(100 * bot_cpu / guild_count, 3),
+            "ffmpeg_cpu_pct": round(100 * ffmpeg_cpu / guild_count, 3),
+            "bot_rss_mb": round(rss / 1024**2 / guild_count, 3),
+            "ffmpeg_rss_mb": round(ffmpeg_after["rss_bytes"] / 1024**2 / guild_count, 3),
+        },
+        "actions": {action: summarize(samples) for action, samples in sorted(action_times.items())},
+        "errors": errors[:20],
+    }
+    await reset(fake_discord)
+    return result
+
+
+async def main(guild_counts: list, duration: float, interval: float, audio_dir: str | None, latency: float) -> dict:
+    logging.disable(logging.INFO)
+    if audio_dir:
+        files = sorted(os.path.join(audio_dir, name) for name in os.listdir(audio_dir) if name.lower().endswith(AUDIO_EXTENSIONS))
+    else:
+        audio_dir = os.path.join(tempfile.gettempdir(), "playify-load-test")
+        os.makedirs(audio_dir, exist_ok=True)
+        files = await asyncio.to_thread(generate_tones, audio_dir)
+    if not files:
+        sys.exit(f"No audio files found in {audio_dir}.")
+
+    server, base_url = start_cdn(audio_dir)
+    stream_urls = [f"{base_url}/{os.path.basename(path)}" for path in files]
+    fake_discord, _ = install(playify, latency=latency, track_seconds=TONE_SECONDS, stream_urls=stream_urls, fake_ffmpeg=False)
+
+    report = {
+        "cpu_count": psutil.cpu_count(),
+        "ffmpeg_max_processes": playify.FFMPEG_MAX_PROCESSES,
+        "duration_s": duration,
+        "action_interval_s": interval,
+        "audio_files": len(files),
+        "steps": {},
+    }
+    try:
+        for guild_count in guild_counts:
+            report["steps"][str(guild_count)] = await run_step(fake_discord, guild_count, duration, interval)
+    finally:
+        server.shutdown()
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test of concurrently playing guilds in one bot process.")
+    parser.add_argument("--guilds", default="10,25,50,100", help="Comma-separated guild counts to ramp through (default: 10,25,50,100)")
+    parser.add_argument("--duration", type=float, default=30, help="Steady-state window per step, in seconds (default: 30)")
+    parser.add_argument("--interval", type=float, default=5, help="Mean seconds between two actions of one listener (default: 5)")
+    parser.add_argument("--audio-dir", help="Directory of audio files to serve instead of generated tones")
+    parser.add_argument("--latency", type=float, default=0.2, help="Simulated extraction latency in seconds (default: 0.2)")
+    args = parser.parse_args()
+    guild_counts = [int(count) for count in args.guilds.split(",") if count.strip()]
+    print(json.dumps(asyncio.run(main(guild_counts, args.duration, args.interval, args.audio_dir, args.latency)), indent=2))
@@ -6,19 +6,29 @@
 
 import asyncio
 import datetime
+import hashlib
+import itertools
 import json
 import logging
 import math  # Needed for the format_bytes helper
+import multiprocessing
 import os
 import platform
 import random
 import re
 import shutil
 import sqlite3
+import subprocess
 import sys
+import threading
 import time
 import traceback  # --- NEW --- To format exceptions
-from concurrent.futures import ProcessPoolExecutor
+import weakref
+from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import Optional
 from urllib.parse import parse_qs, urlparse
 
@@ -37,12 +47,33 @@ from spotify_scraper import SpotifyClient
 from spotify_scraper.core.exceptions import SpotifyScraperError
 from spotipy.oauth2 import SpotifyClientCredentials
 
+from url_classifier import AUTOPLAY_SEED_PLATFORMS, YOUTUBE_PLATFORMS, classify, is_direct, needs_conversion
+
+try:
+    import numpy as np
+except ImportError:  # Volume scaling falls back to audioop
+    np = None
+    import audioop
+
 load_dotenv()
 
+STATE_DB_PATH = "playify_state.db"
+
+
+def get_db_connection() -> sqlite3.Connection:
+    """
+    Opens the state database. WAL lets shard processes read while another one writes,
+    and the busy timeout makes concurrent writers wait for the lock instead of failing.
+    """
+    conn = sqlite3.connect(STATE_DB_PATH, timeout=30)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA busy_timeout=30000")
+    return conn
+
 
 def init_db():
     """Initialize the SQLite database and create tables if they do not exist."""
-    conn = sqlite3.connect("playify_state.db")
+    conn = get_db_connection()
     cursor = conn.cursor()
 
     # Table for general server settings
@@ -77,19 +108,45 @@ def init_db():
         playback_timestamp REAL NOT NULL DEFAULT 0
     )""")
 
+    # Table for the latest stats of each shard process, aggregated by /status
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS shard_stats (
+        process_key TEXT PRIMARY KEY,
+        stats_json TEXT NOT NULL,
+        updated_at REAL NOT NULL
+    )""")
+
     conn.commit()
     conn.close()
     logger.info("Database initialized successfully.")
 
 
+# Pool workers stream batch extraction results back through this queue (see extract_many).
+extraction_results = multiprocessing.Queue()
+worker_results_queue = None
+
+
+def init_extraction_worker(results_queue):
+    """Runs once in every pool worker: keeps the queue used to stream batch results."""
+    global worker_results_queue
+    worker_results_queue = results_queue
+
+
 try:
-    process_pool = ProcessPoolExecutor(max_workers=psutil.cpu_count(logical=False))
+    process_pool = ProcessPoolExecutor(max_workers=psutil.cpu_count(logical=False), initializer=init_extraction_worker, initargs=(extraction_results,))
 except NotImplementedError:  # Some systems may not support logical=False
-    process_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    process_pool = ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=init_extraction_worker, initargs=(extraction_results,))
 
 SILENT_MESSAGES = True
 IS_PUBLIC_VERSION = False
 
+# --- Sharding ---
+# SHARD_COUNT: total number of shards across all processes (unset = Discord's recommendation).
+# SHARD_IDS: comma-separated shards owned by this process (unset = all of them). Set by shard_launcher.py.
+SHARD_COUNT = int(os.getenv("SHARD_COUNT")) if os.getenv("SHARD_COUNT") else None
+SHARD_IDS = [int(shard_id) for shard_id in os.getenv("SHARD_IDS", "").split(",") if shard_id.strip()] or None
+SHARD_STATS_INTERVAL = 30  # How often each process publishes its stats for /status (seconds)
+
 # --- Logging ---
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -119,7 +176,38 @@ except Exception as e:
 
 # --- Caching ---
 
-url_cache = TTLCache(maxsize=75000, ttl=7200)
+# Backend of the extraction caches (url_cache, negative_cache):
+#   "memory" (default): private to this process.
+#   "sqlite": shared by every bot process on this machine through STATE_CACHE_DB (WAL mode).
+STATE_BACKEND = os.getenv("STATE_BACKEND", "memory").lower()
+STATE_CACHE_DB = os.getenv("STATE_CACHE_DB", "playify_cache.db")
+
+# Shared on-disk audio cache (opt-in). Tracks are transcoded to Opus/Ogg while they stream
+# and replayed from disk the next time, in any guild.
+AUDIO_CACHE_ENABLED = os.getenv("AUDIO_CACHE_ENABLED", "false").lower() == "true"
+AUDIO_CACHE_DIR = "audio_cache/shared"
+AUDIO_CACHE_MAX_BYTES = int(os.getenv("AUDIO_CACHE_MAX_MB", "2048")) * 1024 * 1024
+AUDIO_CACHE_MAX_TRACK_SECONDS = int(os.getenv("AUDIO_CACHE_MAX_TRACK_SECONDS", "900"))
+AUDIO_CACHE_MAX_TRACK_BYTES = int(os.getenv("AUDIO_CACHE_MAX_TRACK_MB", "50")) * 1024 * 1024
+
+# Optional EBU R128 loudness normalization. Each track is measured once in the background;
+# later plays get a static FFmpeg gain towards LOUDNESS_TARGET_LUFS.
+LOUDNESS_NORMALIZATION = os.getenv("LOUDNESS_NORMALIZATION", "false").lower() == "true"
+LOUDNESS_TARGET_LUFS = float(os.getenv("LOUDNESS_TARGET_LUFS", "-16"))
+
+# In-memory seek buffer of decoded PCM around the play head (~192 KB per second per playing guild).
+# Past SEEK_BUFFER_MAX_PLAYERS buffered players (0 = never buffer), new tracks play unbuffered
+# and every seek restarts FFmpeg.
+SEEK_BUFFER_HISTORY_SECONDS = int(os.getenv("SEEK_BUFFER_HISTORY_SECONDS", "10"))
+SEEK_BUFFER_AHEAD_SECONDS = int(os.getenv("SEEK_BUFFER_AHEAD_SECONDS", "5"))
+SEEK_BUFFER_MAX_PLAYERS = int(os.getenv("SEEK_BUFFER_MAX_PLAYERS", "50"))
+
+# Global cap on concurrent FFmpeg processes (0 = unlimited). Spawns beyond it wait for a free slot.
+FFMPEG_MAX_PROCESSES = int(os.getenv("FFMPEG_MAX_PROCESSES", "200"))
+
+# Optional Prometheus metrics endpoint (http://METRICS_HOST:METRICS_PORT/metrics). Unset port = disabled.
+METRICS_HOST = os.getenv("METRICS_HOST", "127.0.0.1")
+METRICS_PORT = int(os.getenv("METRICS_PORT")) if os.getenv("METRICS_PORT") else None
 
 
 # Precomputed English messages (formerly loaded via i18n)
@@ -276,6 +364,23 @@ MESSAGES = {
     "status.music_player.value": "**Active Players:** {active_players}\n**Queued Songs:** {total_queued_songs}\n**FFmpeg Processes:** `{ffmpeg_processes}`\n**URL Cache:** {url_cache_size}/{url_cache_max}",
     "status.host.title": "💻 Host System",
     "status.host.value": "**OS:** {os_info}\n**CPU:** {cpu_load}% @ {cpu_freq_current:.0f}MHz\n**RAM:** {ram_used} / {ram_total} ({ram_percent}%)\n**Disk:** {disk_used} / {disk_total} ({disk_percent}%)",
+    "status.shards.title": "🧩 Shards",
+    "status.shards.line": "`#{shard_id}`: {latency} ms | {servers} servers | {active_players} players",
+    "status.voice.title": "🔌 Voice Connections",
+    "status.voice.line": "**{kind}:** {count} | p50 ≤ {p50}s | p95 ≤ {p95}s | max {max:.2f}s",
+    "status.voice.none": "No connections yet.",
+    "status.play.title": "⏱️ /play Phases",
+    "status.play.line": "**{phase}:** p50 ≤ {p50}s | p95 ≤ {p95}s ({count})",
+    "status.metrics.title": "📈 Metrics",
+    "status.metrics.value": "**Loop Lag:** p95 {loop_lag_p95} | max {loop_lag_max} ms\n**Track Switch Gap:** p95 {track_switch_p95}\n**Pool Queue Wait:** p95 {pool_wait_p95}\n**Caches:** {cache_hit_ratio}% hits ({cache_lookups} lookups)\n**Controller Updates:** {controller_updates} | **Voice Reconnects:** {voice_reconnects}",
+    "status.metrics.extraction_line": "**Extraction ({profile}):** p50 ≤ {p50}s | p95 ≤ {p95}s ({count})",
+    "status.cookies.title": "🍪 Cookies",
+    "status.cookies.line": "`{name}`: **{score}%** ({successes}/{attempts} ok) | Last failure: {last_failure} | Cooldown: {cooldown}",
+    "status.cookies.none": "No cookie files found.",
+    "status.audio_cache.title": "💾 Audio Cache",
+    "status.audio_cache.value": "**Tracks:** {entries}\n**Size:** {used} / {limit}\n**Hit Ratio:** {hit_ratio}% ({hits}/{lookups})\n**Recordings Started:** {recordings_started}\n**Bytes Saved:** {bytes_saved}",
+    "status.ffmpeg.title": "🎛️ FFmpeg",
+    "status.ffmpeg.value": "**Active:** {active}/{limit} ({waiting} waiting)\n**Spawned / Reaped:** {spawned_total} / {reaped_total}\n**Spawn Latency:** {spawn_latency_avg_ms} ms avg, {spawn_latency_max_ms} ms max\n**CPU Time:** {cpu_seconds}s\n**RSS:** {rss}",
     "status.environment.title": "⚙️ Environment",
     "status.environment.value": "**Python:** v{python_version}\n**Discord.py:** v{discord_py_version}\n**yt-dlp:** v{yt_dlp_version}\n**Bot RAM Usage:** {bot_ram_usage}",
     "platform.display.spotify": "Spotify 🟢",
@@ -352,7 +457,7 @@ intents.message_content = True
 
 # Create the bot
 # --- Definition of our custom bot class ---
-class PlayifyBot(commands.Bot):
+class PlayifyBot(commands.AutoShardedBot):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -365,20 +470,142 @@ class PlayifyBot(commands.Bot):
 
 
 # Create the bot
-bot = PlayifyBot(command_prefix="!", intents=intents)
+bot = PlayifyBot(command_prefix="!", intents=intents, shard_count=SHARD_COUNT, shard_ids=SHARD_IDS)
 
 # ==============================================================================
 # 2. CORE CLASSES & STATE MANAGEMENT
 # ==============================================================================
 
 
+class RadioPlaylist(Sequence):
+    """
+    Circular playlist of 24/7 normal mode. A cursor marks the track playing now: advancing,
+    locating a track (index by canonical media key) and adding one are O(1), and displays
+    read lazy windows instead of rotated copies. Reads and serializes like a list.
+    """
+
+    def __init__(self, tracks=None):
+        self.tracks = []
+        self.positions = {}
+        self.cursor = -1
+        self.extend(tracks or [])
+
+    def __len__(self) -> int:
+        return len(self.tracks)
+
+    def __getitem__(self, index):
+        return self.tracks[index]
+
+    def append(self, track):
+        key = get_track_key(track)
+        if key:
+            self.positions.setdefault(key, len(self.tracks))
+        self.tracks.append(track)
+
+    def extend(self, tracks):
+        for track in tracks:
+            self.append(track)
+
+    def clear(self):
+        self.tracks.clear()
+        self.positions.clear()
+        self.cursor = -1
+
+    def position_of(self, track) -> int | None:
+        key = get_track_key(track) if track else None
+        return self.positions.get(key) if key else None
+
+    def include(self, track):
+        """Adds a track to the end of the rotation unless it is already part of it."""
+        if self.position_of(track) is None:
+            self.append(track)
+
+    def sync_to(self, track):
+        """Moves the cursor to a track being played, if it belongs to the rotation."""
+        position = self.position_of(track)
+        if position is not None:
+            self.cursor = position
+
+    def advance(self, skip=None):
+        """
+        Moves the cursor to the next track, wrapping around, and returns a copy of it (the played
+        dict gets mutated). Tracks for which `skip` returns True are passed; None if all are.
+        """
+        for _ in range(len(self.tracks)):
+            self.cursor = (self.cursor + 1) % len(self.tracks)
+            track = self.tracks[self.cursor]
+            if not (skip and skip(track)):
+                return dict(track) if isinstance(track, dict) else track
+        return None
+
+    def _rebuild(self, tracks: list, cursor: int):
+        self.tracks = []
+        self.positions = {}
+        self.extend(tracks)
+        self.cursor = cursor
+
+    def upcoming_position(self, offset: int) -> int:
+        """Index in `tracks` of the offset-th track after the cursor."""
+        return (self.cursor + 1 + offset) % len(self.tracks)
+
+    def shuffle(self):
+        """Shuffles the rotation; the track playing now stays under the cursor."""
+        current = self.tracks[self.cursor] if 0 <= self.cursor < len(self.tracks) else None
+        others = [track for index, track in enumerate(self.tracks) if index != self.cursor]
+        random.shuffle(others)
+        self._rebuild(([current] if current is not None else []) + others, 0 if current is not None else -1)
+
+    def remove_upcoming(self, offsets) -> list:
+        """Removes the tracks at the given offsets after the cursor. Returns them in rotation order."""
+        removed_positions = {self.upcoming_position(offset) for offset in offsets if 0 <= offset < len(self.tracks) - 1}
+        removed = [track for index, track in enumerate(self.tracks) if index in removed_positions]
+        kept = [track for index, track in enumerate(self.tracks) if index not in removed_positions]
+        cursor = self.cursor - sum(1 for position in removed_positions if position < self.cursor) if self.cursor >= 0 else -1
+        self._rebuild(kept, cursor)
+        return removed
+
+    def skip_upcoming(self, offset: int) -> list:
+        """Moves the cursor so the next advance() plays the offset-th upcoming track. Returns the tracks passed."""
+        skipped = [self.tracks[self.upcoming_position(i)] for i in range(offset)]
+        self.cursor = (self.cursor + offset) % len(self.tracks)
+        return skipped
+
+    def window(self, head: list = None, include_current: bool = False) -> "RadioWindow":
+        """Play-order view: `head` (e.g. user-queued tracks) first, then the tracks after the cursor."""
+        return RadioWindow(self, head or [], include_current)
+
+
+class RadioWindow(Sequence):
+    """Read-only, lazily indexed view of a RadioPlaylist in play order; never copies the playlist."""
+
+    def __init__(self, radio: RadioPlaylist, head: list, include_current: bool):
+        self.radio = radio
+        self.head = head
+        self.rotation_length = len(radio) if include_current else max(len(radio) - 1, 0)
+
+    def __len__(self) -> int:
+        return len(self.head) + self.rotation_length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("radio window index out of range")
+        if index < len(self.head):
+            return self.head[index]
+        offset = index - len(self.head)
+        return self.radio.tracks[(self.radio.cursor + 1 + offset) % len(self.radio.tracks)]
+
+
 class MusicPlayer:
     def __init__(self):
         self.voice_client = None
         self.current_task = None
         self.queue = asyncio.Queue()
         self.history = []
-        self.radio_playlist = []
+        self.radio_playlist = RadioPlaylist()
         self.current_url = None
         self.current_info = None
         self.text_channel = None
@@ -416,6 +643,26 @@ class MusicPlayer:
         self.silence_management_lock = asyncio.Lock()
         self.is_paused_by_leave = False
         self.manual_stop = False
+        self.audio_cache_recording = None
+        self.seekable_source = None
+        self.stream_url_fetched_at = None
+        self.playback_clock = None
+        self.pending_play_trace = None
+        self.autoplay_pool = deque()
+        self.autoplay_refill_task = None
+        self.track_ended_at = None  # perf_counter() of the end of the last track, for the track-switch gap
+
+    def get_position(self) -> float:
+        """
+        Current playback position in seconds. Comes from the frames actually delivered to the
+        voice client when a PlaybackClock is attached, so FFmpeg buffering, network stalls and
+        pauses don't make it drift. Falls back to wall-clock arithmetic otherwise.
+        """
+        if self.playback_clock:
+            return self.playback_clock.position
+        if self.playback_started_at:
+            return self.start_time + (time.time() - self.playback_started_at) * self.playback_speed
+        return self.start_time
 
 
 class GuildModel:
@@ -428,6 +675,11 @@ class GuildModel:
         self.allowed_channels: set[int] = set()
         self.controller_channel_id: int | None = None
         self.controller_message_id: int | None = None
+        self.seek_panels: SeekPanelTicker = SeekPanelTicker(guild_id)
+
+    @property
+    def shard_id(self) -> int:
+        return get_shard_id(self.guild_id)
 
 
 # Main dictionary that will store the state of all guilds
@@ -446,61 +698,388 @@ def get_player(guild_id: int) -> MusicPlayer:
     return get_guild_state(guild_id).music_player
 
 
+def is_radio_rotation(guild_id: int) -> bool:
+    """True when 24/7 normal mode plays a rotation: its tracks live in radio_playlist, not in the queue."""
+    music_player = get_player(guild_id)
+    return get_guild_state(guild_id)._24_7_mode and not music_player.autoplay_enabled and bool(music_player.radio_playlist)
+
+
+def get_upcoming_tracks(guild_id: int) -> Sequence:
+    """
+    What plays next, in order and numbered like /queue: the queue, followed in 24/7 normal
+    mode by the rotation after the current track. /skip N, /jumpto and /remove index into it.
+    """
+    music_player = get_player(guild_id)
+    queued = list(music_player.queue._queue)
+    if is_radio_rotation(guild_id):
+        return music_player.radio_playlist.window(head=queued)
+    return queued
+
+
+def replace_queue(music_player, items: list):
+    music_player.queue = asyncio.Queue()
+    for item in items:
+        music_player.queue.put_nowait(item)
+
+
+def jump_to_upcoming(guild_id: int, index: int):
+    """
+    Makes the index-th upcoming track (see get_upcoming_tracks) the next one, moving the tracks
+    before it to the history. Returns that track, or None if the index is out of range.
+    The caller holds queue_lock and stops the current track.
+    """
+    music_player = get_player(guild_id)
+    queue_list = list(music_player.queue._queue)
+    if 0 <= index < len(queue_list):
+        music_player.history.extend(queue_list[:index])
+        replace_queue(music_player, queue_list[index:])
+        return queue_list[index]
+    upcoming = get_upcoming_tracks(guild_id)
+    if not is_radio_rotation(guild_id) or not 0 <= index < len(upcoming):
+        return None
+    target = upcoming[index]
+    music_player.history.extend(queue_list)
+    replace_queue(music_player, [])
+    music_player.history.extend(music_player.radio_playlist.skip_upcoming(index - len(queue_list)))
+    return target
+
+
+def remove_upcoming(guild_id: int, indices) -> list:
+    """Removes the upcoming tracks (see get_upcoming_tracks) at the given indices. Returns the removed tracks."""
+    music_player = get_player(guild_id)
+    queue_list = list(music_player.queue._queue)
+    indices = set(indices)
+    removed = [track for index, track in enumerate(queue_list) if index in indices]
+    replace_queue(music_player, [track for index, track in enumerate(queue_list) if index not in indices])
+    if is_radio_rotation(guild_id):
+        removed += music_player.radio_playlist.remove_upcoming(index - len(queue_list) for index in indices if index >= len(queue_list))
+    return removed
+
+
+def get_shard_id(guild_id: int) -> int:
+    """Shard that owns a guild, using Discord's sharding formula."""
+    return (guild_id >> 22) % (bot.shard_count or 1)
+
+
+def owned_guilds_filter() -> tuple[str, list]:
+    """
+    SQL condition (and its parameters) matching the guild_id rows owned by this process,
+    so shard processes sharing the database never load or overwrite each other's guilds.
+    """
+    if not SHARD_IDS:
+        return "1", []
+    placeholders = ", ".join("?" for _ in SHARD_IDS)
+    return f"((guild_id >> 22) % ?) IN ({placeholders})", [bot.shard_count or SHARD_COUNT or 1, *SHARD_IDS]
+
+
+# --- Cache Backends ---
+
+
+class CacheBackend(ABC):
+    """Key/value store behind the shared caches. Keys live in namespaces; values must be JSON-serializable."""
+
+    name = "base"
+
+    def register(self, namespace: str, maxsize: int):
+        pass
+
+    @abstractmethod
+    def get(self, namespace: str, key: str): ...
+
+    @abstractmethod
+    def set(self, namespace: str, key: str, value, ttl: float): ...
+
+    @abstractmethod
+    def delete(self, namespace: str, key: str): ...
+
+    @abstractmethod
+    def count(self, namespace: str) -> int: ...
+
+
+class InProcessCacheBackend(CacheBackend):
+    """Default backend: per-namespace insertion-ordered dicts in this process' memory."""
+
+    name = "memory"
+
+    def __init__(self):
+        self.namespaces = {}
+        self.limits = {}
+
+    def register(self, namespace: str, maxsize: int):
+        self.namespaces.setdefault(namespace, OrderedDict())
+        self.limits[namespace] = maxsize
+
+    def get(self, namespace: str, key: str):
+        entries = self.namespaces[namespace]
+        item = entries.get(key)
+        if item is None:
+            return None
+        value, expires_at = item
+        if expires_at <= time.time():
+            del entries[key]
+            return None
+        return value
+
+    def set(self, namespace: str, key: str, value, ttl: float):
+        entries = self.namespaces[namespace]
+        entries.pop(key, None)
+        while entries and len(entries) >= self.limits[namespace]:
+            entries.popitem(last=False)
+        entries[key] = (value, time.time() + ttl)
+
+    def delete(self, namespace: str, key: str):
+        self.namespaces[namespace].pop(key, None)
+
+    def count(self, namespace: str) -> int:
+        now = time.time()
+        return sum(1 for _, expires_at in self.namespaces[namespace].values() if expires_at > now)
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    Multi-process-safe backend: one SQLite file in WAL mode shared by all bot processes of
+    a machine, so an extraction done by one shard is reused by the others.
+    An in-process tier answers first and is the fallback whenever the file is locked.
+    Writes, deletes and the periodic purge run on a dedicated writer thread; the event loop
+    only does WAL reads, which give up after BUSY_TIMEOUT_MS.
+    """
+
+    name = "sqlite"
+    PURGE_INTERVAL = 300
+    BUSY_TIMEOUT_MS = 100  # Reads, on the event loop
+    WRITER_BUSY_TIMEOUT_MS = 5000  # Writer thread
+    MAX_PENDING_WRITES = 10000  # Oldest queued writes are dropped beyond this
+    PROMOTED_TTL = 300  # Rows read from the file stay this long at most in the in-process tier
+
+    def __init__(self, path: str):
+        self.path = path
+        self.local = threading.local()
+        self.limits = {}
+        self.memory = InProcessCacheBackend()
+        self.pending = deque(maxlen=self.MAX_PENDING_WRITES)
+        self.condition = threading.Condition()
+        conn = self.open(self.WRITER_BUSY_TIMEOUT_MS)
+        conn.execute("""
+        CREATE TABLE IF NOT EXISTS cache (
+            namespace TEXT NOT NULL,
+            key TEXT NOT NULL,
+            value_json TEXT NOT NULL,
+            expires_at REAL NOT NULL,
+            PRIMARY KEY (namespace, key)
+        )""")
+        conn.execute("CREATE INDEX IF NOT EXISTS cache_expiry ON cache (expires_at)")
+        conn.close()
+        threading.Thread(target=self._write_loop, name="cache-writer", daemon=True).start()
+
+    def open(self, busy_timeout_ms: int) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=busy_timeout_ms / 1000, isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA busy_timeout={busy_timeout_ms}")
+        return conn
+
+    def connection(self) -> sqlite3.Connection:
+        """Per-thread read connection with the short busy timeout."""
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            conn = self.local.conn = self.open(self.BUSY_TIMEOUT_MS)
+        return conn
+
+    def register(self, namespace: str, maxsize: int):
+        self.limits[namespace] = maxsize
+        self.memory.register(namespace, maxsize)
+
+    def get(self, namespace: str, key: str):
+        value = self.memory.get(namespace, key)
+        if value is not None:
+            return value
+        try:
+            row = self.connection().execute("SELECT value_json, expires_at FROM cache WHERE namespace = ? AND key = ? AND expires_at > ?", (namespace, key, time.time())).fetchone()
+        except sqlite3.Error as e:
+            logger.debug(f"Shared cache read skipped ({namespace}): {e}")
+            return None
+        if not row:
+            return None
+        value = json.loads(row[0])
+        self.memory.set(namespace, key, value, min(row[1] - time.time(), self.PROMOTED_TTL))
+        return value
+
+    def set(self, namespace: str, key: str, value, ttl: float):
+        self.memory.set(namespace, key, value, ttl)
+        self.enqueue("INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?)", (namespace, key, json.dumps(value), time.time() + ttl))
+
+    def delete(self, namespace: str, key: str):
+        self.memory.delete(namespace, key)
+        self.enqueue("DELETE FROM cache WHERE namespace = ? AND key = ?", (namespace, key))
+
+    def count(self, namespace: str) -> int:
+        try:
+            return self.connection().execute("SELECT COUNT(*) FROM cache WHERE namespace = ? AND expires_at > ?", (namespace, time.time())).fetchone()[0]
+        except sqlite3.Error:
+            return self.memory.count(namespace)
+
+    def enqueue(self, statement: str, params: tuple):
+        with self.condition:
+            self.pending.append((statement, params))
+            self.condition.notify()
+
+    def _write_loop(self):
+        """Writer thread: applies queued writes in one transaction per batch and purges every PURGE_INTERVAL."""
+        conn = self.open(self.WRITER_BUSY_TIMEOUT_MS)
+        next_purge = time.monotonic()
+        while True:
+            with self.condition:
+                if not self.pending:
+                    self.condition.wait(timeout=max(0, next_purge - time.monotonic()))
+                batch = list(self.pending)
+                self.pending.clear()
+            try:
+                if batch:
+                    conn.execute("BEGIN")
+                    for statement, params in batch:
+                        conn.execute(statement, params)
+                    conn.execute("COMMIT")
+                if time.monotonic() >= next_purge:
+                    next_purge = time.monotonic() + self.PURGE_INTERVAL
+                    self.purge(conn)
+            except Exception as e:
+                if conn.in_transaction:
+                    conn.rollback()
+                logger.warning(f"Shared cache writer: {len(batch)} writes kept in this process only: {e}")
+
+    def purge(self, conn: sqlite3.Connection):
+        """Drops expired rows, then the oldest rows of namespaces over their size limit."""
+        conn.execute("DELETE FROM cache WHERE expires_at <= ?", (time.time(),))
+        for namespace, maxsize in list(self.limits.items()):
+            conn.execute(
+                "DELETE FROM cache WHERE namespace = ? AND key IN (SELECT key FROM cache WHERE namespace = ? ORDER BY expires_at DESC LIMIT -1 OFFSET ?)",
+                (namespace, namespace, maxsize),
+            )
+
+
+def create_cache_backend() -> CacheBackend:
+    if STATE_BACKEND == "sqlite":
+        try:
+            backend = SQLiteCacheBackend(STATE_CACHE_DB)
+            logger.info(f"Using the shared SQLite cache backend ({STATE_CACHE_DB}).")
+            return backend
+        except sqlite3.Error as e:
+            logger.error(f"Could not open the SQLite cache backend, falling back to in-process caches: {e}")
+    elif STATE_BACKEND != "memory":
+        logger.warning(f"Unknown STATE_BACKEND '{STATE_BACKEND}', using in-process caches.")
+    return InProcessCacheBackend()
+
+
+cache_backend = create_cache_backend()
+
+
+class SharedCache:
+    """Dictionary-like view of one namespace of the cache backend, with a default TTL."""
+
+    def __init__(self, namespace: str, maxsize: int, ttl: float):
+        self.namespace = namespace
+        self.maxsize = maxsize
+        self.ttl = ttl
+        cache_backend.register(namespace, maxsize)
+
+    def get(self, key: str, default=None):
+        value = cache_backend.get(self.namespace, key)
+        cache_requests.labels(self.namespace, "miss" if value is None else "hit").inc()
+        return default if value is None else value
+
+    def set(self, key: str, value, ttl: float | None = None):
+        cache_backend.set(self.namespace, key, value, ttl or self.ttl)
+
+    def discard(self, key: str):
+        cache_backend.delete(self.namespace, key)
+
+    def __getitem__(self, key: str):
+        value = cache_backend.get(self.namespace, key)
+        cache_requests.labels(self.namespace, "miss" if value is None else "hit").inc()
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value):
+        self.set(key, value)
+
+    def __contains__(self, key: str) -> bool:
+        found = cache_backend.get(self.namespace, key) is not None
+        cache_requests.labels(self.namespace, "hit" if found else "miss").inc()
+        return found
+
+    @property
+    def currsize(self) -> int:
+        return cache_backend.count(self.namespace)
+
+
+url_cache = SharedCache("url", maxsize=75000, ttl=7200)
+
+
 # --- Core Music Player Class ---
 
 
+def write_all_states(owned_filter: tuple, settings_rows: list, allowlist_rows: list, playback_rows: list):
+    """Replaces the rows of this process' guilds in the state database. Runs in a worker thread."""
+    owned_condition, owned_params = owned_filter
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    # Take the write lock up front so the delete + re-insert is atomic for other processes.
+    cursor.execute("BEGIN IMMEDIATE")
+    cursor.execute(f"DELETE FROM guild_settings WHERE {owned_condition}", owned_params)
+    cursor.execute(f"DELETE FROM allowlist WHERE {owned_condition}", owned_params)
+    cursor.execute(f"DELETE FROM playback_state WHERE {owned_condition}", owned_params)
+    cursor.executemany("INSERT INTO guild_settings VALUES (?, ?, ?, ?, ?, ?)", settings_rows)
+    cursor.executemany("INSERT INTO allowlist VALUES (?, ?)", allowlist_rows)
+    cursor.executemany("INSERT INTO playback_state VALUES (?, ?, ?, ?, ?, ?, ?, ?)", playback_rows)
+    conn.commit()
+    conn.close()
+
+
 async def save_all_states():
     """Save the complete state of all servers in the database."""
     logger.info("Attempting to save the state of all servers...")
-    conn = sqlite3.connect("playify_state.db")
-    cursor = conn.cursor()
-
-    cursor.execute("DELETE FROM guild_settings")
-    cursor.execute("DELETE FROM allowlist")
-    cursor.execute("DELETE FROM playback_state")
+    settings_rows, allowlist_rows, playback_rows = [], [], []
 
     for guild_id, state in guild_states.items():
         player = state.music_player
-        settings = (guild_id, state.controller_channel_id, state.controller_message_id, state._24_7_mode, player.autoplay_enabled, player.volume)
-        cursor.execute("INSERT INTO guild_settings VALUES (?, ?, ?, ?, ?, ?)", settings)
+        settings_rows.append((guild_id, state.controller_channel_id, state.controller_message_id, state._24_7_mode, player.autoplay_enabled, player.volume))
 
         for channel_id in state.allowed_channels:
-            cursor.execute("INSERT INTO allowlist VALUES (?, ?)", (guild_id, channel_id))
+            allowlist_rows.append((guild_id, channel_id))
 
         if not player.voice_client or not player.voice_client.is_connected():
             continue
 
-        timestamp = 0
-        if player.playback_started_at:
-            timestamp = player.start_time + (time.time() - player.playback_started_at) * player.playback_speed
-        elif player.start_time > 0:
-            timestamp = player.start_time
-
-        state_data = (
-            guild_id,
-            player.voice_client.channel.id,
-            json.dumps(player.current_info) if player.current_info else None,
-            json.dumps(list(player.queue._queue)) if not player.queue.empty() else None,
-            json.dumps(player.history),
-            json.dumps(player.radio_playlist),
-            player.loop_current,
-            timestamp,
+        timestamp = player.get_position()
+
+        playback_rows.append(
+            (
+                guild_id,
+                player.voice_client.channel.id,
+                json.dumps(with_media_key(player.current_info)) if player.current_info else None,
+                json.dumps([with_media_key(track) for track in player.queue._queue]) if not player.queue.empty() else None,
+                json.dumps([with_media_key(track) for track in player.history]),
+                json.dumps([with_media_key(track) for track in player.radio_playlist]),
+                player.loop_current,
+                timestamp,
+            )
         )
-        cursor.execute("INSERT INTO playback_state VALUES (?, ?, ?, ?, ?, ?, ?, ?)", state_data)
 
-    conn.commit()
-    conn.close()
+    # The database write waits on other processes' locks, so it stays off the event loop.
+    await asyncio.to_thread(write_all_states, owned_guilds_filter(), settings_rows, allowlist_rows, playback_rows)
     logger.info("State save completed successfully.")
 
 
 async def load_states_on_startup():
     """Load the state of servers from the database on startup and attempt to resume playback."""
     logger.info("Loading states from the database...")
-    conn = sqlite3.connect("playify_state.db")
+    conn = get_db_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
 
-    cursor.execute("SELECT * FROM guild_settings")
+    owned_condition, owned_params = owned_guilds_filter()
+    cursor.execute(f"SELECT * FROM guild_settings WHERE {owned_condition}", owned_params)
     for row in cursor.fetchall():
         guild_id = row["guild_id"]
         state = get_guild_state(guild_id)
@@ -512,12 +1091,12 @@ async def load_states_on_startup():
         player.autoplay_enabled = row["autoplay"]
         player.volume = row["volume"]
 
-    cursor.execute("SELECT * FROM allowlist")
+    cursor.execute(f"SELECT * FROM allowlist WHERE {owned_condition}", owned_params)
     for row in cursor.fetchall():
         state = get_guild_state(row["guild_id"])
         state.allowed_channels.add(row["channel_id"])
 
-    cursor.execute("SELECT * FROM playback_state")
+    cursor.execute(f"SELECT * FROM playback_state WHERE {owned_condition}", owned_params)
     for row in cursor.fetchall():
         guild_id = row["guild_id"]
         guild = bot.get_guild(guild_id)
@@ -529,7 +1108,8 @@ async def load_states_on_startup():
         try:
             player.current_info = json.loads(row["current_song_json"]) if row["current_song_json"] else None
             player.history = json.loads(row["history_json"]) if row["history_json"] else []
-            player.radio_playlist = json.loads(row["radio_playlist_json"]) if row["radio_playlist_json"] else []
+            player.radio_playlist = RadioPlaylist(json.loads(row["radio_playlist_json"]) if row["radio_playlist_json"] else [])
+            player.radio_playlist.sync_to(player.current_info)
             player.loop_current = row["loop_current"]
 
             queue_items = json.loads(row["queue_json"]) if row["queue_json"] else []
@@ -584,6 +1164,68 @@ async def load_states_on_startup():
         return track_info  # Return as is if type is unknown
 
 
+def collect_local_stats() -> dict:
+    """Stats of this process, per shard, as published to the shard_stats table."""
+    shards = {}
+    for shard_id, latency in bot.latencies:
+        shards[shard_id] = {"latency_ms": round(latency * 1000) if math.isfinite(latency) else None, "servers": 0, "users": 0, "active_players": 0, "queued_songs": 0}
+    for guild in bot.guilds:
+        shard = shards.setdefault(guild.shard_id, {"latency_ms": None, "servers": 0, "users": 0, "active_players": 0, "queued_songs": 0})
+        shard["servers"] += 1
+        shard["users"] += guild.member_count or 0
+    for guild_id, state in guild_states.items():
+        shard = shards.get(get_shard_id(guild_id))
+        if shard:
+            shard["active_players"] += 1
+            shard["queued_songs"] += state.music_player.queue.qsize()
+    return {
+        "pid": os.getpid(),
+        "shards": shards,
+        "ffmpeg_processes": ffmpeg_active.labels().value,
+        "rss_bytes": process_rss.labels().value,
+    }
+
+
+def get_process_key() -> str:
+    return "shards:" + ",".join(str(shard_id) for shard_id in sorted(bot.shards)) if bot.shards else "shards:all"
+
+
+def publish_shard_stats(stats: dict):
+    conn = get_db_connection()
+    conn.execute("INSERT OR REPLACE INTO shard_stats VALUES (?, ?, ?)", (get_process_key(), json.dumps(stats), time.time()))
+    conn.commit()
+    conn.close()
+
+
+def read_all_shard_stats(local_stats: dict) -> list:
+    """Latest stats of every live shard process, with this process' own entry taken live."""
+    conn = get_db_connection()
+    rows = conn.execute("SELECT process_key, stats_json FROM shard_stats WHERE updated_at >= ?", (time.time() - 3 * SHARD_STATS_INTERVAL,)).fetchall()
+    conn.close()
+    own_key = get_process_key()
+    return [local_stats] + [json.loads(stats_json) for process_key, stats_json in rows if process_key != own_key]
+
+
+async def shard_stats_loop():
+    """Periodically publishes this process' stats so /status on any shard can aggregate them."""
+    while not bot.is_closed():
+        try:
+            await asyncio.to_thread(publish_shard_stats, collect_local_stats())
+        except Exception as e:
+            logger.error(f"Error publishing shard stats: {e}")
+        await asyncio.sleep(SHARD_STATS_INTERVAL)
+
+
+shard_stats_task = None
+
+
+def start_shard_stats_loop():
+    """Starts shard_stats_loop once: on_ready fires again after every gateway reconnect."""
+    global shard_stats_task
+    if shard_stats_task is None or shard_stats_task.done():
+        shard_stats_task = asyncio.create_task(shard_stats_loop())
+
+
 # --- UPDATED CLASS FOR LAZY PLAYLIST MANAGEMENT ---
 class LazySearchItem:
     """
@@ -631,7 +1273,7 @@ class LazySearchItem:
             try:
                 search_query = f"{search_prefix}{sanitize_query(search_term)}"
 
-                info = await fetch_video_info_with_retry(search_query, {"noplaylist": True, "extract_flat": True})
+                info = await fetch_video_info_with_retry(search_query, {"noplaylist": True, "extract_flat": True}, profile="flat")
 
                 entries = info.get("entries")
                 if not entries:
@@ -649,7 +1291,21 @@ class LazySearchItem:
                     logger.info(f"[LazyResolve] Using first result from {platform_name}.")
                     best_video_info = entries[0]
 
-                full_video_info = await fetch_video_info_with_retry(best_video_info["url"], {"noplaylist": True})
+                # Results known to be dead (private, removed...) are skipped in favor of the next ones.
+                candidates = [best_video_info] + [video for video in entries if video is not best_video_info]
+                candidates = [video for video in candidates if video.get("url") and not negative_cache.get(video["url"])]
+                if not candidates:
+                    raise ValueError(f"All results on {platform_name} are known to be unavailable.")
+
+                full_video_info = None
+                for candidate in candidates:
+                    try:
+                        full_video_info = await fetch_video_info_with_retry(candidate["url"], {"noplaylist": True})
+                        break
+                    except yt_dlp.utils.DownloadError as e:
+                        if classify_yt_dlp_error(str(e)) not in TERMINAL_ERROR_CLASSES or candidate is candidates[-1]:
+                            raise
+                        logger.info(f"[LazyResolve] '{candidate.get('title')}' is unavailable, trying the next result.")
 
                 full_video_info["requester"] = self.requester
                 full_video_info["original_platform"] = self.original_platform
@@ -707,20 +1363,10 @@ class JumpToSelect(discord.ui.Select):
         selected_index = int(self.values[0])
 
         async with music_player.queue_lock:
-            queue_list = list(music_player.queue._queue)
-            if not 0 <= selected_index < len(queue_list):
+            # Queued tracks first, then (24/7 normal mode) the rotation: numbered like /queue.
+            if jump_to_upcoming(guild_id, selected_index) is None:
                 return await interaction.response.defer()
-
-            tracks_to_skip = queue_list[:selected_index]
-            music_player.history.extend(tracks_to_skip)
-            logger.info(f"[{guild_id}] JumpTo: Added {len(tracks_to_skip)} skipped tracks to history.")
-
-            new_queue_list = queue_list[selected_index:]
-
-            new_queue = asyncio.Queue()
-            for item in new_queue_list:
-                await new_queue.put(item)
-            music_player.queue = new_queue
+            logger.info(f"[{guild_id}] JumpTo: Added {selected_index} skipped tracks to history.")
 
         await interaction.response.defer()
         await interaction.delete_original_response()
@@ -729,7 +1375,39 @@ class JumpToSelect(discord.ui.Select):
         await safe_stop(vc)
 
 
-class JumpToView(View):
+class HydratedPagesMixin:
+    """
+    Background hydration of the visible page for the paginated views (/queue, /jumpto, /remove).
+    The view provides current_page, items_per_page and message; the tracks default to
+    all_tracks and the redraw to update_view() + a view edit.
+    """
+
+    def hydrated_tracks(self) -> list:
+        return self.all_tracks
+
+    async def redraw_hydrated_page(self):
+        await self.update_view()
+        await self.message.edit(view=self)
+
+    def hydrate_current_page(self):
+        """Hydrates the current page (and pre-hydrates the next one) in the background, then redraws."""
+        tracks = self.hydrated_tracks()
+        start_index = self.current_page * self.items_per_page
+        end_index = start_index + self.items_per_page
+        page_number = self.current_page
+
+        async def redraw():
+            if self.is_finished() or self.current_page != page_number or not self.message:
+                return
+            try:
+                await self.redraw_hydrated_page()
+            except discord.HTTPException as e:
+                logger.warning(f"{type(self).__name__}: Failed to redraw page {page_number + 1} after hydration: {e}")
+
+        page_hydrator.hydrate_page(tracks[start_index:end_index], tracks[end_index : end_index + self.items_per_page], on_hydrated=redraw)
+
+
+class JumpToView(HydratedPagesMixin, View):
     """The interactive view for the /jumpto command, with pagination."""
 
     def __init__(self, interaction: discord.Interaction, all_tracks: list):
@@ -740,27 +1418,16 @@ class JumpToView(View):
         self.current_page = 0
         self.items_per_page = 25
         self.total_pages = math.ceil(len(self.all_tracks) / self.items_per_page) if self.all_tracks else 1
+        self.message = None
 
     async def update_view(self):
-        """Asynchronously hydrates tracks for the current page and rebuilds components."""
+        """Rebuilds components for the current page using the metadata known right now."""
         self.clear_items()
 
         start_index = self.current_page * self.items_per_page
         end_index = start_index + self.items_per_page
         tracks_on_page = self.all_tracks[start_index:end_index]
 
-        tracks_to_hydrate = [t for t in tracks_on_page if isinstance(t, dict) and (not t.get("title") or t.get("title") == "Unknown Title")]
-
-        if tracks_to_hydrate:
-            # Minor log correction
-            logger.info(f"JumpToView: Hydrating {len(tracks_to_hydrate)} tracks for page {self.current_page + 1}")
-            tasks = [fetch_meta(track["url"], None) for track in tracks_to_hydrate]
-            hydrated_results = await asyncio.gather(*tasks)
-            hydrated_map = {res["url"]: res for res in hydrated_results if res}
-            for track in tracks_on_page:
-                if isinstance(track, dict) and track["url"] in hydrated_map:
-                    track["title"] = hydrated_map[track["url"]].get("title", "Unknown Title")
-
         # We make sure to add the correct select menu.
         self.add_item(JumpToSelect(tracks_on_page, page_offset=start_index, guild_id=self.guild_id))
 
@@ -780,6 +1447,7 @@ class JumpToView(View):
             self.current_page -= 1
         await self.update_view()
         await interaction.edit_original_response(view=self)
+        self.hydrate_current_page()
 
     async def next_page(self, interaction: discord.Interaction):
         await interaction.response.defer()
@@ -787,6 +1455,7 @@ class JumpToView(View):
             self.current_page += 1
         await self.update_view()
         await interaction.edit_original_response(view=self)
+        self.hydrate_current_page()
 
 
 class MusicControllerView(View):
@@ -882,11 +1551,7 @@ class MusicControllerView(View):
             music_player.is_seeking, music_player.seek_info = True, 0
             await safe_stop(vc)
             return await interaction.response.defer()
-        RESTART_THRESHOLD, current_playback_time = 5, 0
-        if vc.is_playing() and music_player.playback_started_at:
-            current_playback_time = music_player.start_time + ((time.time() - music_player.playback_started_at) * music_player.playback_speed)
-        elif vc.is_paused():
-            current_playback_time = music_player.start_time
+        RESTART_THRESHOLD, current_playback_time = 5, music_player.get_position()
         if current_playback_time > RESTART_THRESHOLD:
             music_player.is_seeking, music_player.seek_info = True, 0
             await safe_stop(vc)
@@ -946,6 +1611,7 @@ class MusicControllerView(View):
             vc.resume()
             if music_player.playback_started_at is None:
                 music_player.playback_started_at = time.time()
+            get_guild_state(interaction.guild_id).seek_panels.wake()
         else:
             vc.pause()
             if music_player.playback_started_at:
@@ -1029,6 +1695,7 @@ class MusicControllerView(View):
     async def autoplay_button(self, interaction: discord.Interaction, button: Button):
         music_player = get_player(interaction.guild_id)
         music_player.autoplay_enabled = not music_player.autoplay_enabled
+        autoplay_engine.toggled(interaction.guild_id)
         await update_controller(self.bot, interaction.guild_id)
         await interaction.response.defer()
 
@@ -1037,7 +1704,7 @@ class MusicControllerView(View):
         music_player, vc = get_player(interaction.guild_id), interaction.guild.voice_client
         new_volume = max(0, music_player.volume - 0.1)
         music_player.volume = new_volume
-        if vc and vc.source and isinstance(vc.source, discord.PCMVolumeTransformer):
+        if vc and vc.source and isinstance(vc.source, VolumeSource):
             vc.source.volume = new_volume
         await update_controller(self.bot, interaction.guild_id)
         await interaction.response.defer()
@@ -1047,7 +1714,7 @@ class MusicControllerView(View):
         music_player, vc = get_player(interaction.guild_id), interaction.guild.voice_client
         new_volume = min(2.0, music_player.volume + 0.1)
         music_player.volume = new_volume
-        if vc and vc.source and isinstance(vc.source, discord.PCMVolumeTransformer):
+        if vc and vc.source and isinstance(vc.source, VolumeSource):
             vc.source.volume = new_volume
         await update_controller(self.bot, interaction.guild_id)
         await interaction.response.defer()
@@ -1122,12 +1789,8 @@ async def create_controller_embed(bot, guild_id):
 
     queue_snapshot = []
     if is_24_7_normal and music_player.radio_playlist:
-        current_url = music_player.current_info.get("url") if music_player.current_info else None
-        try:
-            current_index = [t.get("url") for t in music_player.radio_playlist].index(current_url)
-            queue_snapshot = music_player.radio_playlist[current_index + 1 :] + music_player.radio_playlist[:current_index]
-        except (ValueError, IndexError):
-            queue_snapshot = list(music_player.queue._queue)
+        # Tracks queued by users play first, then the rotation continues after the cursor.
+        queue_snapshot = music_player.radio_playlist.window(head=list(music_player.queue._queue))
     else:
         queue_snapshot = list(music_player.queue._queue)
 
@@ -1139,12 +1802,10 @@ async def create_controller_embed(bot, guild_id):
 
     tracks_to_hydrate = [t for t in tracks_to_display if isinstance(t, dict) and (not t.get("duration", 0) > 0 or "video #" in t.get("title", ""))]
     if tracks_to_hydrate:
-        tasks = [fetch_meta(track["url"], None) for track in tracks_to_hydrate]
-        hydrated_results = await asyncio.gather(*tasks)
-        hydrated_map = {res["url"]: res for res in hydrated_results if res}
+        hydrated_map = await fetch_meta_many([track.get("url") for track in tracks_to_hydrate])
         for track in tracks_to_display:
-            if isinstance(track, dict) and track.get("url") in hydrated_map:
-                track.update(hydrated_map[track["url"]])
+            if isinstance(track, dict) and track.get("url") and get_media_key(track["url"]) in hydrated_map:
+                track.update(hydrated_map[get_media_key(track["url"])])
 
     next_song_text = get_messages("controller.nothing_next.title")
 
@@ -1213,7 +1874,7 @@ async def create_controller_embed(bot, guild_id):
     if music_player.current_info:
         source_type = music_player.current_info.get("source_type")
 
-        url = music_player.current_info.get("webpage_url", "").lower()
+        source_platform = classify(music_player.current_info.get("webpage_url", "")).platform
         original_platform = music_player.current_info.get("original_platform")
 
         if original_platform:
@@ -1223,14 +1884,10 @@ async def create_controller_embed(bot, guild_id):
             platform_display_name = get_messages(platform_key)
             dynamic_footer_info = get_messages("controller.footer.source", platform=platform_display_name)
 
-        elif "youtube.com" in url or "youtu.be" in url:
+        elif source_platform in YOUTUBE_PLATFORMS:
             dynamic_footer_info = get_messages("controller.footer.youtube_source")
-        elif "soundcloud.com" in url:
-            dynamic_footer_info = get_messages("controller.footer.soundcloud_source")
-        elif "twitch.tv" in url:
-            dynamic_footer_info = get_messages("controller.footer.twitch_source")
-        elif "bandcamp.com" in url:
-            dynamic_footer_info = get_messages("controller.footer.bandcamp_source")
+        elif source_platform in ("soundcloud", "twitch", "bandcamp"):
+            dynamic_footer_info = get_messages(f"controller.footer.{source_platform}_source")
         else:
             ping_ms = round(bot.latency * 1000)
             dynamic_footer_info = get_messages("controller.footer.ping", ping_ms=ping_ms)
@@ -1282,6 +1939,7 @@ async def update_controller(bot, guild_id, interaction: Optional[discord.Interac
             # Scénario 1 : On répond directement à une commande.
             # On transforme le message "réfléchit..." en nouveau contrôleur.
             await interaction.edit_original_response(content=None, embed=embed, view=view)
+            controller_updates.labels("interaction").inc()
             message = await interaction.original_response()
 
             # Si un ancien message de contrôleur existe, on le supprime pour éviter les doublons.
@@ -1303,19 +1961,244 @@ async def update_controller(bot, guild_id, interaction: Optional[discord.Interac
                 try:
                     message = await channel.fetch_message(message_id)
                     await message.edit(embed=embed, view=view)
+                    controller_updates.labels("edit").inc()
                 except (discord.NotFound, discord.Forbidden):
                     # Le message a été supprimé, on en crée un nouveau.
                     new_message = await channel.send(embed=embed, view=view, silent=True)
+                    controller_updates.labels("send").inc()
                     get_guild_state(guild_id).controller_message_id = new_message.id
             else:
                 # Pas d'ID de message stocké, on en crée un nouveau.
                 new_message = await channel.send(embed=embed, view=view, silent=True)
+                controller_updates.labels("send").inc()
                 get_guild_state(guild_id).controller_message_id = new_message.id
 
     except Exception as e:
+        controller_updates.labels("error").inc()
         logger.error(f"Failed to update controller for guild {guild_id}: {e}", exc_info=True)
 
 
+class VolumeSource(discord.AudioSource):
+    """
+    Replacement for discord.PCMVolumeTransformer. At unity gain frames pass through
+    untouched; otherwise the 16-bit samples are scaled with NumPy into preallocated
+    buffers (audioop when NumPy is missing). A volume change is ramped over one frame
+    so live updates from /volume and the buttons don't click.
+    """
+
+    SAMPLES_PER_FRAME = 960 * 2  # 20ms of 48kHz stereo: 960 samples per channel
+    MAX_VOLUME = 2.0
+
+    def __init__(self, original: discord.AudioSource, volume: float = 1.0):
+        if original.is_opus():
+            raise discord.ClientException("VolumeSource expects a PCM source.")
+        self.original = original
+        self._volume = self._applied_volume = max(0.0, min(volume, self.MAX_VOLUME))
+        if np is not None:
+            self._allocate(self.SAMPLES_PER_FRAME)
+
+    def _allocate(self, samples: int):
+        self.scaled = np.empty(samples, dtype=np.float32)
+        self.output = np.empty(samples, dtype=np.int16)
+        # 0 -> 1 across the frame, identical for the two channels of a sample.
+        self.ramp = np.repeat(np.linspace(0.0, 1.0, samples // 2, dtype=np.float32), 2)
+
+    @property
+    def volume(self) -> float:
+        return self._volume
+
+    @volume.setter
+    def volume(self, value: float):
+        self._volume = max(0.0, min(value, self.MAX_VOLUME))
+
+    def is_opus(self) -> bool:
+        return False
+
+    def cleanup(self):
+        self.original.cleanup()
+
+    def read(self) -> bytes:
+        frame = self.original.read()
+        start, end = self._applied_volume, self._volume
+        self._applied_volume = end
+        if not frame or (start == 1.0 and end == 1.0):
+            return frame
+        if np is None:
+            return audioop.mul(frame, 2, end)
+        samples = np.frombuffer(frame, dtype=np.int16)
+        if samples.size != self.scaled.size:
+            # Only a short frame (e.g. the tail of a stream) gets here; size the buffers to it.
+            self._allocate(samples.size)
+        if start == end:
+            np.multiply(samples, np.float32(end), out=self.scaled)
+        else:
+            np.multiply(self.ramp, np.float32(end - start), out=self.scaled)
+            self.scaled += np.float32(start)
+            self.scaled *= samples
+        np.clip(self.scaled, -32768, 32767, out=self.scaled)
+        self.output[:] = self.scaled
+        return self.output.tobytes()
+
+
+class PlaybackClock(discord.AudioSource):
+    """
+    Pass-through source that counts the 20ms frames handed to the voice client.
+    position = offset (where playback started) + frames sent * frame length * speed.
+    """
+
+    FRAME_SECONDS = 0.02
+
+    def __init__(self, original: discord.AudioSource, offset: float = 0, speed: float = 1.0):
+        self.original = original
+        self.offset = offset
+        self.speed = speed
+        self.frames = 0
+
+    @property
+    def position(self) -> float:
+        return self.offset + self.frames * self.FRAME_SECONDS * self.speed
+
+    def reset(self, offset: float):
+        """Restarts the count at `offset`, after an in-place seek."""
+        self.frames = 0
+        self.offset = offset
+
+    def is_opus(self) -> bool:
+        return self.original.is_opus()
+
+    def read(self) -> bytes:
+        frame = self.original.read()
+        if frame:
+            self.frames += 1
+        return frame
+
+    def cleanup(self):
+        self.original.cleanup()
+
+
+class BufferedSeekableSource(discord.AudioSource):
+    """
+    Wraps the FFmpeg PCM source of the current track and keeps a rolling buffer of decoded
+    frames around the play head: the last HISTORY_SECONDS that were played and up to
+    AHEAD_SECONDS decoded in advance by a reader thread. Seeks that land inside this
+    window just move frames between the two buffers, without restarting FFmpeg.
+    At most SEEK_BUFFER_MAX_PLAYERS buffers exist at once (see available()).
+    """
+
+    FRAMES_PER_SECOND = 50  # discord.py sends 20ms frames
+    HISTORY_SECONDS = SEEK_BUFFER_HISTORY_SECONDS
+    AHEAD_SECONDS = SEEK_BUFFER_AHEAD_SECONDS
+    active = 0
+    active_lock = threading.Lock()
+
+    @classmethod
+    def available(cls) -> bool:
+        """False once SEEK_BUFFER_MAX_PLAYERS buffers are alive: the next track plays unbuffered."""
+        return cls.active < SEEK_BUFFER_MAX_PLAYERS and cls.AHEAD_SECONDS > 0
+
+    def __init__(self, original: discord.AudioSource):
+        with self.active_lock:
+            BufferedSeekableSource.active += 1
+        self.original = original
+        self.history = deque(maxlen=self.HISTORY_SECONDS * self.FRAMES_PER_SECOND)
+        self.ahead = deque()
+        self.condition = threading.Condition()
+        self.reader = None
+        self.eof = False
+        self.closed = False
+
+    def is_opus(self) -> bool:
+        return False
+
+    def _fill(self):
+        """Reader thread: decodes ahead of the play head until the look-ahead buffer is full."""
+        max_ahead = self.AHEAD_SECONDS * self.FRAMES_PER_SECOND
+        while True:
+            with self.condition:
+                while len(self.ahead) >= max_ahead and not self.closed:
+                    self.condition.wait()
+                if self.closed:
+                    return
+            try:
+                frame = self.original.read()
+            except Exception:
+                frame = b""
+            with self.condition:
+                if frame:
+                    self.ahead.append(frame)
+                else:
+                    self.eof = True
+                self.condition.notify_all()
+                if not frame:
+                    return
+
+    def read(self) -> bytes:
+        if self.reader is None:
+            self.reader = threading.Thread(target=self._fill, name="seek-buffer-reader", daemon=True)
+            self.reader.start()
+        with self.condition:
+            while not self.ahead and not self.eof and not self.closed:
+                self.condition.wait()
+            if not self.ahead:
+                return b""
+            frame = self.ahead.popleft()
+            self.history.append(frame)
+            self.condition.notify_all()
+            return frame
+
+    def seek_relative(self, seconds: float) -> bool:
+        """Moves the play head by `seconds` if the target is buffered. Returns False if it isn't."""
+        frames = int(round(seconds * self.FRAMES_PER_SECOND))
+        with self.condition:
+            if frames < 0:
+                if -frames > len(self.history):
+                    return False
+                for _ in range(-frames):
+                    self.ahead.appendleft(self.history.pop())
+            elif frames > 0:
+                if frames > len(self.ahead):
+                    return False
+                for _ in range(frames):
+                    self.history.append(self.ahead.popleft())
+            self.condition.notify_all()
+        return True
+
+    def cleanup(self):
+        with self.condition:
+            was_closed, self.closed = self.closed, True
+            self.ahead.clear()
+            self.history.clear()
+            self.condition.notify_all()
+        if not was_closed:
+            with self.active_lock:
+                BufferedSeekableSource.active -= 1
+        self.original.cleanup()
+
+
+def seek_current_track(guild_id: int, target_seconds: float, current_seconds: float):
+    """
+    Seeks the current track. Served instantly from the seek buffer when the target is
+    inside it; otherwise FFmpeg is restarted at the target (see after_playing / play_audio).
+    """
+    music_player = get_player(guild_id)
+    buffered = music_player.seekable_source
+    vc = music_player.voice_client
+    clock = music_player.playback_clock
+    if buffered and clock and vc and vc.source is not None and getattr(vc.source, "original", None) is clock and clock.original is buffered:
+        if buffered.seek_relative(target_seconds - current_seconds):
+            logger.info(f"[{guild_id}] Instant seek to {target_seconds:.1f}s from the seek buffer.")
+            clock.reset(target_seconds)
+            music_player.start_time = target_seconds
+            if vc.is_playing():
+                music_player.playback_started_at = time.time()
+            get_guild_state(guild_id).seek_panels.wake()
+            return
+
+    music_player.is_seeking = True
+    music_player.seek_info = target_seconds
+    vc.stop()
+
+
 # --- Discord UI Classes (Views & Modals) ---
 
 
@@ -1335,17 +2218,93 @@ class SeekModal(discord.ui.Modal):
             await interaction.response.send_message(get_messages("seek.fail_invalid_time"), ephemeral=True, silent=SILENT_MESSAGES)
             return
 
-        self.music_player.is_seeking = True
-        self.music_player.seek_info = target_seconds
-        self.music_player.voice_client.stop()
+        seek_current_track(self.view.guild_id, target_seconds, self.view.get_current_time())
 
         await self.view.update_embed(interaction, jumped=True)
         # No need for interaction.response.send_message here as update_embed already handles it.
 
 
+class SeekPanelTicker:
+    """
+    Drives the background refresh of every open /seek panel of a guild with a single timer.
+    Each panel is only edited when its rendered progress bar would actually change
+    (or when its time display gets too stale), instead of on a fixed interval.
+    """
+
+    MIN_REFRESH_INTERVAL = 2  # Never edit a panel more often than this (seconds)
+    MAX_REFRESH_INTERVAL = 15  # Refresh the time display at least this often (seconds)
+    VISIBLE_MESSAGE_LIMIT = 10  # A panel with this many newer messages below it is considered out of view
+
+    def __init__(self, guild_id: int):
+        self.guild_id = guild_id
+        self.panels = set()
+        self.task = None
+
+    def add(self, panel):
+        self.panels.add(panel)
+        self.wake()
+
+    def discard(self, panel):
+        self.panels.discard(panel)
+        if not self.panels and self.task and not self.task.done():
+            self.task.cancel()
+
+    def wake(self):
+        """Marks every panel as due and (re)starts the shared timer, e.g. after a resume, seek or track change."""
+        for panel in self.panels:
+            panel.next_refresh_at = 0
+        if self.task and not self.task.done():
+            self.task.cancel()
+        if self.panels:
+            self.task = asyncio.create_task(self.run())
+
+    def note_channel_message(self, channel_id: int):
+        """Called for every new message so panels that scrolled out of view stop refreshing."""
+        for panel in list(self.panels):
+            if panel.message and panel.message.channel.id == channel_id:
+                panel.messages_below += 1
+                if panel.messages_below >= self.VISIBLE_MESSAGE_LIMIT:
+                    logger.info(f"[{self.guild_id}] Seek panel scrolled out of view, stopping its refresh.")
+                    self.discard(panel)
+
+    async def run(self):
+        """Sleeps until the earliest panel is due, edits the due panels, and stops when playback is not running."""
+        try:
+            while self.panels:
+                vc = get_player(self.guild_id).voice_client
+                if not vc or not vc.is_playing():
+                    # Paused or stopped: nothing changes on screen, wake() re-arms us on resume.
+                    return
+
+                now = time.monotonic()
+                for panel in [p for p in self.panels if p.next_refresh_at <= now]:
+                    if panel.is_finished() or not panel.message:
+                        self.panels.discard(panel)
+                        continue
+                    try:
+                        await panel.update_embed()
+                        if panel.next_refresh_at <= now:
+                            # The panel didn't schedule itself: don't spin on it.
+                            panel.next_refresh_at = time.monotonic() + self.MAX_REFRESH_INTERVAL
+                    except discord.NotFound:
+                        # The message has been deleted, stop refreshing it
+                        self.panels.discard(panel)
+                    except discord.HTTPException as e:
+                        logger.warning(f"[{self.guild_id}] Failed to refresh seek panel: {e}")
+                        panel.next_refresh_at = time.monotonic() + self.MAX_REFRESH_INTERVAL
+
+                if not self.panels:
+                    return
+                next_refresh_at = min(p.next_refresh_at for p in self.panels)
+                await asyncio.sleep(max(0.0, next_refresh_at - time.monotonic()))
+        except asyncio.CancelledError:
+            pass
+
+
 class SeekView(View):
     REWIND_AMOUNT = 15
     FORWARD_AMOUNT = 15
+    BAR_LENGTH = 10
 
     def __init__(self, interaction: discord.Interaction):
         super().__init__(timeout=300.0)  # 5 minute timeout
@@ -1353,69 +2312,57 @@ class SeekView(View):
         self.guild_id = interaction.guild.id
         self.music_player = get_player(self.guild_id)
         self.message = None
-        self.update_task = None
+        self.next_refresh_at = 0
+        self.messages_below = 0
 
         # Apply button labels
         self.rewind_button.label = get_messages("seek.button.rewind")
         self.jump_button.label = get_messages("seek.button.jump_to")
         self.forward_button.label = get_messages("seek.button.forward")
 
-    async def start_update_task(self):
-        """Starts the background task to update the embed."""
-        if self.update_task is None or self.update_task.done():
-            self.update_task = asyncio.create_task(self.updater_loop())
-
-    async def updater_loop(self):
-        """Loop that updates the message at regular intervals."""
-        while not self.is_finished():
-            # CORRECTION 1: Delay reduced to 2 seconds for more fluidity
-            await asyncio.sleep(2)
-
-            # CORRECTION 2: Only updates if music is currently playing
-            # This handles pause/resume automatically
-            if self.music_player.voice_client and self.music_player.voice_client.is_playing():
-                # We make sure the message still exists before trying to edit it
-                if self.message:
-                    try:
-                        await self.update_embed()
-                    except discord.NotFound:
-                        # The message has been deleted, stop the task
-                        break
-
-    def get_current_time(self) -> int:
-        """Calculates the current playback position in seconds."""
-        # If the music is paused, return the last known position
-        if not self.music_player.voice_client.is_playing():
-            return self.music_player.start_time
+    def start_update_task(self):
+        """Registers the panel with the guild's shared refresh timer."""
+        get_guild_state(self.guild_id).seek_panels.add(self)
 
-        # Otherwise, calculate the live position
-        if self.music_player.playback_started_at:
-            elapsed = time.time() - self.music_player.playback_started_at
-            return self.music_player.start_time + (elapsed * self.music_player.playback_speed)
+    def schedule_next_refresh(self, current_pos: float, total_duration: int):
+        """Computes when the rendered panel will next change and stores it as the next refresh deadline."""
+        delay = SeekPanelTicker.MAX_REFRESH_INTERVAL
+        until_bar_change = seconds_until_progress_change(current_pos, total_duration, self.BAR_LENGTH)
+        if until_bar_change is not None:
+            delay = min(delay, until_bar_change / (self.music_player.playback_speed or 1.0))
+        delay = max(delay, SeekPanelTicker.MIN_REFRESH_INTERVAL)
+        self.next_refresh_at = time.monotonic() + delay
 
-        return self.music_player.start_time
+    def get_current_time(self) -> float:
+        """Current playback position in seconds."""
+        return self.music_player.get_position()
 
     async def update_embed(self, interaction: discord.Interaction = None, jumped: bool = False):
         """Updates the embed with the progress bar."""
-        current_pos = int(self.get_current_time())
+        exact_pos = self.get_current_time()
+        current_pos = int(exact_pos)
         # Make sure current_info is not None
         if not self.music_player.current_info:
+            # Nothing to render (e.g. the 24/7 silence source): check again later.
+            self.next_refresh_at = time.monotonic() + SeekPanelTicker.MAX_REFRESH_INTERVAL
             return
 
         total_duration = self.music_player.current_info.get("duration", 0)
 
         title = self.music_player.current_info.get("title", get_messages("player.unknown_title"))
 
-        progress_bar = create_progress_bar(current_pos, total_duration, self.guild_id)
+        progress_bar = create_progress_bar(current_pos, total_duration, self.guild_id, bar_length=self.BAR_LENGTH)
         time_display = f"**{format_duration(current_pos)} / {format_duration(total_duration)}**"
 
         embed = Embed(title=get_messages("seek_interface_title"), description=f"**{title}**\n\n{progress_bar} {time_display}", color=discord.Color.blue())
         embed.set_footer(text=get_messages("seek_interface_footer"))
 
+        self.schedule_next_refresh(exact_pos, total_duration)
+
         # If it's a response to a button interaction
         if interaction and not interaction.response.is_done():
             await interaction.response.edit_message(embed=embed, view=self)
-        # If it's an update from the background loop
+        # If it's an update from the background timer
         elif self.message:
             await self.message.edit(embed=embed, view=self)
 
@@ -1424,9 +2371,7 @@ class SeekView(View):
         current_time = self.get_current_time()
         target_seconds = max(0, current_time - self.REWIND_AMOUNT)
 
-        self.music_player.is_seeking = True
-        self.music_player.seek_info = target_seconds
-        self.music_player.voice_client.stop()
+        seek_current_track(self.guild_id, target_seconds, current_time)
         await self.update_embed(interaction, jumped=True)
 
     @discord.ui.button(style=ButtonStyle.primary, emoji="⏩", row=1)
@@ -1434,9 +2379,7 @@ class SeekView(View):
         current_time = self.get_current_time()
         target_seconds = current_time + self.FORWARD_AMOUNT
 
-        self.music_player.is_seeking = True
-        self.music_player.seek_info = target_seconds
-        self.music_player.voice_client.stop()
+        seek_current_track(self.guild_id, target_seconds, current_time)
         await self.update_embed(interaction, jumped=True)
 
     @discord.ui.button(style=ButtonStyle.secondary, emoji="✏️", row=2)
@@ -1445,8 +2388,7 @@ class SeekView(View):
         await interaction.response.send_modal(modal)
 
     async def on_timeout(self):
-        if self.update_task:
-            self.update_task.cancel()
+        get_guild_state(self.guild_id).seek_panels.discard(self)
         if self.message:
             for item in self.children:
                 item.disabled = True
@@ -1540,7 +2482,7 @@ class SearchView(View):
         self.add_item(SearchSelect(search_results, guild_id))
 
 
-class QueueView(View):
+class QueueView(HydratedPagesMixin, View):
     """
     A View that handles pagination for the /queue command.
     It's designed to be fast and intelligently fetches missing titles on-the-fly.
@@ -1615,21 +2557,7 @@ class QueueView(View):
             end_index = start_index + self.items_per_page
             tracks_on_page = self.tracks[start_index:end_index]
 
-            # This hydration part remains the same, it is correct.
-            tracks_to_hydrate = [
-                track for track in tracks_on_page if isinstance(track, dict) and (not track.get("title") or track.get("title") == "Unknown Title" or track.get("title") == get_messages("player.loading_placeholder"))
-            ]
-
-            if tracks_to_hydrate:
-                tasks = [fetch_meta(track["url"], None) for track in tracks_to_hydrate]
-                hydrated_results = await asyncio.gather(*tasks)
-                hydrated_map = {res["url"]: res for res in hydrated_results if res}
-                for track in tracks_on_page:
-                    if isinstance(track, dict) and track.get("url") in hydrated_map:
-                        new_data = hydrated_map[track["url"]]
-                        track["title"] = new_data.get("title", "Unknown Title")
-                        track["webpage_url"] = new_data.get("webpage_url", track["url"])
-
+            # Missing titles are filled in by hydrate_current_page(), we only render what is known.
             next_songs_list = []
             current_length = 0
             limit = 1000
@@ -1669,6 +2597,12 @@ class QueueView(View):
         self.previous_button.disabled = self.current_page == 0
         self.next_button.disabled = self.current_page >= self.total_pages - 1
 
+    def hydrated_tracks(self) -> list:
+        return self.tracks
+
+    async def redraw_hydrated_page(self):
+        await self.message.edit(embed=await self.create_queue_embed(), view=self)
+
     async def previous_button_callback(self, interaction: discord.Interaction):
         await interaction.response.defer()
         if self.current_page > 0:
@@ -1680,6 +2614,7 @@ class QueueView(View):
             await interaction.edit_original_response(embed=new_embed, view=self)
         except discord.errors.DiscordServerError as e:
             logger.warning(f"Failed to edit queue message (previous button) due to Discord API error: {e}")
+        self.hydrate_current_page()
 
     async def next_button_callback(self, interaction: discord.Interaction):
         await interaction.response.defer()
@@ -1692,6 +2627,7 @@ class QueueView(View):
             await interaction.edit_original_response(embed=new_embed, view=self)
         except discord.errors.DiscordServerError as e:
             logger.warning(f"Failed to edit queue message (next button) due to Discord API error: {e}")
+        self.hydrate_current_page()
 
 
 class RemoveSelect(discord.ui.Select):
@@ -1715,21 +2651,10 @@ class RemoveSelect(discord.ui.Select):
         state = get_guild_state(guild_id)
         music_player = state.music_player
 
-        indices_to_remove = sorted([int(v) for v in self.values], reverse=True)
-
-        queue_list = list(music_player.queue._queue)
-        removed_titles = []
-
-        for index in indices_to_remove:
-            if 0 <= index < len(queue_list):
-                removed_track = queue_list.pop(index)
-                removed_display_info = get_track_display_info(removed_track)
-                removed_titles.append(removed_display_info.get("title", get_messages("player.a_song_fallback")))
-
-        new_queue = asyncio.Queue()
-        for item in queue_list:
-            await new_queue.put(item)
-        music_player.queue = new_queue
+        # Queued tracks first, then (24/7 normal mode) the rotation: numbered like /queue.
+        async with music_player.queue_lock:
+            removed_tracks = remove_upcoming(guild_id, [int(v) for v in self.values])
+        removed_titles = [get_track_display_info(track).get("title", get_messages("player.a_song_fallback")) for track in removed_tracks]
 
         bot.loop.create_task(update_controller(bot, guild_id))
 
@@ -1740,7 +2665,7 @@ class RemoveSelect(discord.ui.Select):
         await interaction.channel.send(embed=embed, silent=SILENT_MESSAGES)
 
 
-class RemoveView(View):
+class RemoveView(HydratedPagesMixin, View):
     """The interactive view holding the dropdown and pagination buttons."""
 
     def __init__(self, interaction: discord.Interaction, all_tracks: list):
@@ -1751,6 +2676,7 @@ class RemoveView(View):
         self.current_page = 0
         self.items_per_page = 25
         self.total_pages = math.ceil(len(self.all_tracks) / self.items_per_page) if self.all_tracks else 1
+        self.message = None
 
     async def update_view(self):
         """Rebuilds the view with the correct dropdown and buttons for the current page."""
@@ -1759,16 +2685,6 @@ class RemoveView(View):
         end_index = start_index + self.items_per_page
         tracks_on_page = self.all_tracks[start_index:end_index]
 
-        tracks_to_hydrate = [t for t in tracks_on_page if isinstance(t, dict) and (not t.get("title") or t.get("title") == "Unknown Title")]
-
-        if tracks_to_hydrate:
-            tasks = [fetch_meta(track["url"], None) for track in tracks_to_hydrate]
-            hydrated_results = await asyncio.gather(*tasks)
-            hydrated_map = {res["url"]: res for res in hydrated_results if res}
-            for track in tracks_on_page:
-                if isinstance(track, dict) and track.get("url") in hydrated_map:
-                    track["title"] = hydrated_map[track["url"]].get("title", "Unknown Title")
-
         # We make sure to add the correct select menu.
         self.add_item(RemoveSelect(tracks_on_page, page_offset=start_index, guild_id=self.guild_id))
 
@@ -1786,6 +2702,7 @@ class RemoveView(View):
             self.current_page -= 1
         await self.update_view()
         await interaction.edit_original_response(view=self)
+        self.hydrate_current_page()
 
     async def next_page(self, interaction: discord.Interaction):
         await interaction.response.defer()
@@ -1793,6 +2710,7 @@ class RemoveView(View):
             self.current_page += 1
         await self.update_view()
         await interaction.edit_original_response(view=self)
+        self.hydrate_current_page()
 
 
 # ==============================================================================
@@ -1849,65 +2767,142 @@ def get_track_display_info(track, guild_id: int = None) -> dict:
 # --- General & State Helpers ---
 
 
-async def fetch_video_info_with_retry(query: str, ydl_opts_override=None):
+class CookieHealthTracker:
     """
-    Fetches video info using yt-dlp, with a robust retry mechanism for age-restricted content.
-    This is the new universal function for all online fetching.
+    Keeps a health score per cookie file (success rate, last failure reason, cooldown)
+    so that retries start with the healthiest cookie and skip the ones that keep failing.
     """
-    base_ydl_opts = {
-        "format": "bestaudio[acodec=opus]/bestaudio/best",
-        "quiet": True,
-        "no_warnings": True,
-        "no_color": True,
-        "socket_timeout": 15,
-        "concurrent_fragments": 4,
-    }
-    ydl_opts = {**base_ydl_opts, **(ydl_opts_override or {})}
 
-    try:
-        # First attempt: no cookies
-        logger.info(f"Fetching info for '{query[:100]}' (no cookies).")
-        return await run_ydl_with_low_priority(ydl_opts, query)
-    except yt_dlp.utils.DownloadError as e:
-        error_str = str(e).lower()
-        # Check for age restriction errors
-        if "sign in to confirm your age" in error_str or "age-restricted" in error_str:
-            logger.warning(f"Age restriction detected for '{query[:100]}'. Retrying with cookies.")
+    MAX_ATTEMPTS = 2  # Cookie files tried at most for a single extraction
+    BASE_COOLDOWN = 60  # Seconds, doubled for each consecutive failure
+    MAX_COOLDOWN = 1800
+
+    def __init__(self, cookie_files: list):
+        self.stats = {name: {"successes": 0, "failures": 0, "consecutive_failures": 0, "last_failure": None, "cooldown_until": 0.0} for name in cookie_files}
+
+    def score(self, name: str) -> float:
+        """Smoothed success rate, so a fresh cookie starts at 50% instead of 0% or 100%."""
+        stats = self.stats[name]
+        return (stats["successes"] + 1) / (stats["successes"] + stats["failures"] + 2)
+
+    def ranked(self) -> list:
+        """Returns the existing cookie files that are not cooling down, healthiest first."""
+        now = time.time()
+        candidates = [name for name, stats in self.stats.items() if stats["cooldown_until"] <= now and os.path.exists(get_cookie_path(name))]
+        random.shuffle(candidates)  # Spread the load between cookies with the same score
+        return sorted(candidates, key=self.score, reverse=True)
+
+    def record_success(self, name: str):
+        stats = self.stats[name]
+        stats["successes"] += 1
+        stats["consecutive_failures"] = 0
+        stats["cooldown_until"] = 0.0
+
+    def record_failure(self, name: str, reason: str):
+        stats = self.stats[name]
+        stats["failures"] += 1
+        stats["consecutive_failures"] += 1
+        stats["last_failure"] = reason
+        cooldown = min(self.BASE_COOLDOWN * 2 ** (stats["consecutive_failures"] - 1), self.MAX_COOLDOWN)
+        stats["cooldown_until"] = time.time() + cooldown
+        logger.warning(f"Cookie '{name}' failed ({reason}), cooling down for {cooldown}s.")
+
+    def summary(self) -> str:
+        """Human-readable health report used by /status."""
+        now = time.time()
+        lines = []
+        for name, stats in self.stats.items():
+            if not os.path.exists(get_cookie_path(name)):
+                continue
+            cooldown_left = int(stats["cooldown_until"] - now)
+            lines.append(
+                get_messages(
+                    "status.cookies.line",
+                    name=name,
+                    score=round(self.score(name) * 100),
+                    successes=stats["successes"],
+                    attempts=stats["successes"] + stats["failures"],
+                    last_failure=stats["last_failure"] or "-",
+                    cooldown=f"{cooldown_left}s" if cooldown_left > 0 else "-",
+                )
+            )
+        return "\n".join(lines) if lines else get_messages("status.cookies.none")
 
-            cookies_to_try = AVAILABLE_COOKIES.copy()
-            random.shuffle(cookies_to_try)  # Shuffle to distribute load/bans
 
-            for cookie_name in cookies_to_try:
-                try:
-                    logger.info(f"Retrying with cookie: {cookie_name}")
-                    return await run_ydl_with_low_priority(ydl_opts, query, specific_cookie_file=cookie_name)
-                except Exception as cookie_e:
-                    logger.warning(f"Cookie '{cookie_name}' failed: {str(cookie_e)[:150]}")
-                    continue  # Try the next cookie
-
-            # If all cookies failed, re-raise the original error
-            logger.error(f"All cookies failed for age-restricted content: '{query[:100]}'")
-            raise e
-        else:
-            logger.warning(f"Error detected for '{query[:100]}'. Retrying with cookies.")
+def get_cookie_path(cookie_name: str) -> str:
+    """Cookie files live next to the script."""
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), cookie_name)
 
-            cookies_to_try = AVAILABLE_COOKIES.copy()
-            random.shuffle(cookies_to_try)  # Shuffle to distribute load/bans
 
-            for cookie_name in cookies_to_try:
-                try:
-                    logger.info(f"Retrying with cookie: {cookie_name}")
-                    return await run_ydl_with_low_priority(ydl_opts, query, specific_cookie_file=cookie_name)
-                except Exception as cookie_e:
-                    logger.warning(f"Cookie '{cookie_name}' failed: {str(cookie_e)[:150]}")
-                    continue  # Try the next cookie
+cookie_health = CookieHealthTracker(AVAILABLE_COOKIES)
 
-            # If all cookies failed, re-raise the original error
-            logger.error(f"All cookies content: '{query[:100]}'")
-            raise e
 
+async def fetch_video_info_with_retry(query: str, ydl_opts_override=None, profile: str = "playback"):
+    """
+    Fetches video info using yt-dlp, with a retry mechanism using cookies.
+    The error is classified first: terminal errors (private, unavailable) are never retried,
+    other errors are retried with at most CookieHealthTracker.MAX_ATTEMPTS cookies, healthiest first.
+    This is the new universal function for all online fetching.
+    `profile` (playback, search, flat) labels the extraction latency metric.
+    """
+    ydl_opts = {**PLAYBACK_YDL_OPTS, **(ydl_opts_override or {})}
 
-def format_duration(seconds: int) -> str:
+    # Searches are not cached: only direct links identify a piece of media.
+    is_media_url = bool(re.match(r"https?://", query))
+    if is_media_url:
+        known_failure = negative_cache.get(query)
+        if known_failure:
+            logger.info(f"Known {known_failure['error_class']} failure for '{query[:100]}' (negative cache). Not fetching.")
+            raise yt_dlp.utils.DownloadError(known_failure["message"])
+
+    try:
+        # First attempt: no cookies
+        logger.info(f"Fetching info for '{query[:100]}' (no cookies).")
+        return await run_ydl_with_low_priority(ydl_opts, query, profile=profile)
+    except yt_dlp.utils.DownloadError as e:
+        error_class = classify_yt_dlp_error(str(e))
+
+        if error_class in TERMINAL_ERROR_CLASSES:
+            logger.warning(f"Terminal error ({error_class}) for '{query[:100]}'. Not retrying with cookies.")
+            if is_media_url:
+                negative_cache.add(query, error_class, str(e))
+            raise
+
+        # Other classes (age restriction, bot checks...) may be fixed by cookies: they are
+        # only cached once the cookie retries below have failed too.
+        cookies_to_try = cookie_health.ranked()[: CookieHealthTracker.MAX_ATTEMPTS]
+        if not cookies_to_try:
+            logger.error(f"Error ({error_class}) for '{query[:100]}' and no healthy cookie is available.")
+            if is_media_url:
+                negative_cache.add(query, error_class, str(e))
+            raise
+
+        logger.warning(f"Error ({error_class}) detected for '{query[:100]}'. Retrying with cookies: {cookies_to_try}")
+        for cookie_name in cookies_to_try:
+            try:
+                result = await run_ydl_with_low_priority(ydl_opts, query, specific_cookie_file=cookie_name, profile=profile)
+                cookie_health.record_success(cookie_name)
+                return result
+            except yt_dlp.utils.DownloadError as cookie_e:
+                cookie_error_class = classify_yt_dlp_error(str(cookie_e))
+                if cookie_error_class in TERMINAL_ERROR_CLASSES:
+                    # The media itself is dead, the cookie is not to blame.
+                    if is_media_url:
+                        negative_cache.add(query, cookie_error_class, str(cookie_e))
+                    raise cookie_e
+                cookie_health.record_failure(cookie_name, cookie_error_class)
+            except Exception as cookie_e:
+                logger.warning(f"Cookie '{cookie_name}' failed: {str(cookie_e)[:150]}")
+                cookie_health.record_failure(cookie_name, "generic")
+
+        # If all cookies failed, re-raise the original error
+        logger.error(f"All cookies failed for '{query[:100]}'")
+        if is_media_url:
+            negative_cache.add(query, error_class, str(e))
+        raise e
+
+
+def format_duration(seconds: int) -> str:
     """Formats a duration in seconds into HH:MM:SS or MM:SS."""
     if seconds is None:
         return "00:00"
@@ -1930,6 +2925,20 @@ def create_progress_bar(current: int, total: int, guild_id: int, bar_length: int
     return f"`[{bar}]`"
 
 
+def seconds_until_progress_change(current: float, total: int, bar_length: int = 10) -> float | None:
+    """
+    Returns how many playback seconds remain until create_progress_bar() would render
+    one more filled segment, or None if the bar can no longer change (live or full).
+    """
+    if not total:
+        return None
+    filled_length = int(bar_length * current / total)
+    if filled_length >= bar_length:
+        return None
+    next_boundary = (filled_length + 1) * total / bar_length
+    return max(0.0, next_boundary - current)
+
+
 # Make sure the parse_time function is also present
 def parse_time(time_str: str) -> int | None:
     """Converts a time string (HH:MM:SS, MM:SS, SS) into seconds."""
@@ -1952,6 +2961,55 @@ def parse_time(time_str: str) -> int | None:
     return seconds
 
 
+# --- yt-dlp Extraction Profiles ---
+
+# Full extraction used for playback: resolves and selects the audio format.
+PLAYBACK_YDL_OPTS = {
+    "format": "bestaudio[acodec=opus]/bestaudio/best",
+    "quiet": True,
+    "no_warnings": True,
+    "no_color": True,
+    "socket_timeout": 15,
+    "concurrent_fragments": 4,
+}
+
+# Lightweight extraction used for display only (title, link, thumbnail, duration).
+# No format selection is done: extract_item() also skips yt-dlp's processing step.
+METADATA_YDL_OPTS = {
+    "quiet": True,
+    "no_warnings": True,
+    "no_color": True,
+    "socket_timeout": 10,
+    "extract_flat": True,
+    "skip_download": True,
+    "noplaylist": True,
+    "ignore_no_formats_error": True,
+}
+
+EXTRACTION_PROFILES = {"playback": PLAYBACK_YDL_OPTS, "metadata": METADATA_YDL_OPTS}
+
+# --- Batch extraction ---
+EXTRACT_BATCH_CONCURRENCY = int(os.getenv("EXTRACT_BATCH_CONCURRENCY", "4"))  # Extraction threads per pool worker
+EXTRACT_ITEM_TIMEOUT = float(os.getenv("EXTRACT_ITEM_TIMEOUT", "20"))  # Seconds a batch waits for its next result
+
+# Platforms offering an oEmbed endpoint: a single cheap HTTP request returns title and thumbnail.
+OEMBED_ENDPOINTS = {
+    "youtube": "https://www.youtube.com/oembed",
+    "youtube_music": "https://www.youtube.com/oembed",
+    "soundcloud": "https://soundcloud.com/oembed",
+}
+
+
+def lower_worker_priority():
+    """Lowers the priority of the current (worker) process so extraction never starves the bot."""
+    p = psutil.Process()
+    if platform.system() == "Windows":
+        p.nice(psutil.IDLE_PRIORITY_CLASS)
+    else:
+        # A niceness value of 19 is the lowest priority
+        os.nice(19)
+
+
 def ydl_worker(ydl_opts, query, cookies_file=None):
     """
     This function runs in a separate process.
@@ -1959,12 +3017,7 @@ def ydl_worker(ydl_opts, query, cookies_file=None):
     It now handles exceptions internally to avoid pickling errors.
     """
     # Change the priority of the current process
-    p = psutil.Process()
-    if platform.system() == "Windows":
-        p.nice(psutil.IDLE_PRIORITY_CLASS)
-    else:
-        # A niceness value of 19 is the lowest priority
-        os.nice(19)
+    lower_worker_priority()
 
     if cookies_file and os.path.exists(cookies_file):
         ydl_opts["cookiefile"] = cookies_file
@@ -1981,10 +3034,206 @@ def ydl_worker(ydl_opts, query, cookies_file=None):
         return {"status": "error", "message": str(e)}
 
 
-async def run_ydl_with_low_priority(ydl_opts, query, loop=None, specific_cookie_file=None):
+# Per-process state of pool workers: a persistent thread pool whose threads each keep
+# their own warm YoutubeDL instance per profile (YoutubeDL is not thread-safe).
+worker_threads = None
+worker_local = threading.local()
+
+
+def get_worker_ydl(profile: str, cookies_file: str | None):
+    """Returns this thread's YoutubeDL for a profile, created on first use and then reused."""
+    instances = getattr(worker_local, "instances", None)
+    if instances is None:
+        instances = worker_local.instances = {}
+    key = (profile, cookies_file)
+    if key not in instances:
+        ydl_opts = dict(EXTRACTION_PROFILES[profile])
+        if cookies_file and os.path.exists(cookies_file):
+            ydl_opts["cookiefile"] = cookies_file
+        instances[key] = yt_dlp.YoutubeDL(ydl_opts)
+    return instances[key]
+
+
+def extract_item(profile: str, url: str, cookies_file: str | None = None) -> dict:
+    """
+    Extracts one URL inside a pool worker. The metadata profile skips yt-dlp's processing
+    step and only sends back the few fields we display. Never raises: returns a status dictionary.
+    """
+    try:
+        ydl = get_worker_ydl(profile, cookies_file)
+        if profile != "metadata":
+            return {"status": "success", "data": ydl.extract_info(url, download=False)}
+        info = ydl.extract_info(url, download=False, process=False)
+        thumbnail = info.get("thumbnail") or ((info.get("thumbnails") or [{}])[-1]).get("url")
+        data = {
+            "title": info.get("title"),
+            "webpage_url": info.get("webpage_url") or url,
+            "thumbnail": thumbnail,
+            "duration": info.get("duration") or 0,
+            "uploader": info.get("uploader"),
+        }
+        return {"status": "success", "data": data}
+    except Exception as e:
+        return {"status": "error", "message": str(e)}
+
+
+def ydl_batch_worker(profile: str, urls: list, batch_id: int | None = None, cookies_file: str | None = None):
+    """
+    This function runs in a separate process.
+    Extracts several URLs concurrently on the worker's warm threads. With a batch_id, every
+    result is streamed to the main process as soon as it completes, as (batch_id, index, result),
+    and only the count is returned; otherwise the results are returned in order.
+    """
+    global worker_threads
+    lower_worker_priority()
+    if worker_threads is None:
+        worker_threads = ThreadPoolExecutor(max_workers=EXTRACT_BATCH_CONCURRENCY, thread_name_prefix="extract")
+
+    def timed_extract(url: str) -> dict:
+        started = time.perf_counter()
+        result = extract_item(profile, url, cookies_file)
+        result["elapsed"] = time.perf_counter() - started
+        return result
+
+    futures = {worker_threads.submit(timed_extract, url): index for index, url in enumerate(urls)}
+    results = [None] * len(urls)
+    for future in as_completed(futures):
+        index = futures[future]
+        results[index] = future.result()
+        if batch_id is not None and worker_results_queue is not None:
+            worker_results_queue.put((batch_id, index, results[index]))
+    return len(urls) if batch_id is not None and worker_results_queue is not None else results
+
+
+def run_in_pool_worker(submitted_at: float, func, *args):
+    """Runs in a pool worker: calls func and also returns how long the job waited for a free worker."""
+    return time.time() - submitted_at, func(*args)
+
+
+class BatchResultDispatcher:
+    """
+    Routes the results streamed by pool workers (extraction_results) to the extract_many()
+    call waiting for them. A single daemon thread reads the queue; results of batches nobody
+    waits for anymore (timed out, cancelled) are dropped.
+    """
+
+    def __init__(self):
+        self.batches = {}
+        self.batch_ids = itertools.count()
+        self.lock = threading.Lock()
+        self.thread = None
+
+    def register(self) -> tuple[int, asyncio.Queue]:
+        with self.lock:
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.run, name="extraction-results", daemon=True)
+                self.thread.start()
+            batch_id = next(self.batch_ids)
+            results = asyncio.Queue()
+            self.batches[batch_id] = (asyncio.get_running_loop(), results)
+        return batch_id, results
+
+    def unregister(self, batch_id: int):
+        with self.lock:
+            self.batches.pop(batch_id, None)
+
+    def run(self):
+        while True:
+            try:
+                batch_id, index, result = extraction_results.get()
+            except (EOFError, OSError):
+                return
+            with self.lock:
+                entry = self.batches.get(batch_id)
+            if entry:
+                loop, results = entry
+                loop.call_soon_threadsafe(results.put_nowait, (index, result))
+
+
+batch_result_dispatcher = BatchResultDispatcher()
+
+
+async def extract_many(urls: list, profile: str = "metadata", item_timeout: float = EXTRACT_ITEM_TIMEOUT):
+    """
+    Extracts a list of URLs in a single process pool call and yields (url, result) pairs as
+    they complete, in completion order. A result is {"status": "success", "data": ...} or
+    {"status": "error", "message": ...}. If nothing completes for item_timeout seconds, the
+    items still pending are yielded with {"status": "timeout"} so one slow URL can't hold the
+    batch; if the pool call itself fails, they are yielded with {"status": "failed", "message": ...}.
+    """
+    urls = list(urls)
+    if not urls:
+        return
+
+    loop = asyncio.get_running_loop()
+    batch_id, results = batch_result_dispatcher.register()
+    job = loop.run_in_executor(process_pool, run_in_pool_worker, time.time(), ydl_batch_worker, profile, urls, batch_id)
+
+    def record_queue_wait(future):
+        # Also marks the job's result as retrieved: a failed or abandoned batch is handled below.
+        if not future.cancelled() and not future.exception():
+            pool_queue_waits.observe(future.result()[0])
+
+    job.add_done_callback(record_queue_wait)
+    pending = set(range(len(urls)))
+    leftover = {"status": "timeout"}
+    try:
+        while pending:
+            getter = asyncio.ensure_future(results.get())
+            # Results can still be in flight after the job returned: only watch the job until then.
+            done, _ = await asyncio.wait({getter} if job.done() else {getter, job}, timeout=item_timeout, return_when=asyncio.FIRST_COMPLETED)
+            if getter not in done:
+                getter.cancel()
+                if not done:
+                    logger.warning(f"Extraction batch {batch_id}: no result for {item_timeout}s, giving up on {len(pending)} of {len(urls)} URLs.")
+                    break
+                if not job.cancelled() and job.exception():
+                    logger.warning(f"Extraction batch {batch_id} failed: {job.exception()}")
+                    leftover = {"status": "failed", "message": str(job.exception())}
+                    break
+                continue
+            index, result = getter.result()
+            if index in pending:
+                pending.discard(index)
+                if "elapsed" in result:
+                    # Timed in the worker: the batch's queue wait and sibling items aren't counted.
+                    extraction_times.labels(profile).observe(result["elapsed"])
+                yield urls[index], result
+        for index in sorted(pending):
+            yield urls[index], leftover
+    finally:
+        batch_result_dispatcher.unregister(batch_id)
+
+
+def get_oembed_endpoint(url: str) -> str | None:
+    """Returns the oEmbed endpoint for a URL, or None if its platform doesn't offer one."""
+    return OEMBED_ENDPOINTS.get(classify(url).platform)
+
+
+def fetch_oembed_meta(url: str) -> dict | None:
+    """
+    Blocking oEmbed lookup (run it in an executor). oEmbed doesn't provide the duration,
+    so this is only used when the caller just needs a title and a thumbnail.
+    """
+    endpoint = get_oembed_endpoint(url)
+    if not endpoint:
+        return None
+    try:
+        response = requests.get(endpoint, params={"url": url, "format": "json"}, timeout=5)
+        response.raise_for_status()
+        data = response.json()
+    except (requests.exceptions.RequestException, ValueError) as e:
+        logger.debug(f"oEmbed lookup failed for {url}: {e}")
+        return None
+    if not data.get("title"):
+        return None
+    return {"url": url, "title": data["title"], "webpage_url": url, "thumbnail": data.get("thumbnail_url"), "duration": 0, "is_single": False}
+
+
+async def run_ydl_with_low_priority(ydl_opts, query, loop=None, specific_cookie_file=None, profile: str = "playback"):
     """
     Sends the yt-dlp task to the process pool.
-    Uses a specific cookie file if provided.
+    Uses a specific cookie file if provided. `profile` labels the extraction latency metric.
     """
     if loop is None:
         loop = asyncio.get_running_loop()
@@ -1993,13 +3242,15 @@ async def run_ydl_with_low_priority(ydl_opts, query, loop=None, specific_cookie_
 
     # This is now the ONLY logic for cookies in this function.
     if specific_cookie_file:
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        cookies_file_to_use = os.path.join(script_dir, specific_cookie_file)
+        cookies_file_to_use = get_cookie_path(specific_cookie_file)
         if not os.path.exists(cookies_file_to_use):
             logger.error(f"Specified cookie file {cookies_file_to_use} not found! Aborting cookie use for this request.")
             cookies_file_to_use = None
 
-    result_dict = await loop.run_in_executor(process_pool, ydl_worker, ydl_opts, query, cookies_file_to_use)
+    started = time.perf_counter()
+    queue_wait, result_dict = await loop.run_in_executor(process_pool, run_in_pool_worker, time.time(), ydl_worker, ydl_opts, query, cookies_file_to_use)
+    pool_queue_waits.observe(queue_wait)
+    extraction_times.labels(profile).observe(time.perf_counter() - started)
 
     if result_dict.get("status") == "error":
         error_message = result_dict.get("message", "Unknown error in subprocess")
@@ -2008,11 +3259,25 @@ async def run_ydl_with_low_priority(ydl_opts, query, loop=None, specific_cookie_
     return result_dict.get("data")
 
 
+class OpusSilenceSource(discord.AudioSource):
+    """
+    Endless source of pre-encoded Opus silence frames. Keeps an idle voice connection
+    alive without spawning FFmpeg or encoding anything.
+    """
+
+    SILENCE_FRAME = b"\xf8\xff\xfe"  # Discord's canonical 20ms Opus silence frame
+
+    def is_opus(self) -> bool:
+        return True
+
+    def read(self) -> bytes:
+        return self.SILENCE_FRAME
+
+
 async def play_silence_loop(guild_id: int):
     """
-    Plays a silent sound in a loop to maintain the voice connection.
-    This version is corrected to stop cleanly, avoid FFmpeg process leaks,
-    AND optimized for low CPU consumption.
+    Plays silence in a loop to maintain the voice connection.
+    Uses an in-process Opus silence source, so an idle 24/7 guild costs no FFmpeg process.
     """
     state = get_guild_state(guild_id)
     music_player = state.music_player
@@ -2021,18 +3286,9 @@ async def play_silence_loop(guild_id: int):
     if not vc or not vc.is_connected():
         return
 
-    logger.info(f"[{guild_id}] Starting FFmpeg silence loop to keep connection alive (Low CPU mode).")
+    logger.info(f"[{guild_id}] Starting silence loop to keep connection alive.")
     music_player.is_playing_silence = True
 
-    source = "anullsrc=channel_layout=stereo:sample_rate=48000"
-
-    # Correction and optimization of FFmpeg options
-    ffmpeg_options = {
-        # The -re option forces playback at normal speed, reducing CPU usage from 100% to ~1%
-        "before_options": "-re -f lavfi",  # <-- CPU OPTIMIZATION
-        "options": "-vn -c:a libopus -b:a 16k",
-    }
-
     def noop_callback(error):
         if error:
             logger.error(f"[{guild_id}] Error in no-op callback for silence loop: {error}")
@@ -2040,14 +3296,14 @@ async def play_silence_loop(guild_id: int):
     try:
         while vc.is_connected():
             if not vc.is_playing():
-                vc.play(discord.FFmpegPCMAudio(source, **ffmpeg_options), after=noop_callback)
+                vc.play(OpusSilenceSource(), after=noop_callback)
             await asyncio.sleep(20)
 
     except asyncio.CancelledError:
         logger.info(f"[{guild_id}] Silence loop task cancelled, proceeding to cleanup.")
         pass
     except Exception as e:
-        logger.error(f"[{guild_id}] Error in FFmpeg silence loop: {e}")
+        logger.error(f"[{guild_id}] Error in silence loop: {e}")
     finally:
         # The 'finally' block is synchronous. We schedule the execution of 'safe_stop'
         # on the bot's event loop to ensure proper asynchronous cleanup.
@@ -2058,6 +3314,291 @@ async def play_silence_loop(guild_id: int):
         music_player.is_playing_silence = False
 
 
+class Histogram:
+    """Fixed-bucket histogram (cumulative-style upper bounds, in seconds) with exact count, sum and max."""
+
+    def __init__(self, buckets: tuple):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # The last slot is +Inf
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        index = next((i for i, bound in enumerate(self.buckets) if value <= bound), len(self.buckets))
+        self.counts[index] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def percentile(self, fraction: float) -> float | None:
+        """Upper bound of the bucket holding the given fraction of observations (max for the +Inf bucket)."""
+        if not self.count:
+            return None
+        threshold = fraction * self.count
+        running = 0
+        for index, bucket_count in enumerate(self.counts):
+            running += bucket_count
+            if running >= threshold:
+                return self.buckets[index] if index < len(self.buckets) else self.max
+        return self.max
+
+
+class Counter:
+    """Monotonic counter."""
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0):
+        self.value += amount
+
+
+class Gauge:
+    """Value that goes up and down, either set directly or read from `function` when collected."""
+
+    def __init__(self, function=None):
+        self.function = function
+        self._value = 0.0
+
+    def set(self, value: float):
+        self._value = value
+
+    @property
+    def value(self) -> float:
+        return self.function() if self.function else self._value
+
+
+class MetricFamily:
+    """A named metric and its children, one per combination of label values."""
+
+    def __init__(self, name: str, help_text: str, kind: str, label_names: tuple, factory):
+        self.name = name
+        self.help_text = help_text
+        self.kind = kind
+        self.label_names = label_names
+        self.factory = factory
+        self.children = {}
+        self.lock = threading.Lock()
+
+    def labels(self, *values):
+        child = self.children.get(values)
+        if child is None:
+            with self.lock:
+                child = self.children.setdefault(values, self.factory())
+        return child
+
+    # Shortcuts for metrics without labels
+    def inc(self, amount: float = 1.0):
+        self.labels().inc(amount)
+
+    def observe(self, value: float):
+        self.labels().observe(value)
+
+    def set(self, value: float):
+        self.labels().set(value)
+
+
+class MetricsRegistry:
+    """
+    Counters, gauges and histograms of this process, rendered in the Prometheus text format
+    by the metrics HTTP endpoint and read directly by /status. Updates may come from any
+    thread (discord.py's audio threads included); readers copy children before iterating.
+    """
+
+    def __init__(self):
+        self.families = {}
+
+    def _add(self, name: str, help_text: str, kind: str, label_names: tuple, factory) -> MetricFamily:
+        family = MetricFamily(name, help_text, kind, tuple(label_names), factory)
+        if not family.label_names:
+            family.labels()  # Exported (at zero) before the first update
+        self.families[name] = family
+        return family
+
+    def counter(self, name: str, help_text: str, labels: tuple = (), function=None) -> MetricFamily:
+        """With `function`, the (unlabelled) value is read from it when collected, e.g. from an existing total."""
+        return self._add(name, help_text, "counter", labels, (lambda: Gauge(function)) if function else Counter)
+
+    def gauge(self, name: str, help_text: str, function=None) -> MetricFamily:
+        return self._add(name, help_text, "gauge", (), lambda: Gauge(function))
+
+    def histogram(self, name: str, help_text: str, buckets: tuple, labels: tuple = ()) -> MetricFamily:
+        return self._add(name, help_text, "histogram", labels, lambda: Histogram(buckets))
+
+    @staticmethod
+    def _format_labels(pairs: list) -> str:
+        if not pairs:
+            return ""
+        escaped = ('{}="{}"'.format(name, str(value).replace("\\", "\\\\").replace('"', '\\"')) for name, value in pairs)
+        return "{" + ",".join(escaped) + "}"
+
+    def render(self) -> str:
+        lines = []
+        for family in list(self.families.values()):
+            lines.append(f"# HELP {family.name} {family.help_text}")
+            lines.append(f"# TYPE {family.name} {family.kind}")
+            for values, child in list(family.children.items()):
+                labels = list(zip(family.label_names, values))
+                if family.kind == "histogram":
+                    running = 0
+                    for bound, bucket_count in zip((*child.buckets, "+Inf"), list(child.counts)):
+                        running += bucket_count
+                        lines.append(f"{family.name}_bucket{self._format_labels(labels + [('le', bound)])} {running}")
+                    lines.append(f"{family.name}_sum{self._format_labels(labels)} {child.total}")
+                    lines.append(f"{family.name}_count{self._format_labels(labels)} {child.count}")
+                else:
+                    try:
+                        value = child.value
+                    except Exception as e:
+                        logger.warning(f"Metrics: could not collect {family.name}: {e}")
+                        continue
+                    lines.append(f"{family.name}{self._format_labels(labels)} {value}")
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
+
+EXTRACTION_BUCKETS = (0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 10.0, 20.0, 30.0)
+POOL_WAIT_BUCKETS = (0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0)
+VOICE_CONNECTION_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0)
+TRACK_SWITCH_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0)
+LOOP_LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+FFMPEG_SPAWN_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+extraction_times = metrics.histogram("playify_extraction_seconds", "yt-dlp extraction latency, per extraction profile.", EXTRACTION_BUCKETS, labels=("profile",))
+pool_queue_waits = metrics.histogram("playify_pool_queue_wait_seconds", "Time extraction jobs wait for a free process pool worker.", POOL_WAIT_BUCKETS)
+cache_requests = metrics.counter("playify_cache_requests_total", "Cache lookups, per cache and result (hit or miss).", labels=("cache", "result"))
+ffmpeg_spawns = metrics.counter("playify_ffmpeg_spawns_total", "FFmpeg processes spawned, per kind.", labels=("kind",))
+ffmpeg_spawn_times = metrics.histogram("playify_ffmpeg_spawn_seconds", "Time to start an FFmpeg process.", FFMPEG_SPAWN_BUCKETS)
+controller_updates = metrics.counter("playify_controller_updates_total", "Controller message updates, per action (edit, send, interaction, error).", labels=("action",))
+voice_connection_times = metrics.histogram("playify_voice_connection_seconds", "Voice connection setup time, per kind (connect, move, reconnect).", VOICE_CONNECTION_BUCKETS, labels=("kind",))
+voice_reconnects = metrics.counter("playify_voice_reconnects_total", "Voice reconnections, per reason (command, zombie).", labels=("reason",))
+track_switch_gaps = metrics.histogram("playify_track_switch_gap_seconds", "Silence between the end of a track and the start of the next one.", TRACK_SWITCH_BUCKETS)
+loop_lag = metrics.histogram("playify_event_loop_lag_seconds", "How late the event loop runs a task that asked to wake up.", LOOP_LAG_BUCKETS)
+# Sampled by the metrics monitor (psutil calls stay off the event loop)
+host_cpu_percent = metrics.gauge("playify_host_cpu_percent", "Host CPU usage, sampled by the metrics monitor.")
+host_cpu_frequency = metrics.gauge("playify_host_cpu_frequency_mhz", "Current host CPU frequency.")
+host_memory_total = metrics.gauge("playify_host_memory_total_bytes", "Host memory size.")
+host_memory_used = metrics.gauge("playify_host_memory_used_bytes", "Host memory in use.")
+host_memory_percent = metrics.gauge("playify_host_memory_percent", "Host memory usage.")
+host_disk_total = metrics.gauge("playify_host_disk_total_bytes", "Size of the root filesystem.")
+host_disk_used = metrics.gauge("playify_host_disk_used_bytes", "Space used on the root filesystem.")
+host_disk_percent = metrics.gauge("playify_host_disk_percent", "Usage of the root filesystem.")
+process_cpu_percent = metrics.gauge("playify_process_cpu_percent", "CPU usage of this bot process, sampled by the metrics monitor.")
+process_rss = metrics.gauge("playify_process_rss_bytes", "Resident memory of this bot process.")
+ffmpeg_cpu_seconds = metrics.gauge("playify_ffmpeg_cpu_seconds", "CPU time used by supervised FFmpeg processes, finished ones included.")
+ffmpeg_rss = metrics.gauge("playify_ffmpeg_rss_bytes", "Resident memory of the running FFmpeg processes.")
+# Read when collected (plain attributes, no sampling)
+metrics.gauge("playify_active_players", "Guilds with a player state in this process.", function=lambda: len(guild_states))
+ffmpeg_active = metrics.gauge("playify_ffmpeg_processes", "FFmpeg processes currently running.", function=lambda: len(ffmpeg_supervisor.processes))
+ffmpeg_waiting = metrics.gauge("playify_ffmpeg_waiting", "Players waiting for a free FFmpeg process slot.", function=lambda: ffmpeg_supervisor.waiting)
+ffmpeg_reaps = metrics.counter("playify_ffmpeg_reaped_total", "FFmpeg processes reaped (exited, orphaned or untracked).", function=lambda: ffmpeg_supervisor.reaped_total)
+for kind in ("connect", "move", "reconnect"):
+    voice_connection_times.labels(kind)
+
+METRICS_LOOP_INTERVAL = 0.5  # Loop lag sampling period (seconds)
+METRICS_CPU_INTERVAL = 5  # CPU usage sampling period (seconds)
+
+
+def sample_system_metrics(bot_process: psutil.Process):
+    """Blocking psutil sampling of the host, this process and the FFmpeg processes (run in a thread)."""
+    host_cpu_percent.set(psutil.cpu_percent(None))
+    process_cpu_percent.set(bot_process.cpu_percent(None))
+    cpu_freq = psutil.cpu_freq()
+    host_cpu_frequency.set(cpu_freq.current if cpu_freq else 0)
+    memory = psutil.virtual_memory()
+    host_memory_total.set(memory.total)
+    host_memory_used.set(memory.used)
+    host_memory_percent.set(memory.percent)
+    disk = psutil.disk_usage("/")
+    host_disk_total.set(disk.total)
+    host_disk_used.set(disk.used)
+    host_disk_percent.set(disk.percent)
+    process_rss.set(bot_process.memory_info().rss)
+    ffmpeg_metrics = ffmpeg_supervisor.metrics()
+    ffmpeg_cpu_seconds.set(ffmpeg_metrics["cpu_seconds_total"])
+    ffmpeg_rss.set(ffmpeg_metrics["rss_bytes"])
+
+
+async def metrics_monitor():
+    """
+    Samples the event-loop lag (how late a short sleep wakes up) and, every few seconds, the
+    host and process gauges. psutil's cpu_percent(None) compares against the previous call,
+    so it never blocks.
+    """
+    bot_process = psutil.Process()
+    await asyncio.to_thread(sample_system_metrics, bot_process)
+    last_sample = time.perf_counter()
+    while not bot.is_closed():
+        started = time.perf_counter()
+        await asyncio.sleep(METRICS_LOOP_INTERVAL)
+        now = time.perf_counter()
+        loop_lag.observe(max(0.0, now - started - METRICS_LOOP_INTERVAL))
+        if now - last_sample >= METRICS_CPU_INTERVAL:
+            try:
+                await asyncio.to_thread(sample_system_metrics, bot_process)
+            except Exception as e:
+                logger.warning(f"Metrics: system sampling failed: {e}")
+            last_sample = time.perf_counter()
+
+
+metrics_monitor_task = None
+
+
+def start_metrics_monitor():
+    global metrics_monitor_task
+    if metrics_monitor_task is None or metrics_monitor_task.done():
+        metrics_monitor_task = asyncio.create_task(metrics_monitor())
+
+
+class MetricsRequestHandler(BaseHTTPRequestHandler):
+    """Serves GET /metrics in the Prometheus text exposition format."""
+
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = metrics.render().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_metrics_server(host: str, port: int) -> ThreadingHTTPServer:
+    """Serves the metrics endpoint from a daemon thread, off the event loop."""
+    server = ThreadingHTTPServer((host, port), MetricsRequestHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    logger.info(f"Metrics endpoint listening on http://{host}:{port}/metrics")
+    return server
+
+
+async def wait_for_own_voice_state(guild: discord.Guild, predicate, timeout: float = 5.0) -> bool:
+    """
+    Waits until the bot's own voice state in a guild satisfies predicate(voice_state),
+    where voice_state is None when disconnected. Driven by voice_state_update events
+    instead of fixed sleeps. Returns False on timeout.
+    """
+    if predicate(guild.me.voice):
+        return True
+
+    def check(member, before, after):
+        return member.id == bot.user.id and member.guild.id == guild.id and predicate(after if after.channel else None)
+
+    try:
+        await bot.wait_for("voice_state_update", check=check, timeout=timeout)
+        return True
+    except asyncio.TimeoutError:
+        logger.warning(f"[{guild.id}] Timed out after {timeout}s waiting for the bot's voice state.")
+        return False
+
+
 async def ensure_voice_connection(interaction: discord.Interaction) -> discord.VoiceClient | None:
     """
     Verifies and ensures the bot is connected to the user's voice channel.
@@ -2100,10 +3641,13 @@ async def ensure_voice_connection(interaction: discord.Interaction) -> discord.V
     if not vc:
         try:
             logger.info(f"[{guild_id}] No active voice client. Attempting to connect to '{voice_channel.name}'.")
+            connect_started = time.perf_counter()
             new_vc = await voice_channel.connect()
+            connect_time = time.perf_counter() - connect_started
+            voice_connection_times.labels("connect").observe(connect_time)
             music_player.voice_client = new_vc
             vc = new_vc
-            logger.info(f"[{guild_id}] Successfully connected.")
+            logger.info(f"[{guild_id}] Successfully connected in {connect_time:.2f}s.")
 
             # If we are reconnecting after a forced cleanup, resume playback.
             if music_player.is_resuming_after_clean and music_player.resume_info:
@@ -2124,15 +3668,11 @@ async def ensure_voice_connection(interaction: discord.Interaction) -> discord.V
         except discord.errors.ClientException as e:
             if "Already connected to a voice channel" in str(e):
                 logger.error(f"[{guild_id}] CRITICAL: ZOMBIE CONNECTION DETECTED. Forcing self-repair sequence.")
+                voice_reconnects.labels("zombie").inc()
 
                 # Save the current playback state before disconnecting.
                 if music_player.voice_client and music_player.current_info:
-                    current_timestamp = 0
-                    if music_player.playback_started_at:
-                        elapsed_time = time.time() - music_player.playback_started_at
-                        current_timestamp = music_player.start_time + (elapsed_time * music_player.playback_speed)
-                    else:
-                        current_timestamp = music_player.start_time
+                    current_timestamp = music_player.get_position()
 
                     music_player.resume_info = {"info": music_player.current_info.copy(), "time": current_timestamp}
                     music_player.is_resuming_after_clean = True
@@ -2142,7 +3682,8 @@ async def ensure_voice_connection(interaction: discord.Interaction) -> discord.V
                 try:
                     music_player.is_cleaning = True
                     await music_player.voice_client.disconnect(force=True)
-                    await asyncio.sleep(1)  # Crucial delay to let Discord process the disconnect.
+                    # Let Discord process the disconnect before connecting again.
+                    await wait_for_own_voice_state(interaction.guild, lambda voice: voice is None, timeout=3)
                 except Exception as disconnect_error:
                     logger.error(f"[{guild_id}] Error during forced disconnect: {disconnect_error}")
                 finally:
@@ -2167,15 +3708,17 @@ async def ensure_voice_connection(interaction: discord.Interaction) -> discord.V
     # --- STANDARD OPERATIONS ON A HEALTHY CLIENT ---
     elif vc.channel != voice_channel:
         logger.info(f"[{guild_id}] Moving to a new voice channel: {voice_channel.name}")
+        move_started = time.perf_counter()
         await vc.move_to(voice_channel)
-        await asyncio.sleep(0.5)
+        await wait_for_own_voice_state(interaction.guild, lambda voice: voice is not None and voice.channel == voice_channel, timeout=3)
+        voice_connection_times.labels("move").observe(time.perf_counter() - move_started)
 
     if isinstance(vc.channel, discord.StageChannel):
         if interaction.guild.me.voice and interaction.guild.me.voice.suppress:
             logger.info(f"[{guild_id}] Bot is a spectator. Attempting to promote.")
             try:
                 await interaction.guild.me.edit(suppress=False)
-                await asyncio.sleep(0.5)
+                await wait_for_own_voice_state(interaction.guild, lambda voice: voice is not None and not voice.suppress, timeout=3)
             except discord.Forbidden:
                 logger.warning(f"[{guild_id}] Promotion failed: 'Mute Members' permission missing.")
             except Exception as e:
@@ -2204,17 +3747,182 @@ def clear_audio_cache(guild_id: int):
             logger.error(f"Error while deleting cache for guild {guild_id}: {e}")
 
 
-async def fetch_meta(url, _):
-    """Fetches metadata for a single URL, used for queue hydration."""
-    try:
-        # We now use the robust, cookie-aware function for all metadata fetching.
-        data = await fetch_video_info_with_retry(url)
+async def fetch_meta_many(urls: list, need_duration: bool = True) -> dict:
+    """
+    Fetches display metadata for several URLs at once, used for queue hydration.
+    Results are served from url_cache when possible; otherwise oEmbed is used when the
+    caller doesn't need the duration, and everything else goes to the process pool
+    in a single lightweight (metadata profile) extract_many() batch.
+    URL variants of the same media are fetched once.
+    Returns a dictionary {media key: metadata}; media that failed is missing from it.
+    """
+    results = {}
+    pending = []
+    # One representative URL per canonical media key
+    representatives = {}
+    for url in urls:
+        if url:
+            representatives.setdefault(get_media_key(url), url)
+    for key, url in representatives.items():
+        if negative_cache.get(url):
+            continue
+        cached = url_cache.get(key)
+        if cached and (cached.get("duration") or not need_duration):
+            results[key] = cached
+        else:
+            pending.append(url)
+
+    if not pending:
+        return results
+
+    loop = asyncio.get_running_loop()
+
+    if not need_duration:
+        oembed_urls = [url for url in pending if get_oembed_endpoint(url)]
+        if oembed_urls:
+            oembed_results = await asyncio.gather(*[loop.run_in_executor(None, fetch_oembed_meta, url) for url in oembed_urls])
+            for url, meta in zip(oembed_urls, oembed_results):
+                if meta:
+                    results[get_media_key(url)] = url_cache[get_media_key(url)] = meta
+            pending = [url for url in pending if get_media_key(url) not in results]
+
+    if pending:
+        async for url, result in extract_many(pending, "metadata"):
+            if result.get("status") in ("timeout", "failed"):
+                # Not the URL's fault: no negative caching, the next hydration retries it.
+                logger.warning(f"Metadata extraction for {url} did not finish ({result['status']}).")
+                continue
+            if result.get("status") != "success":
+                error_message = result.get("message", "")
+                logger.warning(f"Failed to hydrate metadata for {url}: {error_message[:150]}")
+                # The metadata profile never uses cookies: only failures cookies can't fix are
+                # remembered, so playback still gets its cookie retries for the others.
+                error_class = classify_yt_dlp_error(error_message)
+                if error_class in TERMINAL_ERROR_CLASSES:
+                    negative_cache.add(url, error_class, error_message)
+                continue
+            data = result["data"]
+            meta = {
+                "url": url,
+                "title": data.get("title") or "Unknown Title",
+                "webpage_url": data.get("webpage_url") or url,
+                "thumbnail": data.get("thumbnail"),
+                "duration": data.get("duration") or 0,
+                "is_single": False,
+            }
+            results[get_media_key(url)] = url_cache[get_media_key(url)] = meta
 
-        # We make sure the duration is returned.
-        return {"url": url, "title": data.get("title", "Unknown Title"), "webpage_url": data.get("webpage_url", url), "thumbnail": data.get("thumbnail"), "duration": data.get("duration", 0), "is_single": False}
-    except Exception as e:
-        logger.warning(f"Failed to hydrate metadata for {url}: {e}")
-        return None  # Return None on failure
+    return results
+
+
+async def fetch_meta(url, need_duration: bool = True):
+    """Fetches metadata for a single URL, used for queue hydration. Returns None on failure."""
+    return (await fetch_meta_many([url], need_duration=need_duration)).get(get_media_key(url))
+
+
+class PageHydrator:
+    """
+    Shared service that fills in missing titles for the paginated views (/queue, /jumpto, /remove).
+    Views render immediately with what is known; the visible page is hydrated in the background
+    with bounded concurrency, the next page is pre-hydrated speculatively, and results are
+    written back into the shared track dicts so every other view benefits from them.
+    """
+
+    MAX_CONCURRENCY = 4
+    BATCH_SIZE = 10
+
+    def __init__(self):
+        self.semaphore = asyncio.Semaphore(self.MAX_CONCURRENCY)
+        # Both keyed by canonical media key, so URL variants of one media share a fetch.
+        self.in_flight = {}
+        # Media whose fetch failed, so a failing URL isn't retried on every page turn.
+        self.failed = TTLCache(maxsize=20000, ttl=3600)
+        # Strong references to the running page tasks (the loop only keeps weak ones).
+        self.tasks = set()
+
+    def needs_hydration(self, track) -> bool:
+        if not isinstance(track, dict) or not track.get("url") or get_media_key(track["url"]) in self.failed:
+            return False
+        title = track.get("title")
+        return not title or title in ("Unknown Title", get_messages("player.loading_placeholder"))
+
+    @staticmethod
+    def _apply(track: dict, meta: dict):
+        track.update({field: meta[field] for field in ("title", "webpage_url", "thumbnail", "duration") if meta.get(field)})
+
+    async def _fetch_batch(self, urls: list) -> dict:
+        async with self.semaphore:
+            return await fetch_meta_many(urls, need_duration=False)
+
+    async def hydrate(self, tracks: list) -> bool:
+        """Hydrates the given tracks in place. Returns True if at least one track was updated."""
+        updated = False
+        pending = []
+        for track in tracks:
+            if not self.needs_hydration(track):
+                continue
+            # Media already fetched for another track dict (same song queued twice, another guild...)
+            cached = url_cache.get(get_media_key(track["url"]))
+            if cached and cached.get("title"):
+                self._apply(track, cached)
+                updated = True
+            else:
+                pending.append(track)
+        if not pending:
+            return updated
+
+        # Media not already being fetched is grouped into batches, one worker call each.
+        new_urls = {}
+        for track in pending:
+            key = get_media_key(track["url"])
+            if key not in self.in_flight:
+                new_urls.setdefault(key, track["url"])
+        new_keys = list(new_urls)
+        for i in range(0, len(new_keys), self.BATCH_SIZE):
+            chunk = new_keys[i : i + self.BATCH_SIZE]
+            task = asyncio.create_task(self._fetch_batch([new_urls[key] for key in chunk]))
+            for key in chunk:
+                self.in_flight[key] = task
+            task.add_done_callback(lambda _, chunk=chunk: [self.in_flight.pop(key, None) for key in chunk])
+
+        key_tasks = {get_media_key(track["url"]): self.in_flight[get_media_key(track["url"])] for track in pending}
+
+        for track in pending:
+            key = get_media_key(track["url"])
+            try:
+                meta = (await key_tasks[key]).get(key)
+            except Exception as e:
+                logger.warning(f"Hydration of {track['url']} failed: {e}")
+                meta = None
+            if meta:
+                self._apply(track, meta)
+                updated = True
+            else:
+                self.failed[key] = True
+        return updated
+
+    def hydrate_page(self, page_tracks: list, next_page_tracks: list = None, on_hydrated=None) -> asyncio.Task:
+        """
+        Schedules hydration of a page without blocking the caller. `on_hydrated` is awaited
+        once the current page has new data; the next page is hydrated afterwards as a look-ahead.
+        """
+
+        async def run():
+            try:
+                if await self.hydrate(page_tracks) and on_hydrated:
+                    await on_hydrated()
+                if next_page_tracks:
+                    await self.hydrate(next_page_tracks)
+            except Exception as e:
+                logger.warning(f"Page hydration failed: {e}")
+
+        task = asyncio.create_task(run())
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+        return task
+
+
+page_hydrator = PageHydrator()
 
 
 class _MessageFormatDict(dict):
@@ -2243,12 +3951,7 @@ async def safe_stop(vc: discord.VoiceClient):
     """
     if vc and (vc.is_playing() or vc.is_paused()):
         # Force kill the FFMPEG process
-        if isinstance(vc.source, discord.PCMAudio) and hasattr(vc.source, "process"):
-            try:
-                vc.source.process.kill()
-                logger.info(f"[{vc.guild.id}] Manually killed FFMPEG process via safe_stop.")
-            except Exception as e:
-                logger.error(f"[{vc.guild.id}] Error killing FFMPEG in safe_stop: {e}")
+        ffmpeg_supervisor.kill_guild(vc.guild.id, reason="safe_stop")
 
         # Also call discord.py's stop() to clean up its internal state
         vc.stop()
@@ -2271,6 +3974,16 @@ def create_queue_item_from_info(info: dict, guild_id: int) -> dict:
     }
 
 
+def enqueue_many(queue: asyncio.Queue, items: list) -> int:
+    """
+    Appends several items to an (unbounded) queue in one step: no await between items, so no
+    other coroutine can run halfway through, and waiting consumers are woken up once.
+    """
+    for item in items:
+        queue.put_nowait(item)
+    return len(items)
+
+
 # --- Text & Formatting Helpers ---
 
 
@@ -2440,8 +4153,7 @@ async def process_spotify_url(url, interaction):
 async def process_deezer_url(url, interaction):
     guild_id = interaction.guild_id
     try:
-        deezer_share_regex = re.compile(r"^(https?://)?(link\.deezer\.com)/s/.+$")
-        if deezer_share_regex.match(url):
+        if classify(url).kind == "share":
             logger.info(f"Detected Deezer share link: {url}. Resolving redirect...")
             response = requests.head(url, allow_redirects=True, timeout=10)
             response.raise_for_status()
@@ -2570,13 +4282,9 @@ def sanitize_query(query):
 
 # YouTube Mix and SoundCloud Stations utilities
 def get_video_id(url):
-    parsed = urlparse(url)
-    if parsed.hostname in ("youtube.com", "www.youtube.com", "youtu.be"):
-        if parsed.hostname == "youtu.be":
-            return parsed.path[1:]
-        if parsed.path == "/watch":
-            query = parse_qs(parsed.query)
-            return query.get("v", [None])[0]
+    media_id = classify(url).media_id
+    if media_id and media_id.startswith("youtube:"):
+        return media_id.removeprefix("youtube:")
     return None
 
 
@@ -2587,21 +4295,25 @@ def get_mix_playlist_url(video_url):
     return None
 
 
-def get_soundcloud_track_id(url):
-    if "soundcloud.com" in url:
+async def get_soundcloud_track_id(url):
+    if classify(url).platform == "soundcloud":
         try:
-            ydl_opts = {
-                "quiet": True,
-                "no_warnings": True,
-            }
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
-                return info.get("id")
+            # In the process pool: a blocking extraction here would stall the event loop.
+            info = await run_ydl_with_low_priority({"quiet": True, "no_warnings": True, "extract_flat": True}, url, profile="flat")
+            return info.get("id")
         except Exception:
             return None
     return None
 
 
+def is_autoplay_seed(url: str) -> bool:
+    """True if autoplay can build recommendations from this URL (YouTube mix or SoundCloud station)."""
+    seed_platform = classify(url).platform
+    if IS_PUBLIC_VERSION and seed_platform in YOUTUBE_PLATFORMS:
+        return False
+    return seed_platform in AUTOPLAY_SEED_PLATFORMS
+
+
 def get_soundcloud_station_url(track_id):
     if track_id:
         return f"https://soundcloud.com/discover/sets/track-stations:{track_id}"
@@ -2618,12 +4330,838 @@ def parse_yt_dlp_error(error_string: str) -> tuple[str, str, str]:
         return ("🔞", "error.age_restricted.title", "error.age_restricted.description")
     if "private video" in error_lower:
         return ("🔒", "error.private.title", "error.private.description")
-    if "video is unavailable" in error_lower:
+    if "video is unavailable" in error_lower or "video unavailable" in error_lower or "has been removed" in error_lower:
         return ("❓", "error.unavailable.title", "error.unavailable.description")
     # Default fallback for other access errors
     return ("🚫", "error.generic_access.title", "error.generic_access.description")
 
 
+# Error classes derived from parse_yt_dlp_error(); terminal ones never succeed on retry.
+YT_DLP_ERROR_CLASSES = {
+    "error.age_restricted.title": "age_restricted",
+    "error.private.title": "private",
+    "error.unavailable.title": "unavailable",
+}
+TERMINAL_ERROR_CLASSES = {"private", "unavailable"}
+NETWORK_ERROR_MARKERS = ("timed out", "timeout", "connection", "temporary failure", "network is unreachable", "http error 5", "remote end closed")
+
+
+def classify_yt_dlp_error(error_string: str) -> str:
+    """Returns the class of a yt-dlp error: age_restricted, private, unavailable, network or generic."""
+    _, title_key, _ = parse_yt_dlp_error(error_string)
+    if title_key in YT_DLP_ERROR_CLASSES:
+        return YT_DLP_ERROR_CLASSES[title_key]
+    error_lower = error_string.lower()
+    if any(marker in error_lower for marker in NETWORK_ERROR_MARKERS):
+        return "network"
+    return "generic"
+
+
+STREAM_URL_MAX_AGE = 3600  # Fallback lifetime for stream URLs without an explicit expiry
+STREAM_URL_EXPIRY_MARGIN = 300
+
+
+def is_stream_url_fresh(stream_url: str | None, fetched_at: float | None) -> bool:
+    """True if a previously extracted stream URL can still be used (YouTube URLs carry an 'expire' timestamp)."""
+    if not stream_url or not fetched_at:
+        return False
+    expire = parse_qs(urlparse(stream_url).query).get("expire")
+    if expire and expire[0].isdigit():
+        return int(expire[0]) - STREAM_URL_EXPIRY_MARGIN > time.time()
+    return time.time() - fetched_at < STREAM_URL_MAX_AGE
+
+
+def get_media_key(url: str) -> str:
+    """
+    Canonical key of a media URL: platform + media id when it can be extracted (YouTube,
+    SoundCloud, Bandcamp, Twitch, ...), otherwise the URL itself. Every cache, dedupe table
+    and persisted track is keyed by it, so URL variants of the same media share one entry.
+    """
+    return classify(url).media_id or url.split("#")[0]
+
+
+def get_track_key(track) -> str | None:
+    """Canonical key of a queue/history/radio track (dict or LazySearchItem), None if it has no URL yet."""
+    if isinstance(track, dict):
+        if track.get("media_key"):
+            return track["media_key"]
+        # webpage_url first: once a track is extracted, "url" may hold the stream URL
+        url = track.get("webpage_url") or track.get("url")
+    else:
+        info = getattr(track, "resolved_info", None) or {}
+        url = info.get("webpage_url") or info.get("url")
+    return get_media_key(url) if url else None
+
+
+def with_media_key(track):
+    """Returns a persisted copy of a track dict carrying its canonical key."""
+    if isinstance(track, dict) and "media_key" not in track:
+        key = get_track_key(track)
+        if key:
+            return {**track, "media_key": key}
+    return track
+
+
+class NegativeResultCache:
+    """
+    Remembers media that failed to extract, keyed by canonical media id, so known-dead
+    entries (re-queued 24/7 playlists, autoplay mixes, other guilds' playlists) are skipped
+    instantly instead of paying the extraction and cookie retries again.
+    The TTL depends on the failure class; live channel links are never cached.
+    """
+
+    TTLS = {
+        "private": 7 * 24 * 3600,
+        "unavailable": 7 * 24 * 3600,
+        "age_restricted": 6 * 3600,
+        "generic": 15 * 60,
+        "network": 60,
+    }
+    MAX_SIZE = 50000
+
+    def __init__(self):
+        self.entries = SharedCache("negative", maxsize=self.MAX_SIZE, ttl=self.TTLS["generic"])
+
+    def get(self, url: str) -> dict | None:
+        """Returns {'error_class', 'message'} for a known failure, or None."""
+        if not url:
+            return None
+        return self.entries.get(get_media_key(url))
+
+    def add(self, url: str, error_class: str, message: str):
+        # A live channel that is offline now may be live in a minute: never remembered.
+        if not url or classify(url).kind == "live":
+            return
+        self.entries.set(get_media_key(url), {"error_class": error_class, "message": message}, ttl=self.TTLS.get(error_class, self.TTLS["generic"]))
+
+    def discard(self, url: str):
+        self.entries.discard(get_media_key(url))
+
+    def is_known_dead(self, track) -> bool:
+        """True if a queue item (dict) points to media that is known to fail."""
+        return isinstance(track, dict) and self.get(track.get("webpage_url") or track.get("url")) is not None
+
+
+negative_cache = NegativeResultCache()
+
+
+class AudioCache:
+    """
+    Shared, content-addressed on-disk cache of track audio, stored as Opus/Ogg.
+    Files are named after a hash of the canonical media key, so the same track is stored
+    once for every guild. A file is written by a second FFmpeg output while the track
+    streams, and only kept if FFmpeg reached the end of the track. Eviction is LRU by
+    total bytes. The index lives in memory and is mirrored to index.json.
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.index_path = f"{directory}/index.json"
+        self.entries = OrderedDict()  # media key -> {"file", "bytes", "duration"}, least recently used first
+        self.recording_keys = set()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.recordings_started = 0
+        self.bytes_saved = 0
+
+    def load(self):
+        """Reads the index from disk, dropping entries whose file is gone."""
+        os.makedirs(self.directory, exist_ok=True)
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            saved = {}
+        for key, entry in saved.items():
+            if os.path.exists(f"{self.directory}/{entry['file']}"):
+                self.entries[key] = entry
+                self.total_bytes += entry["bytes"]
+        # Leftovers of recordings interrupted by a restart.
+        for name in os.listdir(self.directory):
+            if name.endswith(".part.ogg"):
+                try:
+                    os.remove(f"{self.directory}/{name}")
+                except OSError:
+                    pass
+        logger.info(f"Audio cache loaded: {len(self.entries)} tracks, {self.total_bytes} bytes.")
+
+    def save(self):
+        tmp_path = f"{self.index_path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.entries, f)
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            logger.error(f"Could not save audio cache index: {e}")
+
+    def file_name(self, key: str) -> str:
+        return hashlib.sha1(key.encode("utf-8")).hexdigest() + ".ogg"
+
+    def peek_path(self, url: str) -> str | None:
+        """Local path of a cached track, without counting a hit or touching the LRU order."""
+        if not AUDIO_CACHE_ENABLED or not url:
+            return None
+        entry = self.entries.get(get_media_key(url))
+        return f"{self.directory}/{entry['file']}" if entry else None
+
+    def lookup(self, url: str) -> dict | None:
+        """
+        Returns the cache entry (with its local 'path') for a track and marks it as recently used.
+        Every lookup that doesn't hit counts as a miss, whether or not the track gets recorded.
+        """
+        if not AUDIO_CACHE_ENABLED or not url:
+            return None
+        key = get_media_key(url)
+        entry = self.entries.get(key)
+        path = f"{self.directory}/{entry['file']}" if entry else None
+        if path and not os.path.exists(path):
+            self.remove(key)
+            path = None
+        if not path:
+            self.misses += 1
+            cache_requests.labels("audio", "miss").inc()
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        cache_requests.labels("audio", "hit").inc()
+        self.bytes_saved += entry["bytes"]
+        return {**entry, "path": path}
+
+    def is_cacheable(self, info: dict) -> bool:
+        """Only finished, reasonably short tracks are cached; live streams never are."""
+        if not AUDIO_CACHE_ENABLED or info.get("is_live") or info.get("live_status") == "is_live":
+            return False
+        duration = info.get("duration")
+        if not duration or duration > AUDIO_CACHE_MAX_TRACK_SECONDS:
+            return False
+        size = info.get("filesize") or info.get("filesize_approx")
+        return not size or size <= AUDIO_CACHE_MAX_TRACK_BYTES
+
+    def start_recording(self, url: str, info: dict) -> dict | None:
+        """
+        Prepares the recording of a cache miss. Returns the recording description
+        (its 'options' go to FFmpegPCMAudio) or None when the track shouldn't be cached.
+        """
+        if not url or not self.is_cacheable(info):
+            return None
+        key = get_media_key(url)
+        if key in self.entries or key in self.recording_keys:
+            return None
+        self.recordings_started += 1
+        self.recording_keys.add(key)
+        os.makedirs(self.directory, exist_ok=True)
+        file_name = self.file_name(key)
+        part_path = f"{self.directory}/{file_name[:-4]}.part.ogg"
+        # The first output is the Opus file; discord.py appends pipe:1 as the second, so its
+        # PCM format has to be repeated. Forward slashes survive discord.py's shlex.split on Windows.
+        options = f'-vn -map 0:a -c:a libopus -b:a 128k -f ogg "{part_path}" -map 0:a -vn -f s16le -ar 48000 -ac 2'
+        return {"key": key, "file": file_name, "part_path": part_path, "duration": info.get("duration"), "options": options, "process": None}
+
+    async def finish_recording(self, recording: dict):
+        """Keeps the recorded file if FFmpeg exited cleanly (end of track), otherwise deletes it."""
+        process = recording.get("process")
+        part_path = recording["part_path"]
+        try:
+            returncode = await asyncio.to_thread(process.wait, 10) if process else None
+        except Exception:
+            returncode = None
+        finally:
+            self.recording_keys.discard(recording["key"])
+
+        try:
+            size = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+            if returncode != 0 or size == 0 or size > AUDIO_CACHE_MAX_TRACK_BYTES:
+                if os.path.exists(part_path):
+                    os.remove(part_path)
+                return
+            os.replace(part_path, f"{self.directory}/{recording['file']}")
+        except OSError as e:
+            logger.error(f"Audio cache: could not finalize '{part_path}': {e}")
+            return
+
+        self.remove(recording["key"], delete_file=False)
+        self.entries[recording["key"]] = {"file": recording["file"], "bytes": size, "duration": recording["duration"]}
+        self.total_bytes += size
+        logger.info(f"Audio cache: stored '{recording['key']}' ({size} bytes).")
+        self.evict()
+        self.save()
+
+    def remove(self, key: str, delete_file: bool = True):
+        entry = self.entries.pop(key, None)
+        if not entry:
+            return
+        self.total_bytes -= entry["bytes"]
+        if delete_file:
+            try:
+                os.remove(f"{self.directory}/{entry['file']}")
+            except OSError:
+                pass
+
+    def evict(self):
+        while self.total_bytes > self.max_bytes and self.entries:
+            key = next(iter(self.entries))
+            logger.info(f"Audio cache: evicting '{key}'.")
+            self.remove(key)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "bytes": self.total_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "lookups": lookups,
+            "hit_ratio": round(self.hits / lookups * 100, 1) if lookups else 0.0,
+            "recordings_started": self.recordings_started,
+            "bytes_saved": self.bytes_saved,
+        }
+
+
+audio_cache = AudioCache(AUDIO_CACHE_DIR, AUDIO_CACHE_MAX_BYTES)
+if AUDIO_CACHE_ENABLED:
+    audio_cache.load()
+
+
+class FFmpegSupervisor:
+    """
+    Owns every FFmpeg process the bot spawns: which guild it belongs to, a global cap
+    (further spawns wait for a free slot), periodic reaping of processes that no voice
+    client is playing anymore, and per-process CPU time, RSS and spawn latency.
+    register/unregister may be called from discord.py's audio threads.
+    """
+
+    REAP_INTERVAL = 60
+    ORPHAN_GRACE_PERIOD = 30  # A process must be unused for this long before it's reaped (seconds)
+    BACKGROUND_JOB_MAX_AGE = 600  # Processes without an audio source (analysis jobs) are reaped after this (seconds)
+
+    def __init__(self, max_processes: int):
+        self.max_processes = max_processes
+        self.slots = None  # asyncio.Semaphore, created on first use inside the running loop
+        self.loop = None
+        self.lock = threading.Lock()
+        self.processes = {}  # pid -> entry
+        self.waiting = 0
+        self.spawned_total = 0
+        self.reaped_total = 0
+        self.finished_cpu_seconds = 0.0
+        self.spawn_latencies = deque(maxlen=200)
+        self.reaper_task = None
+
+    async def acquire(self, guild_id: int):
+        """Waits for a free process slot. Must be followed by a spawn or by release_slot()."""
+        if not self.max_processes:
+            return
+        if self.slots is None:
+            self.loop = asyncio.get_running_loop()
+            self.slots = asyncio.Semaphore(self.max_processes)
+        if self.slots.locked():
+            logger.warning(f"[{guild_id}] FFmpeg process cap ({self.max_processes}) reached, waiting for a free slot.")
+        self.waiting += 1
+        try:
+            await self.slots.acquire()
+        finally:
+            self.waiting -= 1
+
+    def release_slot(self):
+        if self.slots is not None:
+            self.loop.call_soon_threadsafe(self.slots.release)
+
+    def register(self, process, source, guild_id: int, kind: str, spawn_latency: float):
+        with self.lock:
+            self.processes[process.pid] = {
+                "process": process,
+                "source": weakref.ref(source) if source is not None else None,
+                "guild_id": guild_id,
+                "kind": kind,
+                "spawned_at": time.time(),
+                "unused_since": None,
+                "cpu_seconds": 0.0,
+                "rss": 0,
+            }
+            self.spawned_total += 1
+            self.spawn_latencies.append(spawn_latency)
+        ffmpeg_spawns.labels(kind).inc()
+        ffmpeg_spawn_times.observe(spawn_latency)
+
+    def unregister(self, pid: int) -> bool:
+        """Forgets a process and frees its slot. Returns False if it was already gone."""
+        with self.lock:
+            entry = self.processes.pop(pid, None)
+            if not entry:
+                return False
+            self.finished_cpu_seconds += entry["cpu_seconds"]
+        self.release_slot()
+        return True
+
+    def kill_guild(self, guild_id: int, reason: str):
+        """Kills every FFmpeg process owned by a guild. Their sources clean up (and unregister) normally."""
+        with self.lock:
+            entries = [e for e in self.processes.values() if e["guild_id"] == guild_id]
+        for entry in entries:
+            try:
+                entry["process"].kill()
+                logger.info(f"[{guild_id}] Killed FFmpeg process {entry['process'].pid} ({reason}).")
+            except Exception as e:
+                logger.error(f"[{guild_id}] Error killing FFmpeg process ({reason}): {e}")
+
+    def is_in_use(self, entry: dict) -> bool:
+        """True if the guild's voice client is currently playing the source that owns this process."""
+        if entry["source"] is None:
+            return time.time() - entry["spawned_at"] < self.BACKGROUND_JOB_MAX_AGE
+        source = entry["source"]()
+        # Runs in the reaper's thread: read the guild state, never create it.
+        state = guild_states.get(entry["guild_id"])
+        vc = state.music_player.voice_client if state else None
+        if source is None or not vc or not vc.is_connected():
+            return False
+        current = vc.source
+        while current is not None:
+            if current is source:
+                return True
+            current = getattr(current, "original", None)
+        return False
+
+    def sample(self, entry: dict):
+        try:
+            ps_process = psutil.Process(entry["process"].pid)
+            cpu = ps_process.cpu_times()
+            entry["cpu_seconds"] = cpu.user + cpu.system
+            entry["rss"] = ps_process.memory_info().rss
+        except psutil.Error:
+            pass
+
+    def reap(self):
+        """Unregisters exited processes and kills the ones nobody has been playing for a while."""
+        now = time.time()
+        with self.lock:
+            entries = list(self.processes.items())
+        for pid, entry in entries:
+            process = entry["process"]
+            if process.poll() is not None:
+                if self.unregister(pid):
+                    self.reaped_total += 1
+                continue
+            self.sample(entry)
+            if self.is_in_use(entry):
+                entry["unused_since"] = None
+                continue
+            entry["unused_since"] = entry["unused_since"] or now
+            if now - entry["unused_since"] >= self.ORPHAN_GRACE_PERIOD:
+                logger.warning(f"[{entry['guild_id']}] Reaping orphaned FFmpeg process {pid} ({entry['kind']}).")
+                try:
+                    process.kill()
+                    process.wait(timeout=5)
+                except Exception as e:
+                    logger.error(f"[{entry['guild_id']}] Error reaping FFmpeg process {pid}: {e}")
+                if self.unregister(pid):
+                    self.reaped_total += 1
+
+        # FFmpeg children we never spawned through the supervisor are leaks by definition.
+        try:
+            for child in psutil.Process().children(recursive=False):
+                if "ffmpeg" in child.name().lower() and child.pid not in self.processes and now - child.create_time() >= self.ORPHAN_GRACE_PERIOD:
+                    logger.warning(f"Reaping untracked FFmpeg process {child.pid}.")
+                    child.kill()
+                    self.reaped_total += 1
+        except psutil.Error:
+            pass
+
+    async def run_reaper(self):
+        while True:
+            await asyncio.sleep(self.REAP_INTERVAL)
+            try:
+                await asyncio.to_thread(self.reap)
+            except Exception as e:
+                logger.error(f"Error in FFmpeg reaper: {e}")
+
+    def start(self):
+        if self.reaper_task is None or self.reaper_task.done():
+            self.reaper_task = asyncio.create_task(self.run_reaper())
+
+    def metrics(self) -> dict:
+        """Structured snapshot of the supervisor, sampled now."""
+        with self.lock:
+            entries = list(self.processes.values())
+        per_guild = {}
+        for entry in entries:
+            self.sample(entry)
+            per_guild[entry["guild_id"]] = per_guild.get(entry["guild_id"], 0) + 1
+        latencies = list(self.spawn_latencies)
+        return {
+            "active": len(entries),
+            "max_processes": self.max_processes,
+            "waiting": self.waiting,
+            "spawned_total": self.spawned_total,
+            "reaped_total": self.reaped_total,
+            "per_guild": per_guild,
+            "cpu_seconds_active": round(sum(e["cpu_seconds"] for e in entries), 2),
+            "cpu_seconds_total": round(self.finished_cpu_seconds + sum(e["cpu_seconds"] for e in entries), 2),
+            "rss_bytes": sum(e["rss"] for e in entries),
+            "spawn_latency_avg_ms": round(sum(latencies) / len(latencies) * 1000, 1) if latencies else 0.0,
+            "spawn_latency_max_ms": round(max(latencies) * 1000, 1) if latencies else 0.0,
+        }
+
+
+ffmpeg_supervisor = FFmpegSupervisor(FFMPEG_MAX_PROCESSES)
+
+
+class SupervisedFFmpegPCMAudio(discord.FFmpegPCMAudio):
+    """FFmpegPCMAudio whose process is registered with (and accounted by) the FFmpeg supervisor."""
+
+    def __init__(self, source, *, guild_id: int, kind: str = "playback", **kwargs):
+        self.guild_id = guild_id
+        self.kind = kind
+        super().__init__(source, **kwargs)
+
+    def _spawn_process(self, args, **subprocess_kwargs):
+        started = time.perf_counter()
+        process = super()._spawn_process(args, **subprocess_kwargs)
+        ffmpeg_supervisor.register(process, self, self.guild_id, self.kind, time.perf_counter() - started)
+        return process
+
+    def cleanup(self):
+        process = getattr(self, "_process", None)
+        super().cleanup()
+        if process:
+            ffmpeg_supervisor.unregister(process.pid)
+
+
+class LoudnessAnalyzer:
+    """
+    EBU R128 loudness normalization. The integrated loudness and true peak of a track are
+    measured once by a low-priority background FFmpeg (ebur128 filter), from the local audio
+    cache when the track is there, and the resulting gain is stored in the shared cache.
+    Later plays apply it as a static `volume` filter: no second pass, no per-frame Python work.
+    """
+
+    MAX_CONCURRENT_MEASUREMENTS = 2
+    MAX_TRACK_SECONDS = 1800
+    MEASUREMENT_TIMEOUT = 300
+    MAX_GAIN_DB = 10.0
+    MIN_GAIN_DB = -20.0
+    TRUE_PEAK_CEILING_DB = -1.0
+
+    def __init__(self):
+        self.gains = SharedCache("loudness", maxsize=100000, ttl=30 * 24 * 3600)
+        self.semaphore = None
+        self.in_flight = set()
+
+    def get_gain(self, url: str) -> float | None:
+        """Gain (dB) to apply to a track, or None if it hasn't been measured yet."""
+        if not LOUDNESS_NORMALIZATION or not url:
+            return None
+        entry = self.gains.get(get_media_key(url))
+        return entry["gain_db"] if entry else None
+
+    def ffmpeg_filter(self, url: str) -> str:
+        """FFmpeg output options applying the stored gain, or an empty string."""
+        gain = self.get_gain(url)
+        return f"-af volume={gain:.2f}dB" if gain else ""
+
+    def schedule(self, guild_id: int, url: str, info: dict):
+        """Starts a background measurement for a track that hasn't been measured yet."""
+        if not LOUDNESS_NORMALIZATION or not url or info.get("is_live") or info.get("live_status") == "is_live":
+            return
+        duration = info.get("duration")
+        if duration and duration > self.MAX_TRACK_SECONDS:
+            return
+        key = get_media_key(url)
+        if key in self.in_flight or key in self.gains:
+            return
+        local_path = audio_cache.peek_path(url)
+        source = local_path or info.get("url")
+        if not source:
+            return
+        self.in_flight.add(key)
+        asyncio.create_task(self.measure(guild_id, key, source, is_local=bool(local_path)))
+
+    async def measure(self, guild_id: int, key: str, source: str, is_local: bool):
+        if self.semaphore is None:
+            self.semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_MEASUREMENTS)
+        try:
+            async with self.semaphore:
+                await ffmpeg_supervisor.acquire(guild_id)
+                try:
+                    result = await asyncio.to_thread(self.run_ebur128, guild_id, source, is_local)
+                except Exception:
+                    ffmpeg_supervisor.release_slot()
+                    raise
+            if result is None:
+                logger.warning(f"[{guild_id}] Loudness measurement failed for '{key}'.")
+                return
+            integrated, true_peak = result
+            gain = LOUDNESS_TARGET_LUFS - integrated
+            if true_peak is not None:
+                gain = min(gain, self.TRUE_PEAK_CEILING_DB - true_peak)
+            gain = round(max(self.MIN_GAIN_DB, min(gain, self.MAX_GAIN_DB)), 2)
+            self.gains.set(key, {"integrated_lufs": integrated, "true_peak_db": true_peak, "gain_db": gain})
+            logger.info(f"[{guild_id}] Loudness of '{key}': {integrated} LUFS, gain {gain:+.2f} dB.")
+        except Exception as e:
+            logger.error(f"[{guild_id}] Error measuring loudness of '{key}': {e}")
+        finally:
+            self.in_flight.discard(key)
+
+    def run_ebur128(self, guild_id: int, source: str, is_local: bool) -> tuple | None:
+        """Runs in a thread. Returns (integrated LUFS, true peak dBFS or None), or None on failure."""
+        args = ["ffmpeg", "-nostdin", "-hide_banner"]
+        if not is_local:
+            args += ["-reconnect", "1", "-reconnect_streamed", "1", "-reconnect_delay_max", "5"]
+        args += ["-i", source, "-vn", "-af", "ebur128=peak=true", "-f", "null", "-"]
+
+        started = time.perf_counter()
+        process = subprocess.Popen(args, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        ffmpeg_supervisor.register(process, None, guild_id, "loudness", time.perf_counter() - started)
+        try:
+            try:
+                ps_process = psutil.Process(process.pid)
+                ps_process.nice(psutil.IDLE_PRIORITY_CLASS if platform.system() == "Windows" else 19)
+            except psutil.Error:
+                pass
+            _, stderr = process.communicate(timeout=self.MEASUREMENT_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.communicate()
+            return None
+        finally:
+            ffmpeg_supervisor.unregister(process.pid)
+
+        output = stderr.decode("utf-8", errors="ignore")
+        # The summary printed at the end holds the values for the whole track.
+        integrated = re.findall(r"I:\s+(-?\d+(?:\.\d+)?) LUFS", output)
+        peaks = re.findall(r"Peak:\s+(-?\d+(?:\.\d+)?) dBFS", output)
+        if process.returncode != 0 or not integrated:
+            return None
+        return float(integrated[-1]), (float(peaks[-1]) if peaks else None)
+
+
+loudness_analyzer = LoudnessAnalyzer()
+
+
+class AutoplayEngine:
+    """
+    Autoplay recommendations. Each guild keeps a pool of candidates (MusicPlayer.autoplay_pool)
+    blended from the mixes of its last few tracks (YouTube Mix, SoundCloud station) and deduped
+    against recent history by canonical media key. While a track plays, the pool is refilled in
+    the background; candidates only reach the queue once it has drained, so tracks users queue
+    always play first, and autoplay only waits for an extraction when the pool is cold.
+    Mixes are cached per seed in the shared cache.
+    """
+
+    SEED_COUNT = 3
+    HISTORY_WINDOW = 100
+    MIX_SIZE = 50
+    POOL_LOW_WATER = 15
+    QUEUE_BATCH = 10  # Candidates queued at once when the queue has drained
+    MIX_YDL_OPTS = {"extract_flat": True, "quiet": True, "noplaylist": False}
+
+    def __init__(self):
+        self.mixes = SharedCache("autoplay_mix", maxsize=20000, ttl=6 * 3600)
+
+    def get_seeds(self, music_player, song_that_just_ended=None) -> list:
+        """URLs of the last SEED_COUNT distinct tracks autoplay can build a mix from, most recent first."""
+        candidates = [song_that_just_ended] if song_that_just_ended else []
+        candidates += reversed(music_player.history[-self.HISTORY_WINDOW :])
+        candidates += reversed(music_player.radio_playlist)
+        seeds, seen = [], set()
+        for track in candidates:
+            url = (track.get("webpage_url") or track.get("url")) if isinstance(track, dict) else None
+            if not url or not is_autoplay_seed(url) or get_media_key(url) in seen:
+                continue
+            seen.add(get_media_key(url))
+            seeds.append(url)
+            if len(seeds) == self.SEED_COUNT:
+                break
+        return seeds
+
+    async def fetch_mix(self, seed_url: str) -> list:
+        """Recommendations for one seed, as plain {url, title, webpage_url} entries. Cached per seed."""
+        seed_key = get_media_key(seed_url)
+        cached = self.mixes.get(seed_key)
+        if cached is not None:
+            return cached
+
+        entries = []
+        try:
+            seed_platform = classify(seed_url).platform
+            if seed_platform in YOUTUBE_PLATFORMS:
+                mix_playlist_url = get_mix_playlist_url(seed_url)
+                if mix_playlist_url:
+                    info = await run_ydl_with_low_priority(dict(self.MIX_YDL_OPTS), mix_playlist_url, profile="mix")
+                    entries = info.get("entries") or []
+            elif seed_platform == "soundcloud":
+                station_url = get_soundcloud_station_url(await get_soundcloud_track_id(seed_url))
+                if station_url:
+                    info = await run_ydl_with_low_priority(dict(self.MIX_YDL_OPTS), station_url, profile="mix")
+                    # The first entry of a station is the seed itself
+                    entries = (info.get("entries") or [])[1:]
+        except Exception as e:
+            logger.warning(f"Autoplay mix for '{seed_url}' failed: {e}")
+            return []
+
+        mix = [
+            {"url": entry["url"], "title": entry.get("title") or "Unknown Title", "webpage_url": entry.get("webpage_url") or entry["url"]}
+            for entry in entries
+            if entry and entry.get("url") and get_media_key(entry["url"]) != seed_key
+        ][: self.MIX_SIZE]
+        if mix:
+            self.mixes.set(seed_key, mix)
+        return mix
+
+    @staticmethod
+    def blend(mixes: list) -> list:
+        """Interleaves the mixes of several seeds round-robin, the most recent seed first."""
+        blended = []
+        for group in itertools.zip_longest(*mixes):
+            blended.extend(entry for entry in group if entry)
+        return blended
+
+    def excluded_keys(self, music_player, include_pool: bool = True) -> set:
+        """Media keys a new candidate must not have: recent history, current track, queue (and pool)."""
+        tracks = music_player.history[-self.HISTORY_WINDOW :] + list(music_player.queue._queue)
+        if music_player.current_info:
+            tracks.append(music_player.current_info)
+        if include_pool:
+            tracks += music_player.autoplay_pool
+        return {key for key in map(get_track_key, tracks) if key}
+
+    async def refill(self, guild_id: int, music_player, song_that_just_ended=None) -> int:
+        """Adds fresh candidates from the blended seed mixes to the pool. Returns how many were added."""
+        seeds = self.get_seeds(music_player, song_that_just_ended)
+        if not seeds:
+            return 0
+        mixes = await asyncio.gather(*[self.fetch_mix(seed) for seed in seeds])
+        excluded = self.excluded_keys(music_player) | {get_media_key(seed) for seed in seeds}
+        added = 0
+        for entry in self.blend(mixes):
+            key = get_media_key(entry["url"])
+            if key in excluded or negative_cache.get(entry["url"]):
+                continue
+            excluded.add(key)
+            music_player.autoplay_pool.append(entry)
+            added += 1
+        logger.info(f"[{guild_id}] Autoplay pool refilled from {len(seeds)} seed(s): +{added} candidates ({len(music_player.autoplay_pool)} pooled).")
+        return added
+
+    def pop_candidates(self, music_player, count: int) -> list:
+        """Takes up to `count` candidates from the pool, skipping those played since they were pooled."""
+        excluded = self.excluded_keys(music_player, include_pool=False)
+        taken = []
+        while music_player.autoplay_pool and len(taken) < count:
+            entry = music_player.autoplay_pool.popleft()
+            key = get_media_key(entry["url"])
+            if key not in excluded:
+                excluded.add(key)
+                taken.append(entry)
+        return taken
+
+    async def take(self, guild_id: int, count: int, song_that_just_ended=None) -> list:
+        """Candidates for an empty queue. Only waits for an extraction if the pool is cold."""
+        music_player = get_guild_state(guild_id).music_player
+        refill_task = music_player.autoplay_refill_task
+        if refill_task and not refill_task.done():
+            await asyncio.shield(refill_task)
+        if not music_player.autoplay_pool:
+            await self.refill(guild_id, music_player, song_that_just_ended)
+        return self.pop_candidates(music_player, count)
+
+    @staticmethod
+    def to_queue_item(entry: dict, requester) -> dict:
+        return {"url": entry["url"], "title": entry["title"], "webpage_url": entry["webpage_url"], "is_single": True, "requester": requester}
+
+    def toggled(self, guild_id: int):
+        """Called when autoplay is switched on or off: warms the pool up, or drops it."""
+        music_player = get_guild_state(guild_id).music_player
+        if music_player.autoplay_enabled:
+            self.schedule(guild_id)
+        else:
+            music_player.autoplay_pool.clear()
+
+    def schedule(self, guild_id: int):
+        """Called when a track starts: refills the pool in the background if it runs low."""
+        music_player = get_guild_state(guild_id).music_player
+        if not music_player.autoplay_enabled or not music_player.voice_client or not music_player.voice_client.is_playing():
+            return
+        if music_player.autoplay_refill_task and not music_player.autoplay_refill_task.done():
+            return
+        if len(music_player.autoplay_pool) >= self.POOL_LOW_WATER:
+            return
+        music_player.autoplay_refill_task = asyncio.create_task(self.maintain(guild_id, music_player))
+
+    async def maintain(self, guild_id: int, music_player):
+        try:
+            await self.refill(guild_id, music_player)
+        except Exception as e:
+            logger.error(f"[{guild_id}] Autoplay background refill failed: {e}", exc_info=True)
+
+
+autoplay_engine = AutoplayEngine()
+
+
+# Strong references to fire-and-forget tasks (the loop only keeps weak ones).
+background_tasks = set()
+
+
+def create_background_task(coroutine) -> asyncio.Task:
+    """Starts a task nobody awaits and keeps it referenced until it finishes."""
+    task = asyncio.create_task(coroutine)
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
+    return task
+
+
+class AutoplayProgress:
+    """
+    Autoplay's progress message, never awaited by playback. The loading message is sent in the
+    background; report() then edits it with the outcome (or deletes it when nothing was added)
+    from a single background coroutine, once the message exists.
+    """
+
+    def __init__(self, channel):
+        self.channel = channel
+        self.sending = None
+
+    def send(self, embed: Embed):
+        """Sends the message in the background, unless one is already there."""
+        if self.sending or not self.channel:
+            return
+        self.sending = create_background_task(self.channel.send(embed=embed, silent=SILENT_MESSAGES))
+        # Mark a failed send (e.g. missing permissions) as retrieved even if nothing is reported.
+        self.sending.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+    def show_notice(self):
+        self.send(Embed(description=get_messages("autoplay_direct_link_notice"), color=discord.Color.blue()))
+
+    def show_loading(self):
+        self.send(
+            Embed(
+                title=get_messages("autoplay.loading_title"),
+                description=get_messages("autoplay.loading_description").format(progress_bar=create_loading_bar(0), processed=0, total="?"),
+                color=discord.Color.blue(),
+            )
+        )
+
+    def report(self, added_count: int):
+        if self.sending:
+            create_background_task(self.finish(self.sending, added_count))
+
+    @staticmethod
+    async def finish(sending: asyncio.Task, added_count: int):
+        try:
+            message = await sending
+            if added_count > 0:
+                final_embed = message.embeds[0] if message.embeds else Embed()
+                final_embed.title = None
+                final_embed.description = get_messages("autoplay.finished_description").format(count=added_count)
+                final_embed.color = discord.Color.green()
+                await message.edit(embed=final_embed)
+            else:
+                await message.delete()
+        except discord.HTTPException as e:
+            logger.warning(f"Autoplay progress message update failed: {e}")
+
+
 # ==============================================================================
 # 4. CORE AUDIO & PLAYBACK LOGIC
 # ==============================================================================
@@ -2686,6 +5224,11 @@ async def play_audio(guild_id, seek_time=0, is_a_loop=False, song_that_just_ende
         if error:
             logger.error(f"Error after playing in guild {guild_id}: {error}")
 
+        if music_player.audio_cache_recording:
+            recording = music_player.audio_cache_recording
+            music_player.audio_cache_recording = None
+            bot.loop.create_task(audio_cache.finish_recording(recording))
+
         if music_player.is_paused_by_leave:
             logger.info(f"[{guild_id}] Playback intentionally paused due to empty channel. Not proceeding to next track.")
             return
@@ -2695,6 +5238,7 @@ async def play_audio(guild_id, seek_time=0, is_a_loop=False, song_that_just_ende
         if music_player.manual_stop:
             logger.warning(f"[{guild_id}] after_playing: Manual stop detected. Bypassing 24/7 logic.")
             music_player.manual_stop = False
+            music_player.track_ended_at = time.perf_counter()
             bot.loop.create_task(play_audio(guild_id, is_a_loop=False, song_that_just_ended=song_that_finished))
             return
 
@@ -2710,16 +5254,16 @@ async def play_audio(guild_id, seek_time=0, is_a_loop=False, song_that_just_ende
             bot.loop.create_task(play_audio(guild_id, seek_time=new_seek_time, is_a_loop=True))
             return
 
+        music_player.track_ended_at = time.perf_counter()
         if music_player.loop_current:
             bot.loop.create_task(play_audio(guild_id, is_a_loop=True))
             return
 
         music_player.current_info = None
 
-        if song_that_finished:
-            track_to_requeue = create_queue_item_from_info(song_that_finished, guild_id)
-            if get_guild_state(guild_id)._24_7_mode and not music_player.autoplay_enabled:
-                await music_player.queue.put(track_to_requeue)
+        if song_that_finished and get_guild_state(guild_id)._24_7_mode and not music_player.autoplay_enabled:
+            # Tracks queued by users during 24/7 join the rotation (no-op for rotation tracks).
+            music_player.radio_playlist.include(create_queue_item_from_info(song_that_finished, guild_id))
 
         bot.loop.create_task(play_audio(guild_id, is_a_loop=False, song_that_just_ended=song_that_finished))
 
@@ -2727,105 +5271,44 @@ async def play_audio(guild_id, seek_time=0, is_a_loop=False, song_that_just_ende
         if not (is_a_loop or seek_time > 0):
             if music_player.queue.empty():
                 if get_guild_state(guild_id)._24_7_mode and not music_player.autoplay_enabled and music_player.radio_playlist:
-                    for track_info_radio in music_player.radio_playlist:
-                        await music_player.queue.put(track_info_radio)
+                    # Known-dead entries are passed, otherwise a fully dead playlist would loop forever.
+                    next_radio_track = music_player.radio_playlist.advance(skip=negative_cache.is_known_dead)
+                    if next_radio_track:
+                        music_player.queue.put_nowait(next_radio_track)
 
                 elif (get_guild_state(guild_id)._24_7_mode and music_player.autoplay_enabled) or music_player.autoplay_enabled:
                     music_player.suppress_next_now_playing = False
 
-                    seed_url = None
-                    progress_message = None
+                    progress = AutoplayProgress(music_player.text_channel)
 
                     seed_source_info = song_that_just_ended or (music_player.history[-1] if music_player.history else None)
 
                     if seed_source_info:
                         url_to_test = seed_source_info.get("webpage_url") or seed_source_info.get("url", "")
 
-                        if IS_PUBLIC_VERSION and ("youtube.com" in url_to_test or "youtu.be" in url_to_test):
-                            url_to_test = ""
-
-                        if any(s in url_to_test for s in ["youtube.com", "youtu.be", "soundcloud.com"]):
-                            seed_url = url_to_test
-                        else:
-                            if music_player.text_channel:
-                                try:
-                                    notice_key = "autoplay_direct_link_notice"
-                                    notice_embed = Embed(description=get_messages(notice_key), color=discord.Color.blue())
-                                    progress_message = await music_player.text_channel.send(embed=notice_embed, silent=SILENT_MESSAGES)
-                                except discord.Forbidden:
-                                    pass
-
-                            source_list = music_player.radio_playlist if get_guild_state(guild_id)._24_7_mode and music_player.radio_playlist else music_player.history
-                            for track in reversed(source_list):
-                                fallback_url_to_test = track.get("webpage_url") or track.get("url", "")
-                                if fallback_url_to_test and any(s in fallback_url_to_test for s in ["youtube.com", "youtu.be", "soundcloud.com"]):
-                                    if IS_PUBLIC_VERSION and ("youtube.com" in fallback_url_to_test or "youtu.be" in fallback_url_to_test):
-                                        continue
-                                    seed_url = fallback_url_to_test
-                                    break
-
-                    if seed_url:
+                        # The last track can't seed a mix: recommendations come from earlier tracks.
+                        if not is_autoplay_seed(url_to_test):
+                            progress.show_notice()
+
+                    if autoplay_engine.get_seeds(music_player, song_that_just_ended) or music_player.autoplay_pool:
                         added_count = 0
                         try:
-                            if not progress_message and music_player.text_channel:
-                                initial_embed = Embed(
-                                    title=get_messages("autoplay.loading_title"),
-                                    description=get_messages("autoplay.loading_description").format(progress_bar=create_loading_bar(0), processed=0, total="?"),
-                                    color=discord.Color.blue(),
-                                )
-                                progress_message = await music_player.text_channel.send(embed=initial_embed, silent=SILENT_MESSAGES)
-
-                            recommendations = []
-                            if "youtube.com" in seed_url or "youtu.be" in seed_url:
-                                mix_playlist_url = get_mix_playlist_url(seed_url)
-                                if mix_playlist_url:
-                                    info = await run_ydl_with_low_priority({"extract_flat": True, "quiet": True, "noplaylist": False}, mix_playlist_url)
-                                    if info.get("entries"):
-                                        current_video_id = get_video_id(seed_url)
-                                        recommendations = [entry for entry in info["entries"] if entry and get_video_id(entry.get("url", "")) != current_video_id][:50]
-                            elif "soundcloud.com" in seed_url:
-                                track_id = get_soundcloud_track_id(seed_url)
-                                station_url = get_soundcloud_station_url(track_id)
-                                if station_url:
-                                    info = await run_ydl_with_low_priority({"extract_flat": True, "quiet": True, "noplaylist": False}, station_url)
-                                    if info.get("entries") and len(info.get("entries")) > 1:
-                                        recommendations = info["entries"][1:]
-
-                            if recommendations and progress_message:
-                                total_to_add = len(recommendations)
-                                original_requester = seed_source_info.get("requester", bot.user) if seed_source_info else bot.user
-
-                                for i, entry in enumerate(recommendations):
-                                    await music_player.queue.put(
-                                        {
-                                            "url": entry.get("url"),
-                                            "title": entry.get("title", "Unknown Title"),
-                                            "webpage_url": entry.get("webpage_url", entry.get("url")),
-                                            "is_single": True,
-                                            "requester": original_requester,
-                                        }
-                                    )
-                                    added_count += 1
-
-                                    if (i + 1) % 10 == 0 or (i + 1) == total_to_add:
-                                        progress = (i + 1) / total_to_add
-                                        updated_embed = progress_message.embeds[0]
-                                        updated_embed.description = get_messages("autoplay.loading_description").format(progress_bar=create_loading_bar(progress), processed=added_count, total=total_to_add)
-                                        await progress_message.edit(embed=updated_embed)
-                                        await asyncio.sleep(0.5)
+                            # The loading message is only worth sending when the pool is cold.
+                            if not music_player.autoplay_pool:
+                                progress.show_loading()
+
+                            recommendations = await autoplay_engine.take(guild_id, AutoplayEngine.QUEUE_BATCH, song_that_just_ended)
+                            original_requester = seed_source_info.get("requester", bot.user) if seed_source_info else bot.user
+                            # One bulk insertion: the first recommendation starts right below,
+                            # while the progress message is updated in the background.
+                            added_count = enqueue_many(music_player.queue, [AutoplayEngine.to_queue_item(entry, original_requester) for entry in recommendations])
                         except Exception as e:
-                            logger.error(f"Autoplay progress UI error: {e}", exc_info=True)
+                            logger.error(f"[{guild_id}] Autoplay error: {e}", exc_info=True)
                         finally:
-                            if progress_message and added_count > 0:
-                                final_embed = progress_message.embeds[0]
-                                final_embed.title = None
-                                final_embed.description = get_messages("autoplay.finished_description").format(count=added_count)
-                                final_embed.color = discord.Color.green()
-                                await progress_message.edit(embed=final_embed)
-                            elif progress_message and added_count == 0:
-                                await progress_message.delete()
+                            progress.report(added_count)
                 if music_player.queue.empty():
                     music_player.current_task = None
+                    music_player.track_ended_at = None  # Idle is not a track switch
                     bot.loop.create_task(update_controller(bot, guild_id))
                     if not get_guild_state(guild_id)._24_7_mode:
                         await asyncio.sleep(60)
@@ -2867,6 +5350,8 @@ async def play_audio(guild_id, seek_time=0, is_a_loop=False, song_that_just_ende
                 music_player.suppress_next_now_playing = True
 
             music_player.current_info = full_playback_info
+            if get_guild_state(guild_id)._24_7_mode and not music_player.autoplay_enabled:
+                music_player.radio_playlist.sync_to(full_playback_info)
 
             if not music_player.loop_current:
                 music_player.history.append(full_playback_info)
@@ -2877,52 +5362,123 @@ async def play_audio(guild_id, seek_time=0, is_a_loop=False, song_that_just_ende
 
         url_for_fetching = music_player.current_info.get("webpage_url") or music_player.current_info.get("url")
 
-        logger.info(f"[{guild_id}] Refreshing stream URL for '{music_player.current_info.get('title')}' to prevent expiration.")
-        try:
-            refreshed_info = await fetch_video_info_with_retry(url_for_fetching)
-            music_player.current_info.update(refreshed_info)
-        except Exception as e:
-            logger.error(f"[{guild_id}] FAILED to refresh stream URL for {url_for_fetching}: {e}", exc_info=True)
-            if music_player.text_channel:
-                try:
-                    emoji, title_key, desc_key = parse_yt_dlp_error(str(e))
-                    embed = Embed(
-                        title=f"{emoji} {get_messages('error.playback_failed.title')}",
-                        description=get_messages(desc_key) + "\n*" + get_messages("player.track_will_be_skipped") + "*",
-                        color=discord.Color.red(),
-                    )
-                    embed.add_field(name=get_messages("error.generic.affected_url_field"), value=f"`{url_for_fetching}`")
-                    await music_player.text_channel.send(embed=embed, silent=SILENT_MESSAGES)
-                except discord.Forbidden:
-                    pass
-            bot.loop.create_task(play_audio(guild_id, song_that_just_ended=music_player.current_info))
-            return
+        # /play may have extracted the stream URL already: reuse it instead of extracting again.
+        prefetched_stream_url = music_player.current_info.pop("stream_url", None)
+        prefetched_at = music_player.current_info.pop("stream_url_fetched_at", None)
+        reuse_stream_url = is_a_loop
+        if not is_a_loop and is_stream_url_fresh(prefetched_stream_url, prefetched_at):
+            music_player.current_info["url"] = prefetched_stream_url
+            music_player.stream_url_fetched_at = prefetched_at
+            reuse_stream_url = True
+
+        # A locally cached copy needs neither a stream URL refresh nor the network.
+        cached_audio = audio_cache.lookup(url_for_fetching)
+        if cached_audio:
+            logger.info(f"[{guild_id}] Playing '{music_player.current_info.get('title')}' from the local audio cache.")
+            if not music_player.current_info.get("duration") and cached_audio.get("duration"):
+                music_player.current_info["duration"] = cached_audio["duration"]
+            audio_url = cached_audio["path"]
+            music_player.is_current_live = False
+        elif reuse_stream_url and is_stream_url_fresh(music_player.current_info.get("url"), music_player.stream_url_fetched_at):
+            # Seeks, loop restarts and tracks extracted by /play reuse their stream URL instead of re-extracting.
+            logger.info(f"[{guild_id}] Reusing the current stream URL for '{music_player.current_info.get('title')}'.")
+            audio_url = music_player.current_info["url"]
+            music_player.is_current_live = music_player.current_info.get("is_live", False) or music_player.current_info.get("live_status") == "is_live"
+        else:
+            logger.info(f"[{guild_id}] Refreshing stream URL for '{music_player.current_info.get('title')}' to prevent expiration.")
+            try:
+                # Known-dead media is skipped instantly, without any extraction attempt.
+                known_failure = negative_cache.get(url_for_fetching)
+                if known_failure:
+                    logger.info(f"[{guild_id}] Known {known_failure['error_class']} failure for '{url_for_fetching}' (negative cache).")
+                    raise yt_dlp.utils.DownloadError(known_failure["message"])
+                refreshed_info = await fetch_video_info_with_retry(url_for_fetching)
+                music_player.current_info.update(refreshed_info)
+                music_player.stream_url_fetched_at = time.time()
+            except Exception as e:
+                logger.error(f"[{guild_id}] FAILED to refresh stream URL for {url_for_fetching}: {e}", exc_info=True)
+                if music_player.text_channel:
+                    try:
+                        emoji, title_key, desc_key = parse_yt_dlp_error(str(e))
+                        embed = Embed(
+                            title=f"{emoji} {get_messages('error.playback_failed.title')}",
+                            description=get_messages(desc_key) + "\n*" + get_messages("player.track_will_be_skipped") + "*",
+                            color=discord.Color.red(),
+                        )
+                        embed.add_field(name=get_messages("error.generic.affected_url_field"), value=f"`{url_for_fetching}`")
+                        await music_player.text_channel.send(embed=embed, silent=SILENT_MESSAGES)
+                    except discord.Forbidden:
+                        pass
+                bot.loop.create_task(play_audio(guild_id, song_that_just_ended=music_player.current_info))
+                return
 
-        audio_url = music_player.current_info.get("url")
-        if not audio_url:
-            logger.error(f"[{guild_id}] Playback info retrieved but 'url' key is missing after refresh. Skipping.")
-            bot.loop.create_task(play_audio(guild_id, song_that_just_ended=music_player.current_info))
-            return
+            audio_url = music_player.current_info.get("url")
+            if not audio_url:
+                logger.error(f"[{guild_id}] Playback info retrieved but 'url' key is missing after refresh. Skipping.")
+                bot.loop.create_task(play_audio(guild_id, song_that_just_ended=music_player.current_info))
+                return
 
-        music_player.is_current_live = music_player.current_info.get("is_live", False) or music_player.current_info.get("live_status") == "is_live"
+            music_player.is_current_live = music_player.current_info.get("is_live", False) or music_player.current_info.get("live_status") == "is_live"
 
         ffmpeg_options = {"options": "-vn"}
-        ffmpeg_options["before_options"] = "-reconnect 1 -reconnect_streamed 1 -reconnect_delay_max 5"
+        if not cached_audio:
+            ffmpeg_options["before_options"] = "-reconnect 1 -reconnect_streamed 1 -reconnect_delay_max 5"
         if seek_time > 0:
             ffmpeg_options["before_options"] = f"-ss {seek_time} {ffmpeg_options.get('before_options', '')}".strip()
 
-        source = discord.PCMVolumeTransformer(discord.FFmpegPCMAudio(audio_url, **ffmpeg_options), volume=music_player.volume)
+        # A cache miss that starts at the beginning is recorded to disk while it streams.
+        recording = None
+        if not cached_audio and seek_time == 0:
+            recording = audio_cache.start_recording(url_for_fetching, music_player.current_info)
+            if recording:
+                ffmpeg_options["options"] = recording["options"]
+
+        # The loudness gain goes last so it only applies to the PCM output, never to the cached copy.
+        loudness_filter = loudness_analyzer.ffmpeg_filter(url_for_fetching)
+        if loudness_filter:
+            ffmpeg_options["options"] = f"{ffmpeg_options['options']} {loudness_filter}"
+
+        await ffmpeg_supervisor.acquire(guild_id)
+        try:
+            ffmpeg_audio = SupervisedFFmpegPCMAudio(audio_url, guild_id=guild_id, **ffmpeg_options)
+        except Exception:
+            ffmpeg_supervisor.release_slot()
+            raise
+        if music_player.is_current_live or not BufferedSeekableSource.available():
+            music_player.seekable_source = None
+            inner_source = ffmpeg_audio
+        else:
+            music_player.seekable_source = inner_source = BufferedSeekableSource(ffmpeg_audio)
+        clock = PlaybackClock(inner_source, offset=seek_time, speed=music_player.playback_speed)
+        source = VolumeSource(clock, volume=music_player.volume)
 
         callback = lambda e: bot.loop.create_task(after_playing(e))
 
         if not music_player.voice_client or not music_player.voice_client.is_connected():
             logger.warning(f"[{guild_id}] Playback canceled at the last moment: voice client is no longer valid.")
+            source.cleanup()
+            if recording:
+                await audio_cache.finish_recording(recording)
             return
 
         music_player.voice_client.play(source, after=callback)
+        if music_player.track_ended_at is not None and seek_time == 0:
+            track_switch_gaps.observe(time.perf_counter() - music_player.track_ended_at)
+        music_player.track_ended_at = None
+        music_player.playback_clock = clock
+        if music_player.pending_play_trace:
+            music_player.pending_play_trace.mark("first_audio")
+            music_player.pending_play_trace = None
+        if not loudness_filter:
+            loudness_analyzer.schedule(guild_id, url_for_fetching, music_player.current_info)
+        autoplay_engine.schedule(guild_id)
+        if recording:
+            recording["process"] = getattr(ffmpeg_audio, "_process", None)
+            music_player.audio_cache_recording = recording
 
         music_player.start_time = seek_time
         music_player.playback_started_at = time.time()
+        get_guild_state(guild_id).seek_panels.wake()
 
         state = get_guild_state(guild_id)
         if state.controller_channel_id and not is_a_loop and seek_time == 0:
@@ -2976,7 +5532,7 @@ async def play_autocomplete(interaction: discord.Interaction, current: str) -> l
         search_prefix = "scsearch10:" if IS_PUBLIC_VERSION else "ytsearch10:"
         search_query = f"{search_prefix}{sanitized_query}"  # Search for up to 10 results on SoundCloud
 
-        info = await fetch_video_info_with_retry(search_query, ydl_opts_override={"extract_flat": True, "noplaylist": True})
+        info = await fetch_video_info_with_retry(search_query, ydl_opts_override={"extract_flat": True, "noplaylist": True}, profile="flat")
 
         choices = []
         if "entries" in info and info["entries"]:
@@ -3011,6 +5567,62 @@ async def play_autocomplete(interaction: discord.Interaction, current: str) -> l
         return []  # Returns an empty list on error
 
 
+PLAY_PHASE_BUCKETS = (0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 10.0, 20.0)
+play_phase_times = metrics.histogram("playify_play_phase_seconds", "Time from the start of /play to each of its phases.", PLAY_PHASE_BUCKETS, labels=("phase",))
+
+
+class PlayTrace:
+    """
+    Times the phases of one /play request (connect, extract, enqueue, response, first_audio),
+    each measured from the start of the command. Phases overlap, so they are cumulative times,
+    not durations. The trace is recorded and logged once every expected phase is reached.
+    """
+
+    def __init__(self, guild_id: int):
+        self.guild_id = guild_id
+        self.started = time.perf_counter()
+        self.phases = {}
+        self.pending = {"response"}
+        self.finished = False
+
+    def expect(self, phase: str):
+        if not self.finished:
+            self.pending.add(phase)
+
+    def mark(self, phase: str):
+        if self.finished or phase in self.phases:
+            return
+        self.phases[phase] = time.perf_counter() - self.started
+        self.pending.discard(phase)
+        if not self.pending:
+            self.finish()
+
+    def finish(self):
+        self.finished = True
+        for phase, elapsed in self.phases.items():
+            play_phase_times.labels(phase).observe(elapsed)
+        summary = " ".join(f"{phase}={elapsed:.2f}s" for phase, elapsed in sorted(self.phases.items(), key=lambda item: item[1]))
+        logger.info(f"[{self.guild_id}] /play trace: {summary}")
+
+
+def start_play_extraction(query: str) -> asyncio.Task | None:
+    """
+    Starts the yt-dlp extraction for a /play query in the background, so it overlaps with
+    the voice connection. Returns None for queries that need a platform conversion first.
+    """
+    if needs_conversion(query):
+        return None
+    if is_direct(query):
+        coroutine = fetch_video_info_with_retry(query, ydl_opts_override={"extract_flat": True, "noplaylist": False}, profile="flat")
+    else:
+        search_prefix = "scsearch:" if IS_PUBLIC_VERSION else "ytsearch:"
+        coroutine = fetch_video_info_with_retry(f"{search_prefix}{sanitize_query(query)}", ydl_opts_override={"noplaylist": True}, profile="search")
+    task = asyncio.create_task(coroutine)
+    # Mark the result as retrieved if /play bails out before awaiting it.
+    task.add_done_callback(lambda t: t.cancelled() or t.exception())
+    return task
+
+
 @bot.tree.command(name="play", description="Play a link or search for a song")
 @app_commands.describe(query="Link or title of the song/video to play")
 @app_commands.autocomplete(query=play_autocomplete)
@@ -3024,16 +5636,33 @@ async def play(interaction: discord.Interaction, query: str):
     state = get_guild_state(guild_id)
     music_player = state.music_player
 
+    trace = PlayTrace(guild_id)
+
     if not interaction.response.is_done():
         await interaction.response.defer()
 
-    if IS_PUBLIC_VERSION and re.search(r"youtube\.com|youtu\.be|music\.youtube\.com", query):
+    if IS_PUBLIC_VERSION and classify(query).platform in YOUTUBE_PLATFORMS:
         await show_youtube_blocked_message(interaction)
         return
 
+    # Extraction doesn't depend on the voice connection: run both at the same time.
+    extraction_task = start_play_extraction(query)
+    if extraction_task:
+        extraction_task.add_done_callback(lambda _: trace.mark("extract"))
+
     voice_client = await ensure_voice_connection(interaction)
     if not voice_client:
+        if extraction_task:
+            extraction_task.cancel()
         return
+    trace.mark("connect")
+
+    def start_playback_if_idle():
+        """Starts the player right away if it's idle; the controller renders alongside."""
+        if not music_player.voice_client.is_playing() and not music_player.voice_client.is_paused():
+            trace.expect("first_audio")
+            music_player.pending_play_trace = trace
+            music_player.current_task = asyncio.create_task(play_audio(guild_id))
 
     async def add_and_update_controller(info: dict):
         queue_item = {
@@ -3044,10 +5673,15 @@ async def play(interaction: discord.Interaction, query: str):
             "is_single": True,
             "requester": interaction.user,
         }
+        # A fully extracted track already carries a stream URL: play_audio can use it as is.
+        stream_url = info.get("url")
+        if stream_url and info.get("webpage_url") and stream_url != info["webpage_url"] and info.get("formats"):
+            queue_item.update(stream_url=stream_url, stream_url_fetched_at=time.time(), duration=info.get("duration"), is_live=info.get("is_live", False))
         await music_player.queue.put(queue_item)
+        trace.mark("enqueue")
+        start_playback_if_idle()
         await update_controller(bot, guild_id, interaction=interaction)
-        if not music_player.voice_client.is_playing() and not music_player.voice_client.is_paused():
-            music_player.current_task = asyncio.create_task(play_audio(guild_id))
+        trace.mark("response")
 
     async def handle_platform_playlist(platform_tracks, platform_name):
         total_tracks = len(platform_tracks)
@@ -3062,32 +5696,26 @@ async def play(interaction: discord.Interaction, query: str):
         }
         title_key, desc_key = platform_key_map.get(platform_name)
 
+        trace.mark("enqueue")
+        start_playback_if_idle()
+
         embed = Embed(title=get_messages(title_key), description=get_messages(desc_key, count=total_tracks, failed=0, failed_tracks=""), color=discord.Color.green())
         await interaction.followup.send(silent=SILENT_MESSAGES, embed=embed)
-
-        if not music_player.voice_client.is_playing() and not music_player.voice_client.is_paused():
-            music_player.current_task = asyncio.create_task(play_audio(guild_id))
+        trace.mark("response")
 
         bot.loop.create_task(update_controller(bot, guild_id))
 
     try:
-        # Regex for platforms that require conversion (Spotify, Deezer, etc.)
-        spotify_regex = re.compile(r"^(https?://)?(open\.spotify\.com)/.+$")
-        deezer_regex = re.compile(r"^(https?://)?((www\.)?deezer\.com/(?:[a-z]{2}/)?(track|playlist|album|artist)/.+|(link\.deezer\.com)/s/.+)$")
-
-        # Regex for direct platforms (those that yt-dlp handles natively)
-        direct_platform_regex = re.compile(r"^(https?://)?((www|m)\.)?(youtube\.com|youtu\.be|music\.youtube\.com|soundcloud\.com|twitch\.tv)|([^\.]+)\.bandcamp\.com/.+$")
-        direct_link_regex = re.compile(r"^(https?://).+\.(mp3|wav|ogg|m4a|mp4|webm|flac)(\?.+)?$", re.IGNORECASE)
-
         # Blocking logic for the public version
-        if IS_PUBLIC_VERSION and re.search(r"youtube\.com|youtu\.be", query):
+        if IS_PUBLIC_VERSION and classify(query).platform in YOUTUBE_PLATFORMS:
             return
 
         # Cas 1: Plateformes nécessitant une conversion (Spotify, etc.)
         platform_processor = None
-        if spotify_regex.match(query):
+        query_platform = classify(query).platform
+        if query_platform == "spotify":
             platform_processor, platform_name = process_spotify_url, "Spotify"
-        elif deezer_regex.match(query):
+        elif query_platform == "deezer":
             platform_processor, platform_name = process_deezer_url, "Deezer"
 
         if platform_processor:
@@ -3098,7 +5726,7 @@ async def play(interaction: discord.Interaction, query: str):
                     track_name, artist_name = platform_tracks[0]
                     search_term = f"{track_name} {artist_name}"
                     search_prefix = "scsearch:" if IS_PUBLIC_VERSION else "ytsearch:"
-                    info = await fetch_video_info_with_retry(f"{search_prefix}{sanitize_query(search_term)}", ydl_opts_override={"noplaylist": True})
+                    info = await fetch_video_info_with_retry(f"{search_prefix}{sanitize_query(search_term)}", ydl_opts_override={"noplaylist": True}, profile="search")
                     video = info["entries"][0]
                     await add_and_update_controller(video)
                 else:
@@ -3107,8 +5735,8 @@ async def play(interaction: discord.Interaction, query: str):
             return  # On a fini avec ce cas
 
         # Cas 2: Plateformes directes (SoundCloud, YouTube, Bandcamp, lien .mp3)
-        if direct_platform_regex.match(query) or direct_link_regex.match(query):
-            info = await fetch_video_info_with_retry(query, ydl_opts_override={"extract_flat": True, "noplaylist": False})
+        if is_direct(query):
+            info = await extraction_task
 
             if "entries" in info and len(info["entries"]) > 1:
                 # C'est une playlist, on ajoute chaque URL dans un dictionnaire simple.
@@ -3126,11 +5754,12 @@ async def play(interaction: discord.Interaction, query: str):
                         }
                     )
 
+                trace.mark("enqueue")
+                start_playback_if_idle()
+
                 embed = Embed(title=get_messages("playlist_added"), description=get_messages("playlist_description", count=len(tracks_to_add)), color=discord.Color.green())
                 await interaction.followup.send(embed=embed, silent=SILENT_MESSAGES)
-
-                if not music_player.voice_client.is_playing() and not music_player.voice_client.is_paused():
-                    music_player.current_task = asyncio.create_task(play_audio(guild_id))
+                trace.mark("response")
             else:
                 # C'est une piste unique
                 video_info = info.get("entries", [info])[0]
@@ -3138,9 +5767,7 @@ async def play(interaction: discord.Interaction, query: str):
             return  # On a fini
 
         # Cas 3: C'est une recherche par mot-clé
-        search_prefix = "scsearch:" if IS_PUBLIC_VERSION else "ytsearch:"
-        search_query = f"{search_prefix}{sanitize_query(query)}"
-        info = await fetch_video_info_with_retry(search_query, ydl_opts_override={"noplaylist": True})
+        info = await extraction_task
 
         if not info.get("entries"):
             raise Exception("No results found.")
@@ -3178,12 +5805,7 @@ async def queue(interaction: discord.Interaction):
     tracks_for_display = []
 
     if is_24_7_normal and music_player.radio_playlist:
-        current_url = music_player.current_info.get("url") if music_player.current_info else None
-        try:
-            current_index = [t.get("url") for t in music_player.radio_playlist].index(current_url)
-            tracks_for_display = music_player.radio_playlist[current_index + 1 :] + music_player.radio_playlist[: current_index + 1]
-        except (ValueError, IndexError):
-            tracks_for_display = music_player.radio_playlist
+        tracks_for_display = music_player.radio_playlist.window(head=list(music_player.queue._queue), include_current=True)
     else:
         tracks_for_display = list(music_player.queue._queue)
 
@@ -3198,6 +5820,7 @@ async def queue(interaction: discord.Interaction):
     initial_embed = await view.create_queue_embed()
     message = await interaction.followup.send(embed=initial_embed, view=view, silent=SILENT_MESSAGES)
     view.message = message
+    view.hydrate_current_page()
 
 
 @bot.tree.command(name="clearqueue", description="Clear the current queue")
@@ -3245,9 +5868,7 @@ async def play_next(interaction: discord.Interaction, query: str = None):
 
     # FIX: Check if the query is a YouTube link at the beginning
     if query:
-        youtube_regex = re.compile(r"^(https?://)?((www|m)\.)?(youtube\.com|youtu\.be)/.+$")
-        ytmusic_regex = re.compile(r"^(https?://)?(music\.youtube\.com)/.+$")
-        if IS_PUBLIC_VERSION and (youtube_regex.match(query) or ytmusic_regex.match(query)):
+        if IS_PUBLIC_VERSION and classify(query).platform in YOUTUBE_PLATFORMS:
             await show_youtube_blocked_message()
             return
 
@@ -3262,16 +5883,13 @@ async def play_next(interaction: discord.Interaction, query: str = None):
         try:
             search_term = query
 
-            spotify_regex = re.compile(r"^(https?://)?(open\.spotify\.com)/.+$")
-            deezer_regex = re.compile(r"^(https?://)?((www\.)?deezer\.com/(?:[a-z]{2}/)?(track|playlist|album|artist)/.+|(link\.deezer\.com)/s/.+)$")
+            query_platform = classify(query).platform
 
-            is_platform_link = spotify_regex.match(query) or deezer_regex.match(query)
-
-            if is_platform_link:
+            if query_platform in ("spotify", "deezer"):
                 tracks = None
-                if spotify_regex.match(query):
+                if query_platform == "spotify":
                     tracks = await process_spotify_url(query, interaction)
-                elif deezer_regex.match(query):
+                elif query_platform == "deezer":
                     tracks = await process_deezer_url(query, interaction)
 
                 if tracks:
@@ -3282,17 +5900,14 @@ async def play_next(interaction: discord.Interaction, query: str = None):
                     track_name, artist_name = tracks[0]
                     search_term = f"{track_name} {artist_name}"
 
-            soundcloud_regex = re.compile(r"^(https?://)?(www\.)?(soundcloud\.com)/.+$")
-            direct_link_regex = re.compile(r"^(https?://).+\.(mp3|wav|ogg|m4a|mp4|webm|flac)(\?.+)?$", re.IGNORECASE)
-
             search_query = search_term
-            # FIX: Check against youtube_regex again in case it came from a platform conversion
-            if not (youtube_regex.match(search_term) or soundcloud_regex.match(search_term) or direct_link_regex.match(search_term)):
+            # A converted Spotify/Deezer track is a "title artist" search term, never a direct link
+            if not is_direct(search_term):
                 logger.info(f"[/playnext] Processing as keyword search: {search_term}")
                 search_prefix = "scsearch:" if IS_PUBLIC_VERSION else "ytsearch:"
                 search_query = f"{search_prefix}{sanitize_query(search_term)}"
 
-            info = await fetch_video_info_with_retry(search_query, ydl_opts_override={"noplaylist": True})
+            info = await fetch_video_info_with_retry(search_query, ydl_opts_override={"noplaylist": True}, profile="playback" if search_query == search_term else "search")
 
             if "entries" in info and info.get("entries"):
                 info = info["entries"][0]
@@ -3417,6 +6032,7 @@ async def resume(interaction: discord.Interaction):
             music_player.playback_started_at = time.time()
 
         voice_client.resume()
+        state.seek_panels.wake()
         embed = Embed(description=get_messages("resume"), color=discord.Color.green())
         # Use followup.send because we deferred
         await interaction.followup.send(silent=SILENT_MESSAGES, embed=embed)
@@ -3430,12 +6046,10 @@ async def resume(interaction: discord.Interaction):
 async def skip_autocomplete(interaction: discord.Interaction, current: str) -> list[app_commands.Choice[int]]:
     """Provides autocomplete for the /skip command, showing song titles for track numbers."""
     guild_id = interaction.guild_id
-    state = get_guild_state(guild_id)
-    music_player = state.music_player
     choices = []
 
-    # Get a snapshot of the queue to work with
-    tracks = list(music_player.queue._queue)
+    # Get a snapshot of what plays next (the queue, then the 24/7 rotation)
+    tracks = get_upcoming_tracks(guild_id)
 
     # We only show up to 25 choices, which is Discord's limit
     for i, track in enumerate(tracks[:25]):
@@ -3486,30 +6100,16 @@ async def skip(interaction: discord.Interaction, number: Optional[app_commands.R
     # --- NEW LOGIC: JUMP TO A SPECIFIC SONG NUMBER ---
     if number is not None:
         async with music_player.queue_lock:
-            queue_size = music_player.queue.qsize()
+            # Queued tracks first, then (24/7 normal mode) the rotation: numbered like /queue.
+            queue_size = len(get_upcoming_tracks(guild_id))
             if not (1 <= number <= queue_size):
                 await interaction.followup.send(get_messages("player.skip.error.invalid_number", queue_size=queue_size), ephemeral=True, silent=SILENT_MESSAGES)
                 return
 
-            # Convert to 0-based index
-            index_to_jump_to = number - 1
-
-            queue_list = list(music_player.queue._queue)
-
-            # Add the tracks that are being skipped to the history
-            tracks_to_skip = queue_list[:index_to_jump_to]
-            music_player.history.extend(tracks_to_skip)
-
-            # The target song and the rest of the queue
-            new_queue_list = queue_list[index_to_jump_to:]
+            # Convert to 0-based index; the skipped tracks go to the history
+            target_track = jump_to_upcoming(guild_id, number - 1)
 
-            # Rebuild the queue
-            new_queue = asyncio.Queue()
-            for item in new_queue_list:
-                await new_queue.put(item)
-            music_player.queue = new_queue
-
-        jumped_to_track_info = get_track_display_info(new_queue_list[0])
+        jumped_to_track_info = get_track_display_info(target_track)
         title_to_announce = jumped_to_track_info.get("title", get_messages("player.a_song_fallback"))
 
         embed = Embed(description=get_messages("player.skip.success.jumped", number=number, title=title_to_announce), color=discord.Color.green())
@@ -3533,8 +6133,8 @@ async def skip(interaction: discord.Interaction, number: Optional[app_commands.R
         await safe_stop(voice_client)
         return
 
-    # Announcing the next song in queue
-    queue_snapshot = list(music_player.queue._queue)
+    # Announcing the next song in queue (or in the 24/7 rotation)
+    queue_snapshot = get_upcoming_tracks(guild_id)
     next_song_info = queue_snapshot[0] if queue_snapshot else None
 
     embed = None
@@ -3603,12 +6203,8 @@ async def stop(interaction: discord.Interaction):
         vc = music_player.voice_client
 
         # 1. We kill the FFMPEG process directly and forcefully, if it exists.
-        if vc.is_playing() and isinstance(vc.source, discord.PCMAudio) and hasattr(vc.source, "process"):
-            try:
-                vc.source.process.kill()
-                logger.info(f"[{guild_id}] Manually killed FFMPEG process via /stop command.")
-            except Exception as e:
-                logger.error(f"[{guild_id}] Error killing FFMPEG process on /stop: {e}")
+        if vc.is_playing():
+            ffmpeg_supervisor.kill_guild(guild_id, reason="/stop command")
 
         # 2. We still call .stop() to clean up discord.py's internal state.
         if vc.is_playing():
@@ -3646,16 +6242,13 @@ async def shuffle(interaction: discord.Interaction):
     state = get_guild_state(guild_id)
     music_player = state.music_player
 
-    if not music_player.queue.empty():
-        items = []
-        while not music_player.queue.empty():
-            items.append(await music_player.queue.get())
-
+    if get_upcoming_tracks(guild_id):
+        items = list(music_player.queue._queue)
         random.shuffle(items)
-
-        music_player.queue = asyncio.Queue()
-        for item in items:
-            await music_player.queue.put(item)
+        replace_queue(music_player, items)
+        # In 24/7 normal mode the rotation is shuffled too.
+        if is_radio_rotation(guild_id):
+            music_player.radio_playlist.shuffle()
 
         embed = Embed(description=get_messages("shuffle_success"), color=discord.Color.green())
         await interaction.response.send_message(silent=SILENT_MESSAGES, embed=embed)
@@ -3678,6 +6271,7 @@ async def toggle_autoplay(interaction: discord.Interaction):
     music_player = state.music_player
 
     music_player.autoplay_enabled = not music_player.autoplay_enabled
+    autoplay_engine.toggled(interaction.guild_id)
     state = get_messages("autoplay_state_enabled") if music_player.autoplay_enabled else get_messages("autoplay_state_disabled")
 
     embed = Embed(description=get_messages("autoplay_toggle", state=state), color=discord.Color.blue())
@@ -3701,38 +6295,43 @@ async def status(interaction: discord.Interaction):
     await interaction.response.defer(ephemeral=True)
 
     # --- BOT & DISCORD METRICS ---
-    bot_process = psutil.Process()
     latency = round(bot.latency * 1000)
-    server_count = len(bot.guilds)
-    user_count = sum(guild.member_count for guild in bot.guilds)
     current_time = time.time()
     uptime_seconds = int(round(current_time - bot.start_time))
     uptime_string = str(datetime.timedelta(seconds=uptime_seconds))
 
-    # --- MUSIC & PLAYER METRICS ---
-    active_players = len(guild_states)
-    total_queued_songs = sum(s.music_player.queue.qsize() for s in guild_states.values())
-    ffmpeg_processes = 0
+    # --- SHARD AGGREGATION (all bot processes sharing the database) ---
+    local_stats = collect_local_stats()
     try:
-        children = bot_process.children(recursive=True)
-        for child in children:
-            if "ffmpeg" in child.name().lower():
-                ffmpeg_processes += 1
-    except psutil.Error:
-        ffmpeg_processes = get_messages("status.not_applicable")
+        all_stats = await asyncio.to_thread(read_all_shard_stats, local_stats)
+    except sqlite3.Error as e:
+        logger.error(f"Could not read shard stats: {e}")
+        all_stats = [local_stats]
+    all_shards = {}
+    for process_stats in all_stats:
+        all_shards.update(process_stats["shards"])
+
+    server_count = sum(shard["servers"] for shard in all_shards.values())
+    user_count = sum(shard["users"] for shard in all_shards.values())
+
+    # --- MUSIC & PLAYER METRICS ---
+    active_players = sum(shard["active_players"] for shard in all_shards.values())
+    total_queued_songs = sum(shard["queued_songs"] for shard in all_shards.values())
+    ffmpeg_processes = sum(process_stats["ffmpeg_processes"] for process_stats in all_stats)
+
+    spawn_times = ffmpeg_spawn_times.labels()
 
     # --- HOST SYSTEM METRICS ---
-    cpu_freq = psutil.cpu_freq()
-    cpu_load = psutil.cpu_percent(interval=0.1)
-    ram_info = psutil.virtual_memory()
-    ram_total = format_bytes(ram_info.total)
-    ram_used = format_bytes(ram_info.used)
-    ram_percent = ram_info.percent
-    bot_ram_usage = format_bytes(bot_process.memory_info().rss)
-    disk_info = psutil.disk_usage("/")
-    disk_total = format_bytes(disk_info.total)
-    disk_used = format_bytes(disk_info.used)
-    disk_percent = disk_info.percent
+    # Sampled in the background by metrics_monitor: /status never calls psutil on the loop.
+    cpu_load = host_cpu_percent.labels().value
+    cpu_freq_current = host_cpu_frequency.labels().value
+    ram_total = format_bytes(host_memory_total.labels().value)
+    ram_used = format_bytes(host_memory_used.labels().value)
+    ram_percent = host_memory_percent.labels().value
+    bot_ram_usage = format_bytes(process_rss.labels().value)
+    disk_total = format_bytes(host_disk_total.labels().value)
+    disk_used = format_bytes(host_disk_used.labels().value)
+    disk_percent = host_disk_percent.labels().value
 
     # --- ENVIRONMENT & LIBRARIES ---
     python_version = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
@@ -3768,7 +6367,7 @@ async def status(interaction: discord.Interaction):
             "status.host.value",
             os_info=os_info,
             cpu_load=cpu_load,
-            cpu_freq_current=cpu_freq.current,
+            cpu_freq_current=cpu_freq_current,
             ram_used=ram_used,
             ram_total=ram_total,
             ram_percent=ram_percent,
@@ -3785,6 +6384,98 @@ async def status(interaction: discord.Interaction):
         inline=True,
     )
 
+    shard_lines = [
+        get_messages(
+            "status.shards.line",
+            shard_id=shard_id,
+            latency=shard["latency_ms"] if shard["latency_ms"] is not None else get_messages("status.not_applicable"),
+            servers=shard["servers"],
+            active_players=shard["active_players"],
+        )
+        for shard_id, shard in sorted(all_shards.items(), key=lambda item: int(item[0]))
+    ]
+    embed.add_field(name=get_messages("status.shards.title"), value="\n".join(shard_lines)[:1024] or get_messages("status.not_applicable"), inline=False)
+
+    embed.add_field(
+        name=get_messages("status.ffmpeg.title"),
+        value=get_messages(
+            "status.ffmpeg.value",
+            active=ffmpeg_active.labels().value,
+            limit=ffmpeg_supervisor.max_processes or "∞",
+            waiting=ffmpeg_waiting.labels().value,
+            spawned_total=int(sum(counter.value for counter in list(ffmpeg_spawns.children.values()))),
+            reaped_total=ffmpeg_reaps.labels().value,
+            spawn_latency_avg_ms=round(spawn_times.total / spawn_times.count * 1000, 1) if spawn_times.count else 0.0,
+            spawn_latency_max_ms=round(spawn_times.max * 1000, 1),
+            cpu_seconds=round(ffmpeg_cpu_seconds.labels().value, 2),
+            rss=format_bytes(ffmpeg_rss.labels().value),
+        ),
+        inline=False,
+    )
+
+    voice_lines = [
+        get_messages("status.voice.line", kind=kind.capitalize(), count=histogram.count, p50=histogram.percentile(0.5), p95=histogram.percentile(0.95), max=histogram.max)
+        for (kind,), histogram in list(voice_connection_times.children.items())
+        if histogram.count
+    ]
+    embed.add_field(name=get_messages("status.voice.title"), value="\n".join(voice_lines) or get_messages("status.voice.none"), inline=False)
+
+    play_lines = [
+        get_messages("status.play.line", phase=phase, p50=histogram.percentile(0.5), p95=histogram.percentile(0.95), count=histogram.count)
+        for (phase,), histogram in sorted(play_phase_times.children.items(), key=lambda item: item[1].total / item[1].count)
+    ]
+    if play_lines:
+        embed.add_field(name=get_messages("status.play.title"), value="\n".join(play_lines), inline=False)
+
+    embed.add_field(name=get_messages("status.cookies.title"), value=cookie_health.summary()[:1024], inline=False)
+
+    def p95(histogram) -> str:
+        value = histogram.percentile(0.95)
+        return get_messages("status.not_applicable") if value is None else f"≤ {value * 1000:g} ms"
+
+    cache_counts = {labels: counter.value for labels, counter in list(cache_requests.children.items())}
+    cache_hits = sum(value for (cache, result), value in cache_counts.items() if result == "hit")
+    cache_lookups = sum(cache_counts.values())
+    extraction_lines = [
+        get_messages("status.metrics.extraction_line", profile=profile, p50=histogram.percentile(0.5), p95=histogram.percentile(0.95), count=histogram.count)
+        for (profile,), histogram in sorted(extraction_times.children.items())
+        if histogram.count
+    ]
+    embed.add_field(
+        name=get_messages("status.metrics.title"),
+        value=get_messages(
+            "status.metrics.value",
+            loop_lag_p95=p95(loop_lag.labels()),
+            loop_lag_max=round(loop_lag.labels().max * 1000),
+            track_switch_p95=p95(track_switch_gaps.labels()),
+            pool_wait_p95=p95(pool_queue_waits.labels()),
+            cache_hit_ratio=round(cache_hits / cache_lookups * 100, 1) if cache_lookups else 0.0,
+            cache_lookups=int(cache_lookups),
+            controller_updates=int(sum(counter.value for counter in list(controller_updates.children.values()))),
+            voice_reconnects=int(sum(counter.value for counter in list(voice_reconnects.children.values()))),
+        )
+        + ("\n" + "\n".join(extraction_lines) if extraction_lines else ""),
+        inline=False,
+    )
+
+    if AUDIO_CACHE_ENABLED:
+        cache_stats = audio_cache.stats()
+        embed.add_field(
+            name=get_messages("status.audio_cache.title"),
+            value=get_messages(
+                "status.audio_cache.value",
+                entries=cache_stats["entries"],
+                used=format_bytes(cache_stats["bytes"]),
+                limit=format_bytes(cache_stats["max_bytes"]),
+                hit_ratio=cache_stats["hit_ratio"],
+                hits=cache_stats["hits"],
+                lookups=cache_stats["lookups"],
+                recordings_started=cache_stats["recordings_started"],
+                bytes_saved=format_bytes(cache_stats["bytes_saved"]),
+            ),
+            inline=False,
+        )
+
     embed.set_footer(text=get_messages("status.footer", user_display_name=interaction.user.display_name))
     embed.timestamp = datetime.datetime.now(datetime.timezone.utc)
 
@@ -3844,6 +6535,12 @@ async def radio_24_7(interaction: discord.Interaction, mode: str):
 
         queue_snapshot = list(music_player.queue._queue)
         music_player.radio_playlist.extend(queue_snapshot)
+        music_player.radio_playlist.sync_to(music_player.current_info)
+        if mode == "normal":
+            # The rotation now owns these tracks: it plays them from its cursor, the queue
+            # only holds what users add from now on.
+            while not music_player.queue.empty():
+                music_player.queue.get_nowait()
 
     if not music_player.radio_playlist and mode == "normal":
         await interaction.followup.send(get_messages("24_7.error.empty_queue_normal"), silent=SILENT_MESSAGES, ephemeral=True)
@@ -3900,34 +6597,31 @@ async def reconnect(interaction: discord.Interaction):
         await interaction.response.defer()
 
     current_voice_channel = voice_client.channel
-    current_timestamp = 0
-
-    # We use music_player.start_time directly if playback_started_at is None (i.e., paused)
-    if music_player.playback_started_at:
-        real_elapsed_time = time.time() - music_player.playback_started_at
-        current_timestamp = music_player.start_time + (real_elapsed_time * music_player.playback_speed)
-    else:
-        current_timestamp = music_player.start_time  # The player was paused, use the stored time
+    current_timestamp = music_player.get_position()
 
     logger.info(f"[{guild_id}] Reconnect: Storing timestamp at {current_timestamp:.2f}s.")
 
     try:
         music_player.is_reconnecting = True
+        reconnect_started = time.perf_counter()
 
         if voice_client.is_playing():
             await safe_stop(voice_client)
 
         await voice_client.disconnect(force=True)
-        await asyncio.sleep(0.75)  # A small delay to ensure clean disconnection
+        # Wait for Discord to confirm the disconnection
+        await wait_for_own_voice_state(interaction.guild, lambda voice: voice is None, timeout=3)
 
         # Reconnect to the same channel
         new_vc = await current_voice_channel.connect()
         music_player.voice_client = new_vc
+        voice_connection_times.labels("reconnect").observe(time.perf_counter() - reconnect_started)
+        voice_reconnects.labels("command").inc()
 
         if isinstance(current_voice_channel, discord.StageChannel):
             logger.info(f"[{guild_id}] Reconnected to a Stage Channel. Promoting to speaker.")
             try:
-                await asyncio.sleep(0.5)
+                await wait_for_own_voice_state(interaction.guild, lambda voice: voice is not None and voice.channel == current_voice_channel, timeout=3)
                 await interaction.guild.me.edit(suppress=False)
             except Exception as e:
                 logger.error(f"[{guild_id}] Failed to promote to speaker after reconnect: {e}")
@@ -3987,24 +6681,23 @@ async def remove(interaction: discord.Interaction):
         return
 
     guild_id = interaction.guild_id
-    state = get_guild_state(guild_id)
-    state = get_guild_state(guild_id)
-    music_player = state.music_player
 
-    if music_player.queue.empty():
+    # The queue, then (24/7 normal mode) the rotation: numbered like /queue.
+    all_tracks = get_upcoming_tracks(guild_id)
+    if not all_tracks:
         embed = Embed(description=get_messages("queue_empty"), color=discord.Color.red())
         await interaction.response.send_message(embed=embed, ephemeral=True, silent=SILENT_MESSAGES)
         return
 
     await interaction.response.defer()
 
-    all_tracks = list(music_player.queue._queue)
     view = RemoveView(interaction, all_tracks)
     await view.update_view()
 
     embed = Embed(title=get_messages("remove_title"), description=get_messages("remove_description"), color=discord.Color.blue())
 
-    await interaction.followup.send(embed=embed, view=view, silent=SILENT_MESSAGES)
+    view.message = await interaction.followup.send(embed=embed, view=view, silent=SILENT_MESSAGES)
+    view.hydrate_current_page()
 
 
 # --- START OF NEW CODE BLOCK ---
@@ -4032,7 +6725,7 @@ async def search(interaction: discord.Interaction, query: str):
         search_prefix = "scsearch5:" if IS_PUBLIC_VERSION else "ytsearch5:"
         search_query = f"{search_prefix}{sanitized_query}"
 
-        info = await fetch_video_info_with_retry(search_query, ydl_opts_override={"extract_flat": True, "noplaylist": True})
+        info = await fetch_video_info_with_retry(search_query, ydl_opts_override={"extract_flat": True, "noplaylist": True}, profile="flat")
 
         search_results = info.get("entries", [])
 
@@ -4081,7 +6774,7 @@ async def seek_interactive(interaction: discord.Interaction):
     # Update the view with the message and start the background task
     view.message = await interaction.original_response()
     await view.update_embed()  # First manual update
-    await view.start_update_task()
+    view.start_update_task()
 
 
 @bot.tree.command(name="volume", description="Adjusts the music volume for everyone (0-200%).")
@@ -4104,7 +6797,7 @@ async def volume(interaction: discord.Interaction, level: app_commands.Range[int
     new_volume = level / 100.0
     music_player.volume = new_volume
 
-    if vc and vc.is_playing() and isinstance(vc.source, discord.PCMVolumeTransformer):
+    if vc and vc.is_playing() and isinstance(vc.source, VolumeSource):
         vc.source.volume = new_volume
 
     embed = Embed(description=get_messages("volume_success", level=level), color=discord.Color.blue())
@@ -4254,24 +6947,23 @@ async def jumpto(interaction: discord.Interaction):
         return
 
     guild_id = interaction.guild_id
-    state = get_guild_state(guild_id)
-    state = get_guild_state(guild_id)
-    music_player = state.music_player
 
-    if music_player.queue.empty():
+    # The queue, then (24/7 normal mode) the rotation: numbered like /queue.
+    all_tracks = get_upcoming_tracks(guild_id)
+    if not all_tracks:
         embed = Embed(description=get_messages("queue_empty"), color=discord.Color.red())
         await interaction.response.send_message(embed=embed, ephemeral=True, silent=SILENT_MESSAGES)
         return
 
     await interaction.response.defer()
 
-    all_tracks = list(music_player.queue._queue)
     view = JumpToView(interaction, all_tracks)
     await view.update_view()
 
     embed = Embed(title=get_messages("jumpto.title"), description=get_messages("jumpto.description"), color=discord.Color.blue())
 
-    await interaction.followup.send(embed=embed, view=view, silent=SILENT_MESSAGES)
+    view.message = await interaction.followup.send(embed=embed, view=view, silent=SILENT_MESSAGES)
+    view.hydrate_current_page()
 
 
 # ==============================================================================
@@ -4295,7 +6987,11 @@ async def on_message(message: discord.Message):
 
     # This event no longer handles controller re-anchoring.
     # That logic is now in `play_audio` to trigger only on song changes.
-    pass
+
+    # Seek panels pushed out of view by newer messages stop refreshing.
+    state = guild_states.get(guild_id)
+    if state and state.seek_panels.panels:
+        state.seek_panels.note_channel_message(message.channel.id)
 
 
 @bot.event
@@ -4353,18 +7049,11 @@ async def on_voice_state_update(member, before, after):
             # If music is playing, we STOP it. This is the crucial change.
             if vc.is_playing() and not music_player.is_playing_silence:
                 music_player.is_paused_by_leave = True
-                if music_player.playback_started_at:
-                    elapsed = time.time() - music_player.playback_started_at
-                    music_player.start_time += elapsed * music_player.playback_speed
-                    music_player.playback_started_at = None
+                music_player.start_time = music_player.get_position()
+                music_player.playback_started_at = None
 
                 # We no longer rely on the after_playing callback for this.
-                if isinstance(vc.source, discord.PCMAudio) and hasattr(vc.source, "process"):
-                    try:
-                        vc.source.process.kill()
-                        logger.info(f"[{guild_id}] Manually killed FFMPEG process for music due to empty channel.")
-                    except Exception as e:
-                        logger.error(f"[{guild_id}] Error killing FFMPEG process on leave: {e}")
+                ffmpeg_supervisor.kill_guild(guild_id, reason="empty channel")
 
                 # We still call stop() to clean up discord.py's internal state.
                 vc.stop()
@@ -4482,6 +7171,9 @@ async def on_ready():
                     await asyncio.sleep(30)
 
         bot.loop.create_task(rotate_presence())
+        start_shard_stats_loop()
+        start_metrics_monitor()
+        ffmpeg_supervisor.start()
 
         await load_states_on_startup()
 
@@ -4495,5 +7187,7 @@ async def on_ready():
 
 if __name__ == "__main__":
     init_db()
+    if METRICS_PORT:
+        start_metrics_server(METRICS_HOST, METRICS_PORT)
     bot.start_time = time.time()
     bot.run(os.getenv("DISCORD_TOKEN"))
@@ -0,0 +1,74 @@
+"""
+Runs Playify as several processes, each owning a contiguous range of shards.
+
+    SHARD_COUNT=8 PLAYIFY_PROCESSES=4 python shard_launcher.py
+
+Every child runs playify.py with SHARD_COUNT and its own SHARD_IDS. All children share
+playify_state.db; each one only loads and saves the guilds of its shards, and /status on
+any of them aggregates the stats published by all of them. A child that exits is restarted.
+With METRICS_PORT set, child N serves its metrics on METRICS_PORT + N.
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+from dotenv import load_dotenv
+
+RESTART_DELAY = 5  # Seconds to wait before restarting a crashed shard process
+
+load_dotenv()
+
+
+def split_shards(shard_count: int, process_count: int) -> list:
+    """Distributes shard ids 0..shard_count-1 over process_count contiguous ranges."""
+    base, extra = divmod(shard_count, process_count)
+    ranges, start = [], 0
+    for index in range(process_count):
+        size = base + (1 if index < extra else 0)
+        ranges.append(list(range(start, start + size)))
+        start += size
+    return [shard_range for shard_range in ranges if shard_range]
+
+
+def spawn(shard_count: int, shard_ids: list, process_index: int) -> subprocess.Popen:
+    env = dict(os.environ, SHARD_COUNT=str(shard_count), SHARD_IDS=",".join(map(str, shard_ids)))
+    if os.getenv("METRICS_PORT"):
+        # One metrics endpoint per process
+        env["METRICS_PORT"] = str(int(os.environ["METRICS_PORT"]) + process_index)
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "playify.py")
+    print(f"Starting shard process for shards {shard_ids[0]}-{shard_ids[-1]} of {shard_count}.")
+    return subprocess.Popen([sys.executable, script], env=env)
+
+
+def main():
+    process_count = int(os.getenv("PLAYIFY_PROCESSES", "1"))
+    shard_count = int(os.getenv("SHARD_COUNT") or process_count)
+    if process_count > shard_count:
+        sys.exit("PLAYIFY_PROCESSES cannot be greater than SHARD_COUNT.")
+
+    shard_ranges = split_shards(shard_count, process_count)
+    children = {tuple(shard_ids): spawn(shard_count, shard_ids, index) for index, shard_ids in enumerate(shard_ranges)}
+    try:
+        while True:
+            time.sleep(1)
+            for shard_ids, process in list(children.items()):
+                if process.poll() is not None:
+                    print(f"Shard process for shards {shard_ids[0]}-{shard_ids[-1]} exited with code {process.returncode}, restarting.")
+                    time.sleep(RESTART_DELAY)
+                    children[shard_ids] = spawn(shard_count, list(shard_ids), shard_ranges.index(list(shard_ids)))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for process in children.values():
+            process.terminate()
+        for process in children.values():
+            try:
+                process.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+
+if __name__ == "__main__":
+    main()
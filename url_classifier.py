@@ -0,0 +1,175 @@
+"""
+URL classification shared by /play, /playnext, the controller, autoplay and the caches.
+
+classify(url) returns a UrlInfo(platform, kind, media_id):
+  - platform: "youtube", "youtube_music", "soundcloud", "bandcamp", "twitch", "spotify",
+    "deezer", "direct" (audio/video file link), "web" (any other http(s) URL),
+    or None when the text isn't a URL (i.e. a search query).
+  - kind: "track", "playlist", "album", "artist", "channel", "live", "video", "clip",
+    "station", "share", "file" or "unknown".
+  - media_id: canonical id of a single piece of media, or None. The same media reached through
+    different URL variants (youtu.be, music.youtube.com, &list=..., tracking parameters, case)
+    always gets the same id:
+      youtube:<video id>, soundcloud:<user>/<track>, bandcamp:<artist>/<track>,
+      twitch:live:<channel>, twitch:video:<id>, twitch:clip:<slug>,
+      spotify:track:<id>, deezer:track:<id>.
+
+Every pattern is compiled once and results are memoized, so call sites can classify freely.
+"""
+
+import re
+from functools import lru_cache
+from typing import NamedTuple
+from urllib.parse import parse_qs
+
+
+class UrlInfo(NamedTuple):
+    platform: str | None
+    kind: str
+    media_id: str | None
+
+
+NOT_A_URL = UrlInfo(None, "unknown", None)
+
+# Platforms whose links yt-dlp extracts directly.
+DIRECT_PLATFORMS = frozenset({"youtube", "youtube_music", "soundcloud", "bandcamp", "twitch", "direct"})
+# Platforms whose links must first be converted to searches (Spotify, Deezer).
+CONVERSION_PLATFORMS = frozenset({"spotify", "deezer"})
+YOUTUBE_PLATFORMS = frozenset({"youtube", "youtube_music"})
+# Platforms that can seed autoplay (YouTube mixes, SoundCloud stations).
+AUTOPLAY_SEED_PLATFORMS = frozenset({"youtube", "youtube_music", "soundcloud"})
+
+_URL_RE = re.compile(r"^(?P<scheme>https?://)?(?P<host>[^/?#\s]+)(?P<path>/[^?#\s]*)?(?:\?(?P<query>[^#\s]*))?(?:#\S*)?$", re.IGNORECASE)
+_DIRECT_FILE_RE = re.compile(r"\.(mp3|wav|ogg|m4a|mp4|webm|flac)$", re.IGNORECASE)
+_YOUTUBE_ID_RE = re.compile(r"^[A-Za-z0-9_-]{11}$")
+_YOUTUBE_PATH_ID_RE = re.compile(r"^/(?:shorts|live|embed|v)/([A-Za-z0-9_-]{11})")
+_SPOTIFY_PATH_RE = re.compile(r"^/(?:intl-[a-z]{2}(?:-[a-z]{2})?/)?(track|album|playlist|artist|episode|show)/([A-Za-z0-9]+)")
+_DEEZER_PATH_RE = re.compile(r"^/(?:[a-z]{2}/)?(track|album|playlist|artist)/(\d+)")
+
+_YOUTUBE_HOSTS = {"youtube.com": "youtube", "music.youtube.com": "youtube_music", "youtube-nocookie.com": "youtube", "youtu.be": "youtube"}
+_HOST_PREFIXES = ("www.", "m.")
+_SOUNDCLOUD_USER_PAGES = frozenset({"tracks", "albums", "sets", "reposts", "likes", "popular-tracks", "followers", "following", "comments"})
+
+
+def _normalize_host(host: str) -> str:
+    host = host.lower().split(":")[0]
+    for prefix in _HOST_PREFIXES:
+        if host.startswith(prefix):
+            return host[len(prefix) :]
+    return host
+
+
+def _classify_youtube(platform: str, host: str, path: str, query: str) -> UrlInfo:
+    if host == "youtu.be":
+        video_id = path[1:12]
+        return UrlInfo(platform, "track", f"youtube:{video_id}") if _YOUTUBE_ID_RE.match(video_id) else UrlInfo(platform, "unknown", None)
+    if path == "/watch":
+        video_id = parse_qs(query).get("v", [None])[0]
+        if video_id and _YOUTUBE_ID_RE.match(video_id):
+            return UrlInfo(platform, "track", f"youtube:{video_id}")
+        return UrlInfo(platform, "unknown", None)
+    match = _YOUTUBE_PATH_ID_RE.match(path)
+    if match:
+        return UrlInfo(platform, "track", f"youtube:{match.group(1)}")
+    if path == "/playlist":
+        return UrlInfo(platform, "playlist", None)
+    if path.startswith(("/@", "/channel/", "/c/", "/user/")):
+        return UrlInfo(platform, "channel", None)
+    return UrlInfo(platform, "unknown", None)
+
+
+def _classify_soundcloud(host: str, path: str) -> UrlInfo:
+    if host == "on.soundcloud.com":
+        return UrlInfo("soundcloud", "share", None)
+    # SoundCloud permalinks are case-insensitive
+    parts = [part for part in path.lower().split("/") if part]
+    if parts and parts[0] == "discover":
+        return UrlInfo("soundcloud", "station", None)
+    if len(parts) <= 1:
+        return UrlInfo("soundcloud", "artist" if parts else "unknown", None)
+    if len(parts) >= 3 and parts[1] == "sets":
+        return UrlInfo("soundcloud", "playlist", None)
+    if parts[1] in _SOUNDCLOUD_USER_PAGES:
+        return UrlInfo("soundcloud", "artist", None)
+    # A third part is the secret token of a private track: same media
+    return UrlInfo("soundcloud", "track", f"soundcloud:{parts[0]}/{parts[1]}")
+
+
+def _classify_bandcamp(host: str, path: str) -> UrlInfo:
+    parts = [part for part in path.lower().split("/") if part]
+    if len(parts) >= 2 and parts[0] == "track":
+        return UrlInfo("bandcamp", "track", f"bandcamp:{host.removesuffix('.bandcamp.com')}/{parts[1]}")
+    if parts and parts[0] == "album":
+        return UrlInfo("bandcamp", "album", None)
+    return UrlInfo("bandcamp", "artist", None)
+
+
+def _classify_twitch(host: str, path: str) -> UrlInfo:
+    parts = [part for part in path.split("/") if part]
+    if host == "clips.twitch.tv" and parts:
+        return UrlInfo("twitch", "clip", f"twitch:clip:{parts[0]}")
+    if len(parts) >= 3 and parts[1] == "clip":
+        return UrlInfo("twitch", "clip", f"twitch:clip:{parts[2]}")
+    if len(parts) >= 2 and parts[0] == "videos" and parts[1].isdigit():
+        return UrlInfo("twitch", "video", f"twitch:video:{parts[1]}")
+    if len(parts) == 1:
+        # Channel names are case-insensitive
+        return UrlInfo("twitch", "live", f"twitch:live:{parts[0].lower()}")
+    return UrlInfo("twitch", "unknown", None)
+
+
+@lru_cache(maxsize=8192)
+def classify(url: str) -> UrlInfo:
+    """Classifies a URL (or a search query, which yields platform None). Memoized."""
+    if not url:
+        return NOT_A_URL
+    match = _URL_RE.match(url.strip())
+    if not match:
+        return NOT_A_URL
+    host = _normalize_host(match.group("host"))
+    path = match.group("path") or ""
+    query = match.group("query") or ""
+
+    if host in _YOUTUBE_HOSTS:
+        return _classify_youtube(_YOUTUBE_HOSTS[host], host, path, query)
+    if host in ("soundcloud.com", "on.soundcloud.com"):
+        return _classify_soundcloud(host, path)
+    if host.endswith(".bandcamp.com"):
+        return _classify_bandcamp(host, path)
+    if host in ("twitch.tv", "clips.twitch.tv"):
+        return _classify_twitch(host, path)
+    if host == "open.spotify.com":
+        spotify_match = _SPOTIFY_PATH_RE.match(path)
+        if spotify_match:
+            kind, resource_id = spotify_match.groups()
+            return UrlInfo("spotify", kind, f"spotify:{kind}:{resource_id}" if kind == "track" else None)
+        return UrlInfo("spotify", "unknown", None)
+    if host == "link.deezer.com":
+        return UrlInfo("deezer", "share", None)
+    if host == "deezer.com":
+        deezer_match = _DEEZER_PATH_RE.match(path)
+        if deezer_match:
+            kind, resource_id = deezer_match.groups()
+            return UrlInfo("deezer", kind, f"deezer:{kind}:{resource_id}" if kind == "track" else None)
+
+    # Anything else only counts as a URL with an explicit scheme: "mr.brightside" is a search,
+    # while http://localhost/a.mp3 or a dotless LAN host is a direct link.
+    if not match.group("scheme"):
+        return NOT_A_URL
+    if _DIRECT_FILE_RE.search(path):
+        return UrlInfo("direct", "file", None)
+    return UrlInfo("web", "unknown", None)
+
+
+def is_direct(url: str) -> bool:
+    """True for links yt-dlp extracts natively (no conversion, no search)."""
+    return classify(url).platform in DIRECT_PLATFORMS
+
+
+def needs_conversion(url: str) -> bool:
+    """True for Spotify/Deezer links, which are converted to searches first."""
+    return classify(url).platform in CONVERSION_PLATFORMS
+
+
+def is_youtube(url: str) -> bool:
+    return classify(url).platform in YOUTUBE_PLATFORMS